@@ -1,12 +1,15 @@
 from btb.selection.best import BestKReward, BestKVelocity
-from btb.selection.hierarchical import HierarchicalByAlgorithm
+from btb.selection.hierarchical import HierarchicalByAlgorithm, HierarchicalSelector
+from btb.selection.nonstationary import DiscountedUCB, SlidingWindowUCB
 from btb.selection.pure import PureBestKVelocity
 from btb.selection.recent import RecentKReward, RecentKVelocity
+from btb.selection.thompson import BetaThompsonSampling, GaussianThompsonSampling
 from btb.selection.ucb1 import UCB1
 from btb.selection.uniform import Uniform
 
 __all__ = (
-    'BestKReward', 'BestKVelocity', 'HierarchicalByAlgorithm',
-    'PureBestKVelocity', 'RecentKReward', 'RecentKVelocity',
+    'BestKReward', 'BestKVelocity', 'BetaThompsonSampling', 'DiscountedUCB',
+    'GaussianThompsonSampling', 'HierarchicalByAlgorithm', 'HierarchicalSelector',
+    'PureBestKVelocity', 'RecentKReward', 'RecentKVelocity', 'SlidingWindowUCB',
     'UCB1', 'Uniform',
 )
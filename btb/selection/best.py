@@ -1,3 +1,4 @@
+import heapq
 import logging
 
 import numpy as np
@@ -12,6 +13,53 @@ K_MIN = 2
 logger = logging.getLogger('btb')
 
 
+class BestScores(object):
+    """Best scores of every choice
+
+    Keeps a bounded min-heap with the ``size`` best scores of every choice, together with their
+    sum, their number and the best and worst of them, so updating a choice costs
+    :math:`O(log(size))` and the statistics of all the choices are available as arrays.
+
+    Args:
+        num_choices (int): number of choices.
+        size (int): number of best scores to keep for every choice.
+    """
+
+    def __init__(self, num_choices, size):
+        self.size = size
+        self.heaps = [list() for _ in range(num_choices)]
+        self.sums = np.zeros(num_choices)
+        self.lengths = np.zeros(num_choices, dtype=int)
+        self.lowest = np.zeros(num_choices)
+        self.highest = np.zeros(num_choices)
+
+    def push(self, index, score):
+        """Add a new score of the choice with the given index"""
+        heap = self.heaps[index]
+        if len(heap) < self.size:
+            heapq.heappush(heap, score)
+            self.sums[index] += score
+            self.lengths[index] += 1
+        elif score > heap[0]:
+            self.sums[index] += score - heapq.heapreplace(heap, score)
+        else:
+            return
+
+        self.lowest[index] = heap[0]
+        if self.lengths[index] == 1:
+            self.highest[index] = score
+        else:
+            self.highest[index] = max(self.highest[index], score)
+
+    def clear(self, index):
+        """Forget the scores of the choice with the given index"""
+        self.heaps[index] = list()
+        self.sums[index] = 0
+        self.lengths[index] = 0
+        self.lowest[index] = 0
+        self.highest[index] = 0
+
+
 class BestKReward(UCB1):
     """Best K reward selector
 
@@ -19,6 +67,9 @@ class BestKReward(UCB1):
     implementation, the other scores are replaced with ``nan``s such that they still factor into
     the number of arm pulls.
 
+    When the scores are recorded with ``update``, only the ``k + 1`` best scores of every choice
+    are kept, so selecting does not depend on the number of recorded scores.
+
     Args:
         k (int): number of best scores to consider
     """
@@ -26,23 +77,48 @@ class BestKReward(UCB1):
     def __init__(self, choices, k=K_MIN):
         super(BestKReward, self).__init__(choices)
         self.k = k
+        self._best_scores = BestScores(len(self._indexes), k + 1)
+
+    def update(self, choice, score):
+        super(BestKReward, self).update(choice, score)
+        self._best_scores.push(self._indexes[choice], score)
+
+    def remove(self, choice):
+        super(BestKReward, self).remove(choice)
+        self._best_scores.clear(self._indexes[choice])
 
     def compute_rewards(self, scores):
         """Retain the K best scores, and replace the rest with nans"""
         if len(scores) > self.k:
             scores = np.copy(scores)
-            inds = np.argsort(scores)[:-self.k]
+            inds = np.argpartition(scores, len(scores) - self.k)[:-self.k]
             scores[inds] = np.nan
 
         return list(scores)
 
-    def select(self, choice_scores):
+    def _get_best_k_rewards(self):
+        """Compute the average reward and the number of rewards of every choice
+
+        This is equivalent to applying ``compute_rewards`` to the recorded scores of every
+        choice, but using only their best scores.
+        """
+        best = self._best_scores
+        extra = best.lengths > self.k
+        sums = best.sums - np.where(extra, best.lowest, 0)
+        lengths = best.lengths - extra
+
+        return sums / np.maximum(lengths, 1), self._counts
+
+    def select(self, choice_scores=None):
         """Select a choice using the K best scores
 
         Keeps the choice counts intact, but only let the bandit see the top k learners' scores.
         If there is not enough score history to do K-selection, use the default UCB1 reward
         function.
         """
+        if choice_scores is None:
+            return super(BestKReward, self).select()
+
         min_num_scores = min(len(s) for s in choice_scores.values())
         if min_num_scores >= K_MIN:
             logger.info(
@@ -64,6 +140,23 @@ class BestKReward(UCB1):
 
         return self.bandit(choice_rewards)
 
+    def _get_updated_rewards(self):
+        """Compute the rewards from the best scores recorded with ``update``
+
+        If there is not enough score history to do K-selection, use the default UCB1 rewards.
+        """
+        pulled = self._counts > 0
+        if self._counts[pulled].min() >= K_MIN:
+            logger.info(
+                '{klass}: using Best K bandit selection'
+                .format(klass=type(self).__name__))
+            return self._get_best_k_rewards()
+        else:
+            logger.warning(
+                '{klass}: Not enough choices to do K-selection; using plain UCB1'
+                .format(klass=type(self).__name__))
+            return self._get_rewards()
+
 
 class BestKVelocity(BestKReward):
     """Best K velocity selector"""
@@ -75,7 +168,20 @@ class BestKVelocity(BestKReward):
         """
         k = self.k
         m = max(len(scores) - k, 0)
-        best_scores = sorted(scores)[-k - 1:]
+        best_scores = heapq.nlargest(k + 1, scores)[::-1]
         velocities = np.diff(best_scores)
         nans = np.full(m, np.nan)
         return list(velocities) + list(nans)
+
+    def _get_best_k_rewards(self):
+        """Compute the average velocity and the number of rewards of every choice
+
+        The velocities of the ``k + 1`` best scores add up to the difference between the
+        best and the worst of them.
+        """
+        best = self._best_scores
+        num_velocities = np.maximum(best.lengths - 1, 0)
+        average_rewards = (best.highest - best.lowest) / np.maximum(num_velocities, 1)
+        pulls = num_velocities + np.maximum(self._counts - self.k, 0)
+
+        return average_rewards, pulls
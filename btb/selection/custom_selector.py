@@ -6,6 +6,6 @@ from btb.selection.selector import Selector
 class CustomSelector(Selector):
     """Custom selector"""
 
-    def select(self, choice_scores):
+    def select(self, choice_scores=None):
         """ Select a choice uniformly at random.  """
         return self.choices[random.randint(0, len(self.choices) - 1)]
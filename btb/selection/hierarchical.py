@@ -1,38 +1,231 @@
+import itertools
+
+import numpy as np
+
 from btb.selection.ucb1 import UCB1
 
 
-class HierarchicalByAlgorithm(UCB1):
+class HierarchicalSelector(UCB1):
     """Hierarchical selector
 
+    Organizes the choices in a tree of groups, such as ``family -> algorithm -> variant``, and
+    selects a choice by going down the tree, using the UCB1 criteria to pick one of the
+    children of every group based on the scores of all the choices below it.
+
+    The number of scores and their sum are kept for every group and updated by ``update``
+    along the path of the choice, so recording a score only costs as much as the depth of the
+    tree and selecting only looks at the children of the groups in the selected path.
+
+    Args:
+        choices (list): a list of discrete choices from which the selector must choose.
+        groups (Dict[object, tuple]): mapping of choices to the names of the groups that
+            contain them, from the outermost to the innermost. The choices that are not in it
+            are placed at the top of the tree. If not given, the groups are taken from the
+            choice names split by ``separator``, so ``'trees/RF/default'`` is in the ``RF``
+            group of the ``trees`` group.
+        separator (str): separator of the group names in the choice names. Only used if
+            ``groups`` is not given. Defaults to ``'/'``.
+    """
+
+    def __init__(self, choices, groups=None, separator='/'):
+        super(HierarchicalSelector, self).__init__(choices)
+        if groups is None:
+            groups = {
+                choice: tuple(str(choice).split(separator)[:-1])
+                for choice in self._indexes
+            }
+
+        self.groups = groups
+
+        # the nodes of the tree are the groups followed by the choices, starting with the root
+        group_nodes = {(): 0}
+        children = [list()]
+        parents = list()
+        paths = list()
+        for choice in self._indexes:
+            path = [0]
+            group = ()
+            for name in groups.get(choice, ()):
+                parent = group_nodes[group]
+                group = group + (name, )
+                if group not in group_nodes:
+                    group_nodes[group] = len(children)
+                    children[parent].append(len(children))
+                    children.append(list())
+
+                path.append(group_nodes[group])
+
+            paths.append(path)
+            parents.append(path[-1])
+
+        num_groups = len(children)
+        for index, (path, parent) in enumerate(zip(paths, parents)):
+            children[parent].append(num_groups + index)
+            path.append(num_groups + index)
+
+        self._num_groups = num_groups
+        self._leaves = list(self._indexes)
+        self._children = [np.array(node_children, dtype=int) for node_children in children]
+        self._paths = [np.array(path, dtype=int) for path in paths]
+
+        num_nodes = num_groups + len(self._indexes)
+        self._node_counts = np.zeros(num_nodes, dtype=int)
+        self._node_sums = np.zeros(num_nodes)
+        self._node_num_rewards = np.zeros(num_nodes, dtype=int)
+
+    def update(self, choice, score):
+        super(HierarchicalSelector, self).update(choice, score)
+        path = self._paths[self._indexes[choice]]
+        self._node_counts[path] += 1
+        if not np.isnan(score):
+            self._node_sums[path] += score
+            self._node_num_rewards[path] += 1
+
+    def remove(self, choice):
+        index = self._get_index(choice)
+        path = self._paths[index]
+        self._node_counts[path] -= self._counts[index]
+        self._node_sums[path] -= self._sums[index]
+        self._node_num_rewards[path] -= self._num_rewards[index]
+        super(HierarchicalSelector, self).remove(choice)
+
+    def _aggregate(self, choice_scores):
+        """Compute the statistics of every node of the tree from the given scores
+
+        Returns:
+            tuple: number of scores, sum and number of rewards of every node, and whether
+            every node has any of the given choices below it.
+        """
+        num_nodes = len(self._node_counts)
+        counts = np.zeros(num_nodes, dtype=int)
+        sums = np.zeros(num_nodes)
+        num_rewards = np.zeros(num_nodes, dtype=int)
+        available = np.zeros(num_nodes, dtype=bool)
+        for choice, scores in choice_scores.items():
+            index = self._indexes.get(choice)
+            if index is None:
+                continue
+
+            path = self._paths[index]
+            scores = np.asarray(scores, dtype=float)
+            rewards = scores[~np.isnan(scores)]
+            counts[path] += len(scores)
+            sums[path] += rewards.sum()
+            num_rewards[path] += len(rewards)
+            available[path] = True
+
+        return counts, sums, num_rewards, available
+
+    def _get_node_statistics(self, choice_scores):
+        """Get the statistics of every node of the tree
+
+        If ``choice_scores`` is ``None``, the statistics recorded with ``update`` are used.
+        Otherwise, they are aggregated from the given scores.
+        """
+        if choice_scores is None:
+            if not self._node_counts[0]:
+                raise ValueError('No scores have been recorded with update.')
+
+            counts = self._node_counts
+            return counts, self._node_sums, self._node_num_rewards, counts > 0
+
+        statistics = self._aggregate(choice_scores)
+        if not statistics[-1][0]:
+            raise ValueError('None of the given choices can be selected.')
+
+        return statistics
+
+    def _descend(self, counts, sums, num_rewards, available):
+        """Go down the tree of groups and return the index of the selected choice"""
+        node = 0
+        while node < self._num_groups:
+            children = self._children[node]
+            average_rewards = sums[children] / np.maximum(num_rewards[children], 1)
+            total_pulls = max(1, counts[node])
+            errors = np.sqrt(2.0 * np.log(total_pulls) / np.maximum(counts[children], 1))
+            values = np.where(available[children], average_rewards + errors, -np.inf)
+            node = np.random.choice(children[values == values.max()])
+
+        return node - self._num_groups
+
+    def select(self, choice_scores=None):
+        """Select a choice going down the tree of groups
+
+        If ``choice_scores`` is ``None``, the statistics recorded with ``update`` are used.
+        Otherwise, they are aggregated from the given scores.
+        """
+        statistics = self._get_node_statistics(choice_scores)
+        return self._leaves[self._descend(*statistics)]
+
+    def select_batch(self, choice_scores=None, k=1, pending=None):
+        """Select the next ``k`` choices to make at the same time
+
+        If ``choice_scores`` is ``None``, the pending pulls and the choices selected for the
+        batch are added as virtual pulls to their choices and to all the groups that contain
+        them.
+        """
+        if choice_scores is not None:
+            return super(HierarchicalSelector, self).select_batch(choice_scores, k, pending)
+
+        counts, sums, num_rewards, available = self._get_node_statistics(None)
+        counts = counts.copy()
+        for choice, count in (pending or {}).items():
+            counts[self._paths[self._get_index(choice)]] += count
+
+        choices = list()
+        for _ in range(k):
+            index = self._descend(counts, sums, num_rewards, available)
+            counts[self._paths[index]] += 1
+            choices.append(self._leaves[index])
+
+        return choices
+
+
+class HierarchicalByAlgorithm(HierarchicalSelector):
+    """Hierarchical selector
+
+    ``HierarchicalSelector`` with a single level of groups, one for every algorithm.
+
     Args:
         by_algorithm (Dict[str, List]): mapping of ML algorithms to frozen set choices
     """
 
     def __init__(self, choices, by_algorithm):
-        super(HierarchicalByAlgorithm, self).__init__(choices)
+        groups = {
+            choice: (algorithm, )
+            for algorithm, algorithm_choices in by_algorithm.items()
+            for choice in algorithm_choices
+        }
+        super(HierarchicalByAlgorithm, self).__init__(
+            list(groups) if choices is None else choices, groups)
+
+        self.choices = choices
         self.by_algorithm = by_algorithm
+        self._algorithm_selectors = {
+            algorithm: UCB1(list(algorithm_choices))
+            for algorithm, algorithm_choices in by_algorithm.items()
+        }
 
-    def select(self, choice_scores):
+    def select(self, choice_scores=None):
         """
         Groups the frozen sets by algorithm and first chooses an algorithm based
         on the traditional UCB1 criteria.
 
         Next, from that algorithm's frozen sets, makes the final set choice.
         """
+        if choice_scores is None:
+            return super(HierarchicalByAlgorithm, self).select()
+
         # choose algorithm using a bandit
         alg_scores = {}
         for algorithm, choices in self.by_algorithm.items():
-            # only make arms for algorithms that have options
-            if not set(choices) & set(choice_scores.keys()):
-                continue
-            # sum up lists to get a list of all the scores from any run of this
-            # algorithm
-            sublists = [choice_scores.get(c, []) for c in choices]
-            alg_scores[algorithm] = sum(sublists, [])
+            # only make arms for algorithms that have options, with a list of all
+            # the scores from any run of this algorithm
+            sublists = [choice_scores[choice] for choice in choices if choice in choice_scores]
+            if sublists:
+                alg_scores[algorithm] = list(itertools.chain.from_iterable(sublists))
 
         best_algorithm = self.bandit(alg_scores)
 
         # now use only the frozen sets from the chosen algorithm
-        best_subset = self.by_algorithm[best_algorithm]
-        normal_ucb1 = UCB1(choices=best_subset)
-        return normal_ucb1.select(choice_scores)
+        return self._algorithm_selectors[best_algorithm].select(choice_scores)
@@ -0,0 +1,219 @@
+from collections import deque
+
+import numpy as np
+
+from btb.selection.ucb1 import UCB1
+
+
+def _ucb(average_rewards, pulls, available, exploration):
+    """Compute the UCB index of every choice from possibly fractional numbers of pulls
+
+    The choices that are available but have no pulls get an infinite index, and the ones that
+    are not available get ``-inf``.
+    """
+    total_pulls = max(1, pulls[available].sum())
+    with np.errstate(divide='ignore', invalid='ignore'):
+        errors = exploration * np.sqrt(np.log(total_pulls) / pulls)
+
+    values = np.where(pulls > 0, average_rewards + errors, np.inf)
+    return np.where(available, values, -np.inf)
+
+
+class DiscountedUCB(UCB1):
+    """Discounted UCB selector
+
+    UCB1 for rewards that change over time. Every time a score is recorded, the scores recorded
+    before it are weighted down by ``discount``, so the choices that have not been selected for
+    a while lose the weight of their old scores and get explored again.
+
+    When the scores are given to ``select``, only the order of the scores of each choice is
+    known, so each score is discounted by the number of scores of the same choice after it.
+
+    Args:
+        discount (float): weight that the scores lose every time a new score is recorded,
+            between 0 and 1. Defaults to 0.99.
+        exploration (float): weight of the exploration term of the UCB index,
+            ``exploration * sqrt(log(n) / n_i)``, which is ``sqrt(2)`` in UCB1. The effective
+            number of scores is bounded by the discount, so a lower weight is needed to avoid
+            exploring the worst choices all the time. Defaults to 0.5.
+
+    See also::
+
+       Garivier, Aurelien and Eric Moulines. "On Upper-Confidence Bound Policies for
+       Switching Bandit Problems." Algorithmic Learning Theory (2011): 174-188.
+    """
+
+    def __init__(self, choices, discount=0.99, exploration=0.5):
+        super(DiscountedUCB, self).__init__(choices)
+        if not 0 < discount <= 1:
+            raise ValueError('discount must be between 0 and 1, got {}'.format(discount))
+
+        self.discount = discount
+        self.exploration = exploration
+        num_choices = len(self._indexes)
+        self._discounted_counts = np.zeros(num_choices)
+        self._discounted_sums = np.zeros(num_choices)
+        self._discounted_num_rewards = np.zeros(num_choices)
+
+    def update(self, choice, score):
+        super(DiscountedUCB, self).update(choice, score)
+        self._discounted_counts *= self.discount
+        self._discounted_sums *= self.discount
+        self._discounted_num_rewards *= self.discount
+
+        index = self._indexes[choice]
+        self._discounted_counts[index] += 1
+        if not np.isnan(score):
+            self._discounted_sums[index] += score
+            self._discounted_num_rewards[index] += 1
+
+    def remove(self, choice):
+        super(DiscountedUCB, self).remove(choice)
+        index = self._indexes[choice]
+        self._discounted_counts[index] = 0
+        self._discounted_sums[index] = 0
+        self._discounted_num_rewards[index] = 0
+
+    def _aggregate(self, choice_scores):
+        num_choices = len(self._indexes)
+        available = np.zeros(num_choices, dtype=bool)
+        counts = np.zeros(num_choices)
+        sums = np.zeros(num_choices)
+        num_rewards = np.zeros(num_choices)
+        for choice, scores in choice_scores.items():
+            index = self._indexes.get(choice)
+            if index is None:
+                continue
+
+            scores = np.asarray(scores, dtype=float)
+            weights = self.discount ** np.arange(len(scores))[::-1]
+            rewarded = ~np.isnan(scores)
+            available[index] = True
+            counts[index] = weights.sum()
+            sums[index] = (weights[rewarded] * scores[rewarded]).sum()
+            num_rewards[index] = weights[rewarded].sum()
+
+        return available, counts, sums, num_rewards
+
+    def _get_updated_rewards(self):
+        average_rewards = np.divide(
+            self._discounted_sums,
+            self._discounted_num_rewards,
+            out=np.zeros_like(self._discounted_sums),
+            where=self._discounted_num_rewards > 0
+        )
+        return average_rewards, self._discounted_counts
+
+    def _ucb1(self, average_rewards, pulls):
+        return _ucb(average_rewards, pulls, self._counts > 0, self.exploration)
+
+    def select(self, choice_scores=None):
+        """Select the choice with the highest discounted UCB index
+
+        If ``choice_scores`` is ``None``, the statistics recorded with ``update`` are used.
+        """
+        if choice_scores is None:
+            return super(DiscountedUCB, self).select()
+
+        available, counts, sums, num_rewards = self._aggregate(choice_scores)
+        average_rewards = np.divide(
+            sums, num_rewards, out=np.zeros_like(sums), where=num_rewards > 0)
+        return self._select_best(_ucb(average_rewards, counts, available, self.exploration))
+
+
+class SlidingWindowUCB(UCB1):
+    """Sliding window UCB selector
+
+    UCB1 for rewards that change over time, which only considers the ``window`` most recent
+    scores. The choices that have no scores within the window are explored again.
+
+    When the scores are given to ``select``, only the order of the scores of each choice is
+    known, so the ``window`` most recent scores of each choice are used.
+
+    Args:
+        window (int): number of most recent scores to consider. Defaults to 100.
+        exploration (float): weight of the exploration term of the UCB index,
+            ``exploration * sqrt(log(n) / n_i)``, which is ``sqrt(2)`` in UCB1. The number of
+            scores is bounded by the window, so a lower weight is needed to avoid exploring
+            the worst choices all the time. Defaults to 0.5.
+
+    See also::
+
+       Garivier, Aurelien and Eric Moulines. "On Upper-Confidence Bound Policies for
+       Switching Bandit Problems." Algorithmic Learning Theory (2011): 174-188.
+    """
+
+    def __init__(self, choices, window=100, exploration=0.5):
+        super(SlidingWindowUCB, self).__init__(choices)
+        if window < 1:
+            raise ValueError('window must be a positive integer, got {}'.format(window))
+
+        self.window = window
+        self.exploration = exploration
+        num_choices = len(self._indexes)
+        self._window = deque()
+        self._window_counts = np.zeros(num_choices, dtype=int)
+        self._window_sums = np.zeros(num_choices)
+        self._window_num_rewards = np.zeros(num_choices, dtype=int)
+
+    def _add(self, index, score, sign):
+        self._window_counts[index] += sign
+        if not np.isnan(score):
+            self._window_sums[index] += sign * score
+            self._window_num_rewards[index] += sign
+
+    def update(self, choice, score):
+        super(SlidingWindowUCB, self).update(choice, score)
+        if len(self._window) == self.window:
+            self._add(*self._window.popleft(), sign=-1)
+
+        index = self._indexes[choice]
+        self._window.append((index, score))
+        self._add(index, score, sign=1)
+
+    def remove(self, choice):
+        super(SlidingWindowUCB, self).remove(choice)
+        index = self._indexes[choice]
+        self._window = deque(item for item in self._window if item[0] != index)
+        self._window_counts[index] = 0
+        self._window_sums[index] = 0
+        self._window_num_rewards[index] = 0
+
+    def _aggregate(self, choice_scores):
+        num_choices = len(self._indexes)
+        available = np.zeros(num_choices, dtype=bool)
+        counts = np.zeros(num_choices, dtype=int)
+        sums = np.zeros(num_choices)
+        num_rewards = np.zeros(num_choices, dtype=int)
+        for choice, scores in choice_scores.items():
+            index = self._indexes.get(choice)
+            if index is None:
+                continue
+
+            scores = np.asarray(scores[-self.window:], dtype=float)
+            rewards = scores[~np.isnan(scores)]
+            available[index] = True
+            counts[index] = len(scores)
+            sums[index] = rewards.sum()
+            num_rewards[index] = len(rewards)
+
+        return available, counts, sums, num_rewards
+
+    def _get_updated_rewards(self):
+        average_rewards = self._window_sums / np.maximum(self._window_num_rewards, 1)
+        return average_rewards, self._window_counts
+
+    def _ucb1(self, average_rewards, pulls):
+        return _ucb(average_rewards, pulls, self._counts > 0, self.exploration)
+
+    def select(self, choice_scores=None):
+        """Select the choice with the highest UCB index within the window
+
+        If ``choice_scores`` is ``None``, the scores recorded with ``update`` are used.
+        """
+        if choice_scores is None:
+            return super(SlidingWindowUCB, self).select()
+
+        available, counts, sums, num_rewards = self._aggregate(choice_scores)
+        average_rewards = sums / np.maximum(num_rewards, 1)
+        return self._select_best(_ucb(average_rewards, counts, available, self.exploration))
@@ -1,5 +1,9 @@
+import heapq
 import logging
 
+import numpy as np
+
+from btb.selection.best import BestScores
 from btb.selection.selector import Selector
 
 # the minimum number of scores that each choice must have in order to use best-K
@@ -14,11 +18,28 @@ class PureBestKVelocity(Selector):
     """Pure Best K Velocity Selector
 
     Simply returns the choice with the best best-K velocity.
+
+    When the scores are recorded with ``update``, only the ``k + 1`` best scores of every choice
+    are kept, so selecting does not depend on the number of recorded scores.
     """
 
     def __init__(self, choices, k=K_MIN):
         super(PureBestKVelocity, self).__init__(choices)
         self.k = k
+        self._counts = np.zeros(len(self._indexes), dtype=int)
+        self._best_scores = BestScores(len(self._indexes), k + 1)
+
+    def update(self, choice, score):
+        super(PureBestKVelocity, self).update(choice, score)
+        index = self._indexes[choice]
+        self._counts[index] += 1
+        self._best_scores.push(index, score)
+
+    def remove(self, choice):
+        super(PureBestKVelocity, self).remove(choice)
+        index = self._indexes[choice]
+        self._counts[index] = 0
+        self._best_scores.clear(index)
 
     def compute_rewards(self, scores):
         """
@@ -27,7 +48,7 @@ class PureBestKVelocity(Selector):
         that the count remains the same.
         """
         # get the k + 1 best scores in descending order
-        best_scores = sorted(scores, reverse=True)[:self.k + 1]
+        best_scores = heapq.nlargest(self.k + 1, scores)
         velocities = [best_scores[i] - best_scores[i + 1]
                       for i in range(len(best_scores) - 1)]
 
@@ -35,11 +56,14 @@ class PureBestKVelocity(Selector):
         zeros = (len(scores) - self.k) * [0]
         return velocities + zeros
 
-    def select(self, choice_scores):
+    def select(self, choice_scores=None):
         """
         Select the choice with the highest best-K velocity. If any choices
         don't have MIN_K scores yet, return the one with the fewest.
         """
+        if choice_scores is None:
+            return self._select_updated()
+
         # if we don't have enough scores to do K-selection, fall back to UCB1
         min_num_scores = min([len(s) for s in choice_scores.values()])
         if min_num_scores >= K_MIN:
@@ -66,3 +90,54 @@ class PureBestKVelocity(Selector):
 
         # the default bandit returns the choice with the highest mean reward
         return self.bandit(choice_rewards)
+
+    def _get_values(self, pending_counts):
+        """Compute the best-K velocity of every choice from the scores recorded with ``update``
+
+        The pending pulls are added to the number of scores of their choices, which lowers
+        their velocity without changing their best scores.
+        """
+        pulled = self._counts > 0
+        counts = self._counts + pending_counts
+        if self._counts[pulled].min() >= K_MIN:
+            logger.info('PureBestKVelocity: using Pure Best K velocity selection')
+            best = self._best_scores
+            num_velocities = np.maximum(best.lengths - 1, 0)
+            pulls = num_velocities + np.maximum(counts - self.k, 0)
+            values = (best.highest - best.lowest) / np.maximum(pulls, 1)
+        else:
+            logger.warning(
+                '{klass}: Not enough choices to do K-selection; '
+                'returning choice with fewest scores'
+                .format(klass=type(self).__name__))
+            values = -counts.astype(float)
+
+        return np.where(pulled, values, -np.inf)
+
+    def _select_updated(self):
+        """Select a choice from the best scores recorded with ``update``"""
+        if not self._counts.any():
+            raise ValueError('No scores have been recorded with update.')
+
+        return self.choices[np.argmax(self._get_values(0))]
+
+    def select_batch(self, choice_scores=None, k=1, pending=None):
+        """Select the next ``k`` choices to make at the same time
+
+        If ``choice_scores`` is ``None``, the pending pulls and the choices selected for the
+        batch are added to the number of scores of their choices.
+        """
+        if choice_scores is not None:
+            return super(PureBestKVelocity, self).select_batch(choice_scores, k, pending)
+
+        if not self._counts.any():
+            raise ValueError('No scores have been recorded with update.')
+
+        pending_counts = self._get_pending_counts(pending)
+        choices = list()
+        for _ in range(k):
+            index = np.argmax(self._get_values(pending_counts))
+            pending_counts[index] += 1
+            choices.append(self.choices[index])
+
+        return choices
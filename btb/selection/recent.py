@@ -1,4 +1,7 @@
 import logging
+from collections import deque
+
+import numpy as np
 
 from btb.selection.ucb1 import UCB1
 
@@ -10,9 +13,54 @@ K_MIN = 2
 logger = logging.getLogger('btb')
 
 
+class RecentScores(object):
+    """Most recent scores of every choice
+
+    Keeps a ring buffer with the ``size`` most recent scores of every choice, together with
+    their sum, their number and the newest and oldest of them, so updating a choice costs
+    :math:`O(1)` and the statistics of all the choices are available as arrays.
+
+    Args:
+        num_choices (int): number of choices.
+        size (int): number of recent scores to keep for every choice.
+    """
+
+    def __init__(self, num_choices, size):
+        self.size = size
+        self.buffers = [deque(maxlen=size) for _ in range(num_choices)]
+        self.sums = np.zeros(num_choices)
+        self.lengths = np.zeros(num_choices, dtype=int)
+        self.newest = np.zeros(num_choices)
+        self.oldest = np.zeros(num_choices)
+
+    def push(self, index, score):
+        """Add a new score of the choice with the given index"""
+        buffer = self.buffers[index]
+        if len(buffer) == self.size:
+            self.sums[index] -= buffer[0]
+        else:
+            self.lengths[index] += 1
+
+        buffer.append(score)
+        self.sums[index] += score
+        self.newest[index] = score
+        self.oldest[index] = buffer[0]
+
+    def clear(self, index):
+        """Forget the scores of the choice with the given index"""
+        self.buffers[index].clear()
+        self.sums[index] = 0
+        self.lengths[index] = 0
+        self.newest[index] = 0
+        self.oldest[index] = 0
+
+
 class RecentKReward(UCB1):
     """Recent K reward selector
 
+    When the scores are recorded with ``update``, only the ``k + 1`` most recent scores of every
+    choice are kept, so selecting does not depend on the number of recorded scores.
+
     Args:
         k (int): number of best scores to consider
     """
@@ -20,16 +68,37 @@ class RecentKReward(UCB1):
     def __init__(self, choices, k=K_MIN):
         super(RecentKReward, self).__init__(choices)
         self.k = k
+        self._recent_scores = RecentScores(len(self._indexes), k + 1)
+
+    def update(self, choice, score):
+        super(RecentKReward, self).update(choice, score)
+        self._recent_scores.push(self._indexes[choice], score)
+
+    def remove(self, choice):
+        super(RecentKReward, self).remove(choice)
+        self._recent_scores.clear(self._indexes[choice])
 
     def compute_rewards(self, scores):
         """Retain the K most recent scores, and replace the rest with zeros"""
-        for i in range(len(scores)):
-            if i >= self.k:
-                scores[i] = 0.
-        return scores
+        num_zeros = max(len(scores) - self.k, 0)
+        return [0.] * num_zeros + list(scores[num_zeros:])
+
+    def _get_recent_k_rewards(self):
+        """Compute the average reward and the number of rewards of every choice
 
-    def select(self, choice_scores):
+        This is equivalent to applying ``compute_rewards`` to the recorded scores of every
+        choice, but using only their most recent scores.
+        """
+        recent = self._recent_scores
+        sums = recent.sums - np.where(recent.lengths > self.k, recent.oldest, 0)
+
+        return sums / np.maximum(self._counts, 1), self._counts
+
+    def select(self, choice_scores=None):
         """Use the top k learner's scores for usage in rewards for the bandit calculation"""
+        if choice_scores is None:
+            return super(RecentKReward, self).select()
+
         # if we don't have enough scores to do K-selection, fall back to UCB1
         min_num_scores = min([len(s) for s in choice_scores.values()])
         if min_num_scores >= K_MIN:
@@ -49,6 +118,21 @@ class RecentKReward(UCB1):
 
         return self.bandit(choice_rewards)
 
+    def _get_updated_rewards(self):
+        """Compute the rewards from the recent scores recorded with ``update``
+
+        If there is not enough score history to do K-selection, use the default UCB1 rewards.
+        """
+        pulled = self._counts > 0
+        if self._counts[pulled].min() >= K_MIN:
+            logger.info('{klass}: using Best K bandit selection'.format(klass=type(self).__name__))
+            return self._get_recent_k_rewards()
+        else:
+            logger.warning(
+                '{klass}: Not enough choices to do K-selection; using plain UCB1'
+                .format(klass=type(self).__name__))
+            return self._get_rewards()
+
 
 class RecentKVelocity(RecentKReward):
     """Recent K velocity selector"""
@@ -67,3 +151,16 @@ class RecentKVelocity(RecentKReward):
         # maintained
         zeros = (len(scores) - self.k) * [0]
         return velocities + zeros
+
+    def _get_recent_k_rewards(self):
+        """Compute the average velocity and the number of rewards of every choice
+
+        The velocities of the ``k + 1`` most recent scores add up to the difference between
+        the newest and the oldest of them, and the zeros that pad them do not add anything.
+        """
+        recent = self._recent_scores
+        num_velocities = np.maximum(recent.lengths - 1, 0)
+        pulls = num_velocities + np.maximum(self._counts - self.k, 0)
+        average_rewards = (recent.newest - recent.oldest) / np.maximum(pulls, 1)
+
+        return average_rewards, pulls
@@ -4,6 +4,9 @@ import numpy as np
 class Selector(object):
     """Base selector
 
+    The scores of the choices can either be given to every call to ``select``, or be recorded
+    one at a time with ``update``, in which case ``select`` can be called without arguments.
+
     Args:
         choices (list): a list of discrete choices from which the selector must choose at every
             call to ``select``.
@@ -11,6 +14,36 @@ class Selector(object):
 
     def __init__(self, choices):
         self.choices = choices
+        self._indexes = {choice: index for index, choice in enumerate(choices or ())}
+        self._choice_scores = dict()
+
+    def _get_index(self, choice):
+        index = self._indexes.get(choice)
+        if index is None:
+            raise ValueError('Unknown choice: {}'.format(choice))
+
+        return index
+
+    def update(self, choice, score):
+        """Record a new score obtained by a choice
+
+        Args:
+            choice (object): one of the ``choices`` of this selector.
+            score (float): score obtained by the choice.
+
+        Raises:
+            ValueError: if ``choice`` is not one of the ``choices`` of this selector.
+        """
+        self._get_index(choice)
+        self._choice_scores.setdefault(choice, list()).append(score)
+
+    def remove(self, choice):
+        """Forget the scores recorded for a choice, so it is not selected anymore
+
+        The choice will be selected again if new scores are recorded for it.
+        """
+        self._get_index(choice)
+        self._choice_scores.pop(choice, None)
 
     def compute_rewards(self, scores):
         """Compute rewards from choice's scores
@@ -37,7 +70,17 @@ class Selector(object):
         """
         return max(choice_rewards, key=lambda a: np.mean(choice_rewards[a]))
 
-    def select(self, choice_scores):
+    def _get_choice_scores(self, choice_scores):
+        """Get the given ``choice_scores``, or a copy of the ones recorded with ``update``."""
+        if choice_scores is not None:
+            return choice_scores
+
+        if not self._choice_scores:
+            raise ValueError('No scores have been recorded with update.')
+
+        return {choice: list(scores) for choice, scores in self._choice_scores.items()}
+
+    def select(self, choice_scores=None):
         """Select the next best choice to make
 
         Args:
@@ -45,7 +88,8 @@ class Selector(object):
                 possible choice. The caller is responsible for making sure each choice that is
                 possible at this juncture is represented in the dict, even those with no scores.
                 Score lists should be in ascending chronological order, that is, the score from the
-                earliest trial should be listed first.
+                earliest trial should be listed first. If ``None``, the scores recorded with
+                ``update`` are used, and only the choices with at least one score are considered.
 
                 For example::
 
@@ -55,6 +99,7 @@ class Selector(object):
                         3: [0.60, 0.65, 0.68],
                     }
         """
+        choice_scores = self._get_choice_scores(choice_scores)
         choice_rewards = {}
         for choice, scores in choice_scores.items():
             if choice not in self.choices:
@@ -63,3 +108,57 @@ class Selector(object):
             choice_rewards[choice] = self.compute_rewards(scores)
 
         return self.bandit(choice_rewards)
+
+    def _get_pending_counts(self, pending):
+        """Get the number of pending pulls of every choice as an array"""
+        pending_counts = np.zeros(len(self._indexes), dtype=int)
+        for choice, count in (pending or {}).items():
+            pending_counts[self._get_index(choice)] += count
+
+        return pending_counts
+
+    @staticmethod
+    def _hallucinate(scores, count=1):
+        """Get ``count`` hallucinated scores, equal to the mean of the given ones"""
+        scores = [score for score in scores if not np.isnan(score)]
+        return [np.mean(scores) if scores else 0.] * count
+
+    def select_batch(self, choice_scores=None, k=1, pending=None):
+        """Select the next ``k`` choices to make at the same time
+
+        The pulls that are still waiting for their scores are taken into account as
+        hallucinated scores equal to the mean score of their choice, which count as pulls
+        without changing the average rewards, so the same choice is not selected again and
+        again while its scores are not known.
+
+        Args:
+            choice_scores (Dict[object, List[float]]): Mapping of choice to list of scores for each
+                possible choice, as in ``select``. If ``None``, the scores recorded with
+                ``update`` are used.
+            k (int): number of choices to select. Defaults to 1.
+            pending (Dict[object, int]): number of pulls of every choice which are still
+                waiting for their scores. Defaults to ``None``.
+
+        Returns:
+            list: the ``k`` selected choices, in order. The same choice can be selected
+            several times.
+        """
+        choice_scores = {
+            choice: list(scores)
+            for choice, scores in self._get_choice_scores(choice_scores).items()
+        }
+        for choice, count in (pending or {}).items():
+            if choice in choice_scores:
+                scores = choice_scores[choice]
+                scores.extend(self._hallucinate(scores, count))
+
+        choices = list()
+        for _ in range(k):
+            choice = self.select(choice_scores)
+            if choice in choice_scores:
+                scores = choice_scores[choice]
+                scores.extend(self._hallucinate(scores))
+
+            choices.append(choice)
+
+        return choices
@@ -0,0 +1,193 @@
+from abc import ABCMeta, abstractmethod
+
+import numpy as np
+
+from btb.selection.selector import Selector
+
+
+class ThompsonSampling(Selector, metaclass=ABCMeta):
+    """Thompson sampling selector
+
+    Draws a sample of the expected reward of every choice from its posterior distribution and
+    selects the choice with the highest one, so the choices are selected with the probability
+    of being the best one.
+
+    The number of rewards of every choice, their sum and the sum of their squares are kept up
+    to date by ``update``, and the samples of all the choices are drawn in a single
+    vectorized call.
+
+    See also::
+
+       Russo, Daniel et al. "A Tutorial on Thompson Sampling."
+       Foundations and Trends in Machine Learning 11.1 (2018): 1-96.
+    """
+
+    def __init__(self, choices):
+        super(ThompsonSampling, self).__init__(choices)
+        num_choices = len(self._indexes)
+        self._counts = np.zeros(num_choices, dtype=int)
+        self._num_rewards = np.zeros(num_choices, dtype=int)
+        self._sums = np.zeros(num_choices)
+        self._squares = np.zeros(num_choices)
+
+    def update(self, choice, score):
+        super(ThompsonSampling, self).update(choice, score)
+        index = self._indexes[choice]
+        self._counts[index] += 1
+        if not np.isnan(score):
+            reward = self.compute_rewards([score])[0]
+            self._num_rewards[index] += 1
+            self._sums[index] += reward
+            self._squares[index] += reward ** 2
+
+    def remove(self, choice):
+        super(ThompsonSampling, self).remove(choice)
+        index = self._indexes[choice]
+        self._counts[index] = 0
+        self._num_rewards[index] = 0
+        self._sums[index] = 0
+        self._squares[index] = 0
+
+    def _aggregate(self, choice_scores):
+        """Compute the statistics of the rewards of every choice from the given scores"""
+        num_choices = len(self._indexes)
+        available = np.zeros(num_choices, dtype=bool)
+        num_rewards = np.zeros(num_choices, dtype=int)
+        sums = np.zeros(num_choices)
+        squares = np.zeros(num_choices)
+        for choice, scores in choice_scores.items():
+            index = self._indexes.get(choice)
+            if index is None:
+                continue
+
+            scores = np.asarray(scores, dtype=float)
+            rewards = np.asarray(self.compute_rewards(scores[~np.isnan(scores)]), dtype=float)
+            available[index] = True
+            num_rewards[index] = len(rewards)
+            sums[index] = rewards.sum()
+            squares[index] = (rewards ** 2).sum()
+
+        return available, num_rewards, sums, squares
+
+    @abstractmethod
+    def _sample(self, num_rewards, sums, squares):
+        """Draw a sample of the expected reward of every choice
+
+        Args:
+            num_rewards (numpy.ndarray): number of rewards of every choice.
+            sums (numpy.ndarray): sum of the rewards of every choice.
+            squares (numpy.ndarray): sum of the squares of the rewards of every choice.
+
+        Returns:
+            numpy.ndarray: sampled expected reward of every choice.
+        """
+        pass
+
+    def select(self, choice_scores=None):
+        """Select the choice with the highest sampled expected reward
+
+        If ``choice_scores`` is ``None``, the statistics recorded with ``update`` are used.
+        """
+        if choice_scores is None:
+            if not self._counts.any():
+                raise ValueError('No scores have been recorded with update.')
+
+            available = self._counts > 0
+            num_rewards = self._num_rewards
+            sums = self._sums
+            squares = self._squares
+        else:
+            available, num_rewards, sums, squares = self._aggregate(choice_scores)
+
+        samples = self._sample(num_rewards, sums, squares)
+        return self.choices[np.argmax(np.where(available, samples, -np.inf))]
+
+    @staticmethod
+    def _add_hallucinated(num_rewards, sums, squares, counts):
+        """Add ``counts`` hallucinated rewards to the statistics of every choice
+
+        The hallucinated rewards are equal to the mean reward of their choice, or to the mean
+        of all the rewards if the choice has none, so they make the posterior distribution of
+        the choice narrower without moving it.
+        """
+        total_rewards = num_rewards.sum()
+        prior_mean = sums.sum() / total_rewards if total_rewards else 0.
+        means = np.where(num_rewards > 0, sums / np.maximum(num_rewards, 1), prior_mean)
+        return num_rewards + counts, sums + counts * means, squares + counts * means ** 2
+
+    def select_batch(self, choice_scores=None, k=1, pending=None):
+        """Select the next ``k`` choices to make at the same time
+
+        The pending pulls and the choices selected for the batch are added to the statistics
+        of their choices as hallucinated rewards, and a new sample is drawn for every choice
+        to select.
+        """
+        if choice_scores is None:
+            if not self._counts.any():
+                raise ValueError('No scores have been recorded with update.')
+
+            available = self._counts > 0
+            num_rewards = self._num_rewards
+            sums = self._sums
+            squares = self._squares
+        else:
+            available, num_rewards, sums, squares = self._aggregate(choice_scores)
+
+        pending_counts = self._get_pending_counts(pending)
+        num_rewards, sums, squares = self._add_hallucinated(
+            num_rewards, sums, squares, pending_counts)
+
+        choices = list()
+        for _ in range(k):
+            samples = self._sample(num_rewards, sums, squares)
+            index = np.argmax(np.where(available, samples, -np.inf))
+            selected = np.zeros(len(self._indexes), dtype=int)
+            selected[index] = 1
+            num_rewards, sums, squares = self._add_hallucinated(
+                num_rewards, sums, squares, selected)
+            choices.append(self.choices[index])
+
+        return choices
+
+
+class GaussianThompsonSampling(ThompsonSampling):
+    """Gaussian Thompson sampling selector
+
+    Models the rewards of every choice as normally distributed. As a prior, every choice gets a
+    pseudo reward with the mean and the variance of the rewards of all the choices, so the
+    scores do not need to be in any particular range.
+    """
+
+    def _sample(self, num_rewards, sums, squares):
+        total_rewards = num_rewards.sum()
+        if total_rewards:
+            prior_mean = sums.sum() / total_rewards
+            prior_variance = squares.sum() / total_rewards - prior_mean ** 2
+        else:
+            prior_mean = 0.
+
+        if not total_rewards or prior_variance <= 0:
+            prior_variance = 1.
+
+        pseudo_counts = num_rewards + 1
+        means = (sums + prior_mean) / pseudo_counts
+        deviations = np.maximum(squares - sums * sums / np.maximum(num_rewards, 1), 0)
+        variances = (deviations + prior_variance) / pseudo_counts
+
+        return np.random.normal(means, np.sqrt(variances / pseudo_counts))
+
+
+class BetaThompsonSampling(ThompsonSampling):
+    """Beta Thompson sampling selector
+
+    Models the rewards of every choice as the probabilities of success of a Bernoulli
+    distribution with a uniform ``Beta(1, 1)`` prior. The scores are expected to be between 0
+    and 1, such as accuracies, and are clipped to that range otherwise.
+    """
+
+    def compute_rewards(self, scores):
+        """Clip the scores between 0 and 1"""
+        return list(np.clip(scores, 0, 1))
+
+    def _sample(self, num_rewards, sums, squares):
+        return np.random.beta(1 + sums, 1 + num_rewards - sums)
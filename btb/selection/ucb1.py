@@ -10,12 +10,38 @@ class UCB1(Selector):
 
     Uses Upper Confidence Bound 1 algorithm (UCB1) for bandit selection.
 
+    The number of scores, their sum and the number of scores that are not ``nan`` of every
+    choice are kept up to date by ``update``, so selecting from the recorded scores is a
+    single vectorized pass over the choices, regardless of the number of scores.
+
     See also::
 
        Auer, Peter et al. "Finite-time Analysis of the Multiarmed Bandit Problem."
        Machine Learning 47 (2002): 235-256.
     """
 
+    def __init__(self, choices):
+        super(UCB1, self).__init__(choices)
+        num_choices = len(self._indexes)
+        self._counts = np.zeros(num_choices, dtype=int)
+        self._sums = np.zeros(num_choices)
+        self._num_rewards = np.zeros(num_choices, dtype=int)
+
+    def update(self, choice, score):
+        super(UCB1, self).update(choice, score)
+        index = self._indexes[choice]
+        self._counts[index] += 1
+        if not np.isnan(score):
+            self._sums[index] += score
+            self._num_rewards[index] += 1
+
+    def remove(self, choice):
+        super(UCB1, self).remove(choice)
+        index = self._indexes[choice]
+        self._counts[index] = 0
+        self._sums[index] = 0
+        self._num_rewards[index] = 0
+
     def _shuffle(self, iterable):
         iterable = list(iterable)
         inds = list(range(len(iterable)))
@@ -46,3 +72,79 @@ class UCB1(Selector):
             return average_reward + error
 
         return max(self._shuffle(choice_rewards), key=ucb1)
+
+    def _get_rewards(self):
+        """Compute the average reward and the number of rewards of every choice
+
+        The rewards are the recorded scores, and the ``nan`` scores only count as pulls.
+        """
+        return self._sums / np.maximum(self._num_rewards, 1), self._counts
+
+    def _ucb1(self, average_rewards, pulls):
+        """Compute the UCB1 index of every choice
+
+        Args:
+            average_rewards (numpy.ndarray): average reward of every choice.
+            pulls (numpy.ndarray): number of rewards of every choice.
+
+        Returns:
+            numpy.ndarray: UCB1 index of every choice, ``-inf`` for the choices without
+            any recorded score.
+        """
+        pulled = self._counts > 0
+        total_pulls = max(1, pulls[pulled].sum())
+        errors = np.sqrt(2.0 * np.log(total_pulls) / np.maximum(pulls, 1))
+        return np.where(pulled, average_rewards + errors, -np.inf)
+
+    def _get_updated_rewards(self):
+        """Compute the average reward and the number of pulls of every choice
+
+        The rewards are computed from the statistics recorded with ``update``, and are the
+        ones used by ``select`` when no ``choice_scores`` are given.
+        """
+        return self._get_rewards()
+
+    def _select_best_index(self, values):
+        """Select the index of one of the choices with the highest value at random"""
+        return np.random.choice(np.flatnonzero(values == values.max()))
+
+    def _select_best(self, values):
+        """Select one of the choices with the highest value at random"""
+        return self.choices[self._select_best_index(values)]
+
+    def select(self, choice_scores=None):
+        """Select the next best choice to make
+
+        If ``choice_scores`` is ``None``, the UCB1 index of the choices is computed from the
+        statistics recorded with ``update``.
+        """
+        if choice_scores is not None:
+            return super(UCB1, self).select(choice_scores)
+
+        if not self._counts.any():
+            raise ValueError('No scores have been recorded with update.')
+
+        return self._select_best(self._ucb1(*self._get_updated_rewards()))
+
+    def select_batch(self, choice_scores=None, k=1, pending=None):
+        """Select the next ``k`` choices to make at the same time
+
+        If ``choice_scores`` is ``None``, the pending pulls and the choices selected for the
+        batch are added to the number of pulls of their choices as virtual pulls, which lower
+        their UCB1 index without changing their average reward.
+        """
+        if choice_scores is not None:
+            return super(UCB1, self).select_batch(choice_scores, k, pending)
+
+        if not self._counts.any():
+            raise ValueError('No scores have been recorded with update.')
+
+        average_rewards, pulls = self._get_updated_rewards()
+        pulls = pulls + self._get_pending_counts(pending)
+        choices = list()
+        for _ in range(k):
+            index = self._select_best_index(self._ucb1(average_rewards, pulls))
+            pulls[index] += 1
+            choices.append(self.choices[index])
+
+        return choices
@@ -9,5 +9,5 @@ class Uniform(Selector):
     Selects a choice uniformly at random.
     """
 
-    def select(self, choice_scores):
+    def select(self, choice_scores=None):
         return random.choice(self.choices)
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
 import itertools
 import json
 import logging
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from hashlib import md5
 
 import numpy as np
@@ -17,6 +19,23 @@ from btb.tuning.tuners.gaussian_process import GPTuner
 LOGGER = logging.getLogger(__name__)
 
 
+class Trial(namedtuple('Trial', ('id', 'name', 'config'))):
+    """Trial class.
+
+    A ``Trial`` is the handle of a configuration proposed by ``BTBSession.ask``, which
+    has to be given back to ``BTBSession.tell`` together with the obtained score.
+
+    Attributes:
+        id (int):
+            Monotonic identifier of the trial within the ``BTBSession``.
+        name (str):
+            Name of the tunable to which the configuration belongs.
+        config (dict):
+            Hyperparameter configuration to score.
+    """
+    __slots__ = ()
+
+
 class BTBSession:
     """BTBSession class.
 
@@ -36,7 +55,8 @@ class BTBSession:
         best_score (float):
             Best score obtained for this session so far.
         proposals (dict):
-            Dictionary containing all the proposals generated by the ``BTBSession``.
+            Dictionary containing all the proposals generated by the ``BTBSession``, indexed
+            by their trial ``id``.
         iterations (int):
             Amount of iterations run.
         errors (Counter):
@@ -49,13 +69,19 @@ class BTBSession:
             ``btb.tuning.tunable.Tunable`` instance.
         scorer (callable object / function):
             A callable object or function with signature ``scorer(tunable_name, config)``
-            wich should return only a single value.
-        tuner_class (btb.tuning.tuner.BaseTuner):
+            wich should return only a single value. Coroutine functions can be used
+            together with ``arun``.
+        tuner_class (btb.tuning.tuner.BaseTuner or dict):
             A tuner based on BTB ``BaseTuner`` class. This tuner will manage the new proposals.
-            Defaults to ``btb.tuning.tuners.gaussian_process.GPTuner``
+            A dictionary that has as keys the name of the tunables and as values tuner classes
+            can also be given to use a different tuner for each tunable, in which case the
+            tunables that are not in it use the default. Defaults to
+            ``btb.tuning.tuners.gaussian_process.GPTuner``
         selector_class (btb.selection.selector.Selector):
             A selector based on BTB ``Selector`` class. This will determinate which one of
-            the tunables is performing better, and which one to test next. Defaults to
+            the tunables is performing better, and which one to test next. Use
+            ``btb.selection.hierarchical.HierarchicalSelector`` to select the tunables by
+            groups, given by their names, such as ``'trees/RF/default'``. Defaults to
             ``btb.selection.selectors.ucb1.UCB1``
         maximize (bool):
             If ``True`` the scores are interpreted as bigger is better, if ``False`` then smaller
@@ -78,6 +104,9 @@ class BTBSession:
     _normalized_scores = None
     _tuners = None
     _range = None
+    _trial_ids = None
+    _proposal_ids = None
+    _pending = None
 
     best_proposal = None
     best_score = None
@@ -110,6 +139,9 @@ class BTBSession:
         self._normalized_scores = defaultdict(list)
         self._tuners = dict()
         self._range = trange if verbose else range
+        self._trial_ids = itertools.count()
+        self._proposal_ids = dict()
+        self._pending = Counter()
 
     def _make_dumpable(self, to_dump):
         dumpable = {}
@@ -151,15 +183,18 @@ class BTBSession:
             - The tunable has failed more than ``max_errors`` times.
 
         When this happens, the tunable is removved from the tunables dict
-        and its scores are removed from the normmalized_scores dict used by
-        the selectors.
+        and its scores are removed from the normmalized_scores dict and
+        from the selector.
         """
         self._normalized_scores.pop(tunable_name, None)
         self._tunables.pop(tunable_name, None)
+        self._selector.remove(tunable_name)
 
     def _get_next_tunable_name(self):
         if self._normalized_scores:
-            tunable_name = self._selector.select(self._normalized_scores)
+            # the trials which are still being scored are given to the selector as pending
+            # pulls, so the parallel workers are spread across the tunables.
+            tunable_name = self._selector.select_batch(k=1, pending=self._pending)[0]
         else:
             # if _normalized_scores is still empty the selector crashes
             # this happens when max_errors > 1, all tunables have tuners
@@ -168,35 +203,13 @@ class BTBSession:
 
         return tunable_name
 
-    def propose(self):
-        """Propose a new configuration to score.
-
-        Every time ``propose`` is called, a new tunable will be selected and a new
-        hyperparameter proposal will be generated for it.
-
-        At the begining, the default hyperparameters of each one of the tunables
-        will be returned sequencially in the same order as they were passed to
-        the ``BTBSession``.
-
-        After that, once each tunable has been scored at least once, the tunable
-        used to generate the new proposals will be selected optimally each time
-        by the selector.
-
-        If a tunable runs out of proposals, it will be discarded from the list and will
-        not be proposed again.
+    def _get_tuner_class(self, tunable_name):
+        if isinstance(self._tuner_class, dict):
+            return self._tuner_class.get(tunable_name, GPTuner)
 
-        Finally, when all the tunables have ran out of proposals, a ``StopTuning`` exception
-        will be raised.
-
-        Returns:
-            tuple (str, dict):
-                * Name of the tunable to try next.
-                * Hyperparameters proposal.
+        return self._tuner_class
 
-        Raises:
-            StopTuning:
-                If the ``BTBSession`` has run out of proposals to generate.
-        """
+    def _propose_config(self):
         if not self._tunables:
             raise StopTuning('There are no tunables left to try.')
 
@@ -219,7 +232,9 @@ class BTBSession:
                             tunable_name)
                 tuner = None
             else:
-                tuner = self._tuner_class(tunable)
+                tuner_class = self._get_tuner_class(tunable_name)
+                tuner = tuner_class(tunable)
+                tuner.mark_pending(config)
 
             self._tuners[tunable_name] = tuner
 
@@ -233,20 +248,100 @@ class BTBSession:
 
                 LOGGER.info('Generating new proposal configuration for %s', tunable_name)
                 config = tuner.propose(1)
+                tuner.mark_pending(config)
 
             except StopTuning:
                 LOGGER.info('%s has no more configs to propose.', tunable_name)
                 self._remove_tunable(tunable_name)
-                tunable_name, config = self.propose()
+                tunable_name, config = self._propose_config()
 
-        proposal_id = self._make_id(tunable_name, config)
-        self.proposals[proposal_id] = {
-            'id': proposal_id,
+        return tunable_name, config
+
+    def _make_trial(self, tunable_name, config):
+        trial = Trial(next(self._trial_ids), tunable_name, config)
+        self._pending[tunable_name] += 1
+        self.proposals[trial.id] = {
+            'id': trial.id,
             'name': tunable_name,
             'config': config
         }
 
-        return tunable_name, config
+        return trial
+
+    def ask(self, n=None):
+        """Ask for one or more new trials to score.
+
+        Every time a trial is asked, a new tunable is selected and a new hyperparameter
+        proposal is generated for it, following the same logic as ``propose``.
+
+        The returned ``Trial`` handles carry a unique, monotonically increasing ``id`` which
+        is used by ``tell`` to record the score without having to look the configuration up
+        again, so the ``config`` can be freely modified by the caller and several copies of
+        the same configuration can be scored at the same time.
+
+        Args:
+            n (int):
+                Number of trials to generate. If ``None``, a single ``Trial`` is returned
+                instead of a list. Defaults to ``None``.
+
+        Returns:
+            Trial or list:
+                A ``Trial`` with the ``id``, ``name`` and ``config`` of the trial, or a list
+                of them if ``n`` is given. If the ``BTBSession`` runs out of proposals before
+                ``n`` trials are generated, only the generated ones are returned.
+
+        Raises:
+            StopTuning:
+                If the ``BTBSession`` has run out of proposals to generate.
+        """
+        if n is None:
+            return self._make_trial(*self._propose_config())
+
+        trials = list()
+        try:
+            for _ in range(n):
+                trials.append(self._make_trial(*self._propose_config()))
+
+        except StopTuning:
+            if not trials:
+                raise
+
+        return trials
+
+    def propose(self):
+        """Propose a new configuration to score.
+
+        Every time ``propose`` is called, a new tunable will be selected and a new
+        hyperparameter proposal will be generated for it.
+
+        At the begining, the default hyperparameters of each one of the tunables
+        will be returned sequencially in the same order as they were passed to
+        the ``BTBSession``.
+
+        After that, once each tunable has been scored at least once, the tunable
+        used to generate the new proposals will be selected optimally each time
+        by the selector.
+
+        If a tunable runs out of proposals, it will be discarded from the list and will
+        not be proposed again.
+
+        Finally, when all the tunables have ran out of proposals, a ``StopTuning`` exception
+        will be raised.
+
+        Returns:
+            tuple (str, dict):
+                * Name of the tunable to try next.
+                * Hyperparameters proposal.
+
+        Raises:
+            StopTuning:
+                If the ``BTBSession`` has run out of proposals to generate.
+        """
+        trial = self.ask()
+        proposal_id = self._make_id(trial.name, trial.config)
+        self._proposal_ids.setdefault(proposal_id, list()).append(trial.id)
+
+        return trial.name, trial.config
 
     def handle_error(self, tunable_name):
         """Handle errors when ``score`` is ``None``.
@@ -265,12 +360,107 @@ class BTBSession:
             LOGGER.warning('Too many errors: %s. Removing tunable %s', errors, tunable_name)
             self._remove_tunable(tunable_name)
 
+    def tell_many(self, trials, scores):
+        """Record the scores obtained for several trials at once.
+
+        The trials are recorded with a single call to each one of the tuners involved,
+        so the tuners based on a meta-model fit it only once per call.
+
+        Args:
+            trials (list):
+                List of ``Trial`` handles, as returned by ``ask``.
+            scores (list):
+                List of scores obtained for each one of the trials. ``None`` is interpreted
+                as the trial having crashed.
+
+        Raises:
+            ValueError:
+                If the amount of trials and scores is not the same or if a trial has already
+                been recorded.
+        """
+        if len(trials) != len(scores):
+            raise ValueError('The amount of trials must be equal to the amount of scores.')
+
+        # validate the whole batch before modifying anything, so a rejected batch leaves
+        # the session as it was.
+        proposals = list()
+        trial_ids = set()
+        for trial in trials:
+            proposal = self.proposals[trial.id]
+            if 'score' in proposal or trial.id in trial_ids:
+                raise ValueError('Trial {} has already been recorded.'.format(trial.id))
+
+            proposals.append(proposal)
+            trial_ids.add(trial.id)
+
+        to_record = defaultdict(lambda: (list(), list()))
+        for trial, score, proposal in zip(trials, scores, proposals):
+            proposal['score'] = score
+            tunable_name = trial.name
+            self._pending[tunable_name] -= 1
+            if self._pending[tunable_name] <= 0:
+                del self._pending[tunable_name]
+
+            if score is None:
+                tuner = self._tuners.get(tunable_name)
+                if tuner is not None:
+                    tuner.clear_pending(trial.config)
+
+                self.handle_error(tunable_name)
+            else:
+                normalized = self._normalize(score)
+                if tunable_name in self._tunables:
+                    # scores from tunables removed while they were being scored are not
+                    # given back to the selector, otherwise they would be selected again.
+                    self._normalized_scores[tunable_name].append(normalized)
+                    self._selector.update(tunable_name, normalized)
+
+                if normalized > self._best_normalized:
+                    LOGGER.info('New optimal found: %s - %s', tunable_name, score)
+                    self.best_proposal = proposal
+                    self.best_score = score
+                    self._best_normalized = normalized
+
+                configs, normalized_scores = to_record[tunable_name]
+                configs.append(trial.config)
+                normalized_scores.append(normalized)
+
+        for tunable_name, (configs, normalized_scores) in to_record.items():
+            try:
+                tuner = self._tuners[tunable_name]
+                if tuner is None:
+                    LOGGER.warn('Skipping record for Tunable %s with cardinality 1', tunable_name)
+                else:
+                    tuner.record(configs, normalized_scores)
+
+            except Exception:
+                LOGGER.exception('Could not record configuration and score for tuner %s.',
+                                 tunable_name)
+
+    def tell(self, trial, score):
+        """Record the score obtained for a trial.
+
+        If the score is the best one so far, the ``best_proposal`` and ``best_score`` are
+        updated.
+
+        Args:
+            trial (Trial):
+                ``Trial`` handle, as returned by ``ask``.
+            score (float):
+                Obtained score for the trial. ``None`` is interpreted as the trial having
+                crashed.
+        """
+        self.tell_many([trial], [score])
+
     def record(self, tunable_name, config, score):
         """Record the configuration and the obtained score to the tuner.
 
         If the score is the best one so far, the ``best_proposal`` and ``best_score`` are
         updated.
 
+        The proposal is looked up using the name and the configuration, as returned by
+        ``propose``. Use ``ask`` and ``tell`` to skip this lookup.
+
         Args:
             tunable_name (str):
                 The name of the tunable to which this configuration belongs.
@@ -280,43 +470,104 @@ class BTBSession:
                 Obtained score with the given configuration.
         """
         proposal_id = self._make_id(tunable_name, config)
-        proposal = self.proposals[proposal_id]
-        proposal['score'] = score
-
-        if score is None:
-            self.handle_error(tunable_name)
-        else:
-            normalized = self._normalize(score)
-            self._normalized_scores[tunable_name].append(normalized)
-
-            if normalized > self._best_normalized:
-                LOGGER.info('New optimal found: %s - %s', tunable_name, score)
-                self.best_proposal = proposal
-                self.best_score = score
-                self._best_normalized = normalized
-            try:
-                tuner = self._tuners[tunable_name]
-                if tuner is None:
-                    LOGGER.warn('Skipping record for Tunable %s with cardinality 1', tunable_name)
-                else:
-                    tuner.record(config, normalized)
+        trial_ids = self._proposal_ids[proposal_id]
+        trial_id = trial_ids.pop(0)
+        if not trial_ids:
+            del self._proposal_ids[proposal_id]
+
+        self.tell(Trial(trial_id, tunable_name, config), score)
+
+    def _log_crash(self, iteration, tunable_name, config):
+        params = '\n'.join('{}: {}'.format(k, v) for k, v in config.items())
+        LOGGER.exception(
+            'Proposal %s - %s crashed with the following configuration: %s',
+            iteration,
+            tunable_name,
+            params
+        )
+
+    def _run_parallel(self, iterator, n_workers, executor):
+        """Keep up to ``n_workers`` scorer calls running on the ``executor``.
+
+        New proposals are generated as soon as a worker becomes free, and the scores are
+        recorded in the order in which they complete. Proposals which are still being
+        scored are marked as pending on their tuners, so they are not proposed twice.
+
+        If the ``BTBSession`` runs out of proposals, the scorer calls that are still running
+        are awaited and recorded before raising the ``StopTuning`` exception.
+        """
+        running = dict()
+        stop_tuning = None
+        iterator = iter(iterator)
+        try:
+            while True:
+                while stop_tuning is None and len(running) < n_workers:
+                    if next(iterator, StopIteration) is StopIteration:
+                        break
+
+                    try:
+                        trial = self.ask()
+                    except StopTuning as error:
+                        stop_tuning = error
+                        break
+
+                    self.iterations += 1
+                    LOGGER.debug('Scoring proposal %s - %s: %s', self.iterations, trial.name,
+                                 trial.config)
+                    future = executor.submit(self._scorer, trial.name, trial.config)
+                    running[future] = (self.iterations, trial)
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    iteration, trial = running.pop(future)
+                    try:
+                        score = future.result()
+                    except Exception:
+                        self._log_crash(iteration, trial.name, trial.config)
+                        score = None
+
+                    self.tell(trial, score)
+
+        finally:
+            for future in running:
+                future.cancel()
+
+        if stop_tuning is not None:
+            raise stop_tuning
 
-            except Exception:
-                LOGGER.exception('Could not record configuration and score for tuner %s.',
-                                 tunable_name)
+        return self.best_proposal
 
-    def run(self, iterations=None):
+    def run(self, iterations=None, n_workers=1, executor=None):
         """Run the selection and tuning loop for the given number of iterations.
 
-        At each iteration, the `BTBSession` will generate a new proposal calling
-        ``self.propose``, score it using the `self.scorer`, and finally record the
-        obtained score back to the tuner calling `self.record`.
+        At each iteration, the `BTBSession` will generate a new trial calling
+        ``self.ask``, score it using the `self.scorer`, and finally record the
+        obtained score back to the tuner calling `self.tell`.
 
         If no iterations are given, run infinitely until interrupted or until all the
         tuner proposals are exhausted.
 
+        If ``n_workers`` is bigger than 1 or an ``executor`` is given, the scorer calls are
+        submitted to the executor and up to ``n_workers`` of them are kept running at the
+        same time, proposing new configurations while the others are still being scored.
+
         Scoring errors will also be captured and recorded.
 
+        Args:
+            iterations (int):
+                Number of configurations to score. If ``None``, run until all the tunables
+                run out of proposals. Defaults to ``None``.
+            n_workers (int):
+                Number of scorer calls to keep running at the same time. Defaults to 1.
+            executor (concurrent.futures.Executor):
+                Executor used to run the scorer calls. If not given and ``n_workers`` is bigger
+                than 1, a ``concurrent.futures.ThreadPoolExecutor`` with ``n_workers`` threads
+                is used. A ``concurrent.futures.ProcessPoolExecutor`` can be given for CPU bound
+                scorers, as long as the scorer can be pickled.
+
         Returns:
             best_proposal (dict):
                 Best configuration found with the name of the tunable and the hyperparameters
@@ -327,25 +578,110 @@ class BTBSession:
         else:
             iterator = self._range(iterations)
 
+        if executor is not None:
+            return self._run_parallel(iterator, n_workers, executor)
+
+        if n_workers > 1:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                return self._run_parallel(iterator, n_workers, executor)
+
         for _ in iterator:
             self.iterations += 1
-            tunable_name, config = self.propose()
+            trial = self.ask()
 
             try:
-                LOGGER.debug('Scoring proposal %s - %s: %s', self.iterations, tunable_name, config)
-                score = self._scorer(tunable_name, config)
+                LOGGER.debug('Scoring proposal %s - %s: %s', self.iterations, trial.name,
+                             trial.config)
+                score = self._scorer(trial.name, trial.config)
 
             except Exception:
-                params = '\n'.join('{}: {}'.format(k, v) for k, v in config.items())
-                LOGGER.exception(
-                    'Proposal %s - %s crashed with the following configuration: %s',
-                    self.iterations,
-                    tunable_name,
-                    params
-                )
-
+                self._log_crash(self.iterations, trial.name, trial.config)
                 score = None
 
-            self.record(tunable_name, config, score)
+            self.tell(trial, score)
+
+        return self.best_proposal
+
+    async def arun(self, iterations=None, concurrency=1, executor=None):
+        """Run the selection and tuning loop on the ``asyncio`` event loop.
+
+        Coroutine version of ``run`` for scorers defined as ``async def scorer(name, config)``.
+        Up to ``concurrency`` scorer calls are awaited at the same time, and new trials are
+        generated as soon as one of them finishes.
+
+        The calls to ``self.ask`` and ``self.tell_many``, which may need to fit the tuner
+        metamodels, are run on the ``executor`` so they do not block the event loop. The scores
+        of the scorer calls that finish together are recorded with a single ``self.tell_many``
+        call.
+
+        If the ``BTBSession`` runs out of proposals, the scorer calls that are still running
+        are awaited and recorded before raising the ``StopTuning`` exception.
+
+        Args:
+            iterations (int):
+                Number of configurations to score. If ``None``, run until all the tunables
+                run out of proposals. Defaults to ``None``.
+            concurrency (int):
+                Number of scorer calls to await at the same time. Defaults to 1.
+            executor (concurrent.futures.Executor):
+                Executor used to run ``self.ask`` and ``self.tell_many``. If not given, the
+                default executor of the event loop is used.
+
+        Returns:
+            best_proposal (dict):
+                Best configuration found with the name of the tunable and the hyperparameters
+                and crossvalidated score obtained for it.
+        """
+        if iterations is None:
+            iterator = itertools.count()
+        else:
+            iterator = iter(self._range(iterations))
+
+        loop = asyncio.get_event_loop()
+        running = dict()
+        stop_tuning = None
+        try:
+            while True:
+                while stop_tuning is None and len(running) < concurrency:
+                    if next(iterator, StopIteration) is StopIteration:
+                        break
+
+                    try:
+                        trial = await loop.run_in_executor(executor, self.ask)
+                    except StopTuning as error:
+                        stop_tuning = error
+                        break
+
+                    self.iterations += 1
+                    LOGGER.debug('Scoring proposal %s - %s: %s', self.iterations, trial.name,
+                                 trial.config)
+                    task = asyncio.ensure_future(self._scorer(trial.name, trial.config))
+                    running[task] = (self.iterations, trial)
+
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                trials = list()
+                scores = list()
+                for task in done:
+                    iteration, trial = running.pop(task)
+                    try:
+                        score = task.result()
+                    except Exception:
+                        self._log_crash(iteration, trial.name, trial.config)
+                        score = None
+
+                    trials.append(trial)
+                    scores.append(score)
+
+                await loop.run_in_executor(executor, self.tell_many, trials, scores)
+
+        finally:
+            for task in running:
+                task.cancel()
+
+        if stop_tuning is not None:
+            raise stop_tuning
 
         return self.best_proposal
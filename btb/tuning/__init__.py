@@ -7,19 +7,34 @@ from btb.tuning.hyperparams.categorical import CategoricalHyperParam
 from btb.tuning.hyperparams.numerical import FloatHyperParam, IntHyperParam
 from btb.tuning.tunable import Tunable
 from btb.tuning.tuners.base import StopTuning
-from btb.tuning.tuners.gaussian_process import GCPEiTuner, GCPTuner, GPEiTuner, GPTuner
+from btb.tuning.tuners.gaussian_process import (
+    GCPEiTuner, GCPTuner, GPEiTuner, GPTuner, IncrementalGPEiTuner, IncrementalGPTuner,
+    SparseGPEiTuner, SparseGPTuner)
+from btb.tuning.tuners.grid import GridTuner
+from btb.tuning.tuners.random_forest import ETEiTuner, ETTuner, RFEiTuner, RFTuner
+from btb.tuning.tuners.tpe import TPETuner
 from btb.tuning.tuners.uniform import UniformTuner
 
 __all__ = (
     'BooleanHyperParam',
     'CategoricalHyperParam',
+    'ETEiTuner',
+    'ETTuner',
     'GCPEiTuner',
     'GCPTuner',
     'GPEiTuner',
     'GPTuner',
+    'GridTuner',
+    'IncrementalGPEiTuner',
+    'IncrementalGPTuner',
+    'RFEiTuner',
+    'RFTuner',
+    'SparseGPEiTuner',
+    'SparseGPTuner',
     'FloatHyperParam',
     'IntHyperParam',
     'StopTuning',
+    'TPETuner',
     'Tunable',
     'UniformTuner',
 )
@@ -18,6 +18,19 @@ class BaseAcquisition(metaclass=ABCMeta):
         return sorted_candidates[:n]
 
     @abstractmethod
+    def _score(self, candidates):
+        """Compute the acquisition value of the candidates.
+
+        Args:
+            candidates (numpy.ndarray):
+                2D array with two columns: scores and standard deviations
+
+        Returns:
+            numpy.ndarray:
+                1D array with the acquisition value of each candidate. The bigger the better.
+        """
+        pass
+
     def _acquire(self, candidates, num_candidates=1):
         """Decide which candidates to return as proposals.
 
@@ -36,4 +49,4 @@ class BaseAcquisition(metaclass=ABCMeta):
             numpy.ndarray:
                 Selected candidates indexes.
         """
-        pass
+        return self._get_max_candidates(self._score(candidates), num_candidates)
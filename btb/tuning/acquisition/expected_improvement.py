@@ -10,7 +10,7 @@ from btb.tuning.acquisition.base import BaseAcquisition
 
 class ExpectedImprovementAcquisition(BaseAcquisition):
 
-    def _acquire(self, candidates, num_candidates=1):
+    def _score(self, candidates):
         Phi = norm.cdf
         N = norm.pdf
 
@@ -19,6 +19,4 @@ class ExpectedImprovementAcquisition(BaseAcquisition):
 
         z = (mu - y_best) / sigma
 
-        ei = sigma * (z * Phi(z) + N(z))
-
-        return self._get_max_candidates(ei, num_candidates)
+        return sigma * (z * Phi(z) + N(z))
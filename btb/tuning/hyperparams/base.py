@@ -104,9 +104,10 @@ class BaseHyperParam(metaclass=ABCMeta):
             ValueError:
                 A ``ValueError`` is raised if any value from ``values`` is not within the range.
         """
-        inside_mask = np.ma.masked_inside(values, min, max)
-        if inside_mask.any():
-            outside = inside_mask[~inside_mask.mask].data.reshape(-1).tolist()
+        values = np.asarray(values)
+        outside = ~((values >= min) & (values <= max))
+        if outside.any():
+            outside = values[outside].tolist()
             raise ValueError(
                 'Values found outside of the valid range [{}, {}]: {}'.format(min, max, outside)
             )
@@ -127,7 +128,7 @@ class BaseHyperParam(metaclass=ABCMeta):
             values (numpy.ndarray):
                 2D array of values that will be validated.
         """
-        self._within_range(values.astype(np.float), min=0, max=1)
+        self._within_range(np.asarray(values, dtype=np.float), min=0, max=1)
 
     @abstractmethod
     def _inverse_transform(self, values):
@@ -139,7 +140,7 @@ class BaseHyperParam(metaclass=ABCMeta):
         """Method to be implemented by child classes."""
         pass
 
-    def inverse_transform(self, values):
+    def inverse_transform(self, values, validate=True):
         """Invert one or more search space values.
 
         Validates that the input values are within the search space and then transform them into
@@ -148,6 +149,11 @@ class BaseHyperParam(metaclass=ABCMeta):
         Args:
             values (scalar or array-like):
                 Scalar or array-like of values to be converted into the hyperparameter space.
+            validate (bool):
+                If ``False``, ``values`` must be a 2D ``numpy.ndarray`` of shape
+                ``(n, self.dimensions)`` with values from the search space, and they are
+                inverted without validating them. This is meant for values generated
+                internally, like the ones proposed by the tuners. Defaults to ``True``.
 
         Returns:
             numpy.ndarray:
@@ -167,8 +173,9 @@ class BaseHyperParam(metaclass=ABCMeta):
             array([[1],
                    [2]])
         """
-        values = self._to_array(values)
-        self._within_search_space(values)
+        if validate:
+            values = self._to_array(values)
+            self._within_search_space(values)
 
         return self._inverse_transform(values)
 
@@ -197,6 +204,73 @@ class BaseHyperParam(metaclass=ABCMeta):
                    [0.375]])
         """
 
+    @abstractmethod
+    def from_uniform(self, values):
+        """Map uniformly distributed values into the search space.
+
+        Every hyperparameter uses a single uniform value per sample, regardless of its number
+        of ``dimensions``, so the values can come from a quasi-random sequence.
+
+        Args:
+            values (numpy.ndarray):
+                2D array with shape ``(n_samples, 1)`` with values in ``[0, 1)``.
+
+        Returns:
+            numpy.ndarray:
+                2D ``numpy.ndarray`` with a shape ``(n_samples, self.dimensions)``.
+
+        Example:
+            The example below shows simple usage case where an ``IntHyperParam`` is being
+            imported, instantiated with a range from 1 to 4, and its method ``from_uniform``
+            is being called with two uniform values.
+
+            >>> from btb.tuning.hyperparams.numerical import IntHyperParam
+            >>> instance = IntHyperParam(min=1, max=4)
+            >>> instance.from_uniform(np.array([[0.1], [0.6]]))
+            array([[0.125],
+                   [0.625]])
+        """
+        pass
+
+    def to_index(self, values):
+        """Convert search space values into the index of the value they represent.
+
+        Only hyperparameters with a finite ``cardinality`` can be indexed. Every possible value
+        gets an index in ``[0, self.cardinality)``.
+
+        Args:
+            values (numpy.ndarray):
+                2D array of shape ``(n, self.dimensions)`` with values from the search space.
+
+        Returns:
+            numpy.ndarray:
+                1D array of ``n`` integer indexes.
+
+        Raises:
+            ValueError:
+                If the hyperparameter has an infinite ``cardinality``.
+        """
+        raise ValueError('{} can not be indexed.'.format(self.__class__.__name__))
+
+    def from_index(self, indexes):
+        """Convert value indexes into search space values.
+
+        This is the inverse of ``to_index``.
+
+        Args:
+            indexes (numpy.ndarray):
+                1D array of ``n`` integer indexes.
+
+        Returns:
+            numpy.ndarray:
+                2D array of shape ``(n, self.dimensions)`` with values from the search space.
+
+        Raises:
+            ValueError:
+                If the hyperparameter has an infinite ``cardinality``.
+        """
+        raise ValueError('{} can not be indexed.'.format(self.__class__.__name__))
+
     def transform(self, values):
         """Transform one or more hyperparameter values.
 
@@ -31,7 +31,7 @@ class BooleanHyperParam(BaseHyperParam):
     def _within_hyperparam_space(self, values):
         if values.dtype is not np.dtype('bool'):
             # values is expected to be np.ndarray(n, 1) [[False], [True]]
-            if not all(isinstance(value[0], bool) for value in values):
+            if not all(isinstance(value, bool) for value in values.reshape(-1).tolist()):
                 raise ValueError('Values: {} not within hyperparameter space.'.format(values))
 
     def _inverse_transform(self, values):
@@ -117,5 +117,45 @@ class BooleanHyperParam(BaseHyperParam):
 
         return np.round(sampled).astype(int)
 
+    def from_uniform(self, values):
+        """Map uniformly distributed values into the search space :math:`{0, 1}`.
+
+        Args:
+            values (numpy.ndarray):
+                2D array with shape ``(n_samples, 1)`` with values in ``[0, 1)``.
+
+        Returns:
+            numpy.ndarray:
+                2D array with shape of ``(n_samples, 1)`` with values inside the search space.
+
+        Example:
+            >>> instance = BooleanHyperParam()
+            >>> instance.from_uniform(np.array([[0.2], [0.7]]))
+            array([[0],
+                   [1]])
+        """
+        return np.round(values).astype(int)
+
+    def to_index(self, values):
+        """Convert search space values into their index, ``0`` for ``False`` or ``1`` for ``True``.
+
+        Example:
+            >>> instance = BooleanHyperParam()
+            >>> instance.to_index(np.array([[1], [0]]))
+            array([1, 0])
+        """
+        return np.asarray(values)[:, 0].astype(int)
+
+    def from_index(self, indexes):
+        """Convert value indexes into search space values.
+
+        Example:
+            >>> instance = BooleanHyperParam()
+            >>> instance.from_index(np.array([1, 0]))
+            array([[1],
+                   [0]])
+        """
+        return np.asarray(indexes, dtype=int).reshape(-1, 1)
+
     def __repr__(self):
         return 'BooleanHyperParam(default={})'.format(self.default)
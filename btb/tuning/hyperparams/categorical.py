@@ -5,7 +5,6 @@
 from copy import deepcopy
 
 import numpy as np
-from sklearn.preprocessing import OneHotEncoder
 
 from btb.tuning.hyperparams.base import BaseHyperParam
 
@@ -21,7 +20,8 @@ class CategoricalHyperParam(BaseHyperParam):
         :math:`h_1, h_2,... h_K` where `K` is the number of categories.
 
     Search Space:
-        :math:`\{ 0, 1 \}^K` where `K` is the number of categories.
+        :math:`\{ 0, 1 \}^K` where `K` is the number of categories, or
+        :math:`s_1, s_2,... s_K` where :math:`s_i = (i - 0.5) / K` for the ``ordinal`` encoding.
 
     Args:
         choices (list):
@@ -29,14 +29,22 @@ class CategoricalHyperParam(BaseHyperParam):
 
         default (str or None):
             Default value for the hyperparameter to take. Defaults to the first item in ``choices``
+
+        encoding (str):
+            How the choices are represented in the search space. ``onehot`` uses one dimension
+            per choice, while ``ordinal`` uses a single dimension with the center of the interval
+            of each choice, which keeps the search space small for hyperparameters with many
+            choices. The ordinal dimensions are compared as categories, and not by their
+            distance, by the Gaussian Process metamodels. Defaults to ``onehot``.
     """
     NO_DEFAULT = object()
+    ENCODINGS = ('onehot', 'ordinal')
 
-    def __init__(self, choices, default=NO_DEFAULT):
+    def __init__(self, choices, default=NO_DEFAULT, encoding='onehot'):
         """Instantiation of CategoricalHyperParam.
 
-        Creates an instance with a list of ``choices`` and fit an instance of
-        ``sklearn.preprocessing.OneHotEncoder`` with those values.
+        Creates an instance with a list of ``choices`` and builds the lookup tables used to
+        encode them: a dict from choice to index and an array from index to choice.
         """
         if default is self.NO_DEFAULT:
             self.default = choices[0]
@@ -45,21 +53,49 @@ class CategoricalHyperParam(BaseHyperParam):
         else:
             self.default = default
 
+        if encoding not in self.ENCODINGS:
+            raise ValueError(
+                'Unknown encoding {}. Use one of {}.'.format(encoding, self.ENCODINGS))
+
         self.choices = deepcopy(choices)
-        self.dimensions = len(choices)
-        self.cardinality = self.dimensions
-        choices = np.array(choices, dtype='object')
-        self._encoder = OneHotEncoder(categories=[choices], sparse=False)
-        self._encoder.fit(choices.reshape(-1, 1))
+        self.encoding = encoding
+        self.cardinality = len(choices)
+        self.dimensions = self.cardinality if encoding == 'onehot' else 1
+        self._indexes = {choice: index for index, choice in enumerate(choices)}
+        self._choices = np.empty(self.cardinality, dtype=object)
+        self._choices[:] = choices
+
+    def _encode(self, indexes):
+        """Build the search space values of the given choice indexes."""
+        indexes = np.asarray(indexes, dtype=int).reshape(-1)
+        if self.encoding == 'ordinal':
+            return ((indexes + 0.5) / self.cardinality).reshape(-1, 1)
+
+        one_hot = np.zeros((len(indexes), self.dimensions), dtype=int)
+        one_hot[np.arange(len(indexes)), indexes] = 1
+        return one_hot
+
+    def _decode(self, values):
+        """Get the choice indexes of the given search space values."""
+        values = np.asarray(values).reshape(-1, self.dimensions)
+        if self.encoding == 'ordinal':
+            indexes = (values[:, 0].astype(float) * self.cardinality).astype(int)
+            return np.clip(indexes, 0, self.cardinality - 1)
+
+        return values.argmax(axis=1)
+
+    def _is_choice(self, value):
+        try:
+            return value in self._indexes
+        except TypeError:
+            # Unhashable values can not be choices.
+            return False
 
     def _within_hyperparam_space(self, values):
-        mask = np.isin(values, self.choices)
+        values = np.asarray(values, dtype=object).reshape(-1).tolist()
+        not_in_space = [value for value in values if not self._is_choice(value)]
 
-        if not mask.all():
-            if not isinstance(values, np.ndarray):
-                values = np.asarray(values)
-
-            not_in_space = values[~mask].tolist()
+        if not_in_space:
             raise ValueError(
                 'Values found outside of the valid space {}: {}'.format(self.choices, not_in_space)
             )
@@ -92,17 +128,13 @@ class CategoricalHyperParam(BaseHyperParam):
             array([['Cat'],
                    ['Tiger']])
         """
-        if len(values.shape) == 1:
-            values = values.reshape(1, -1)
-
-        return self._encoder.inverse_transform(values.astype('object'))
+        return self._choices[self._decode(values)].reshape(-1, 1)
 
     def _transform(self, values):
         """Transform one or more categorical values.
 
         Encodes one or more categorical values in to the normalized search space of
-        :math:`[0, 1]^K` by using ``sklearn.preprocessing.OneHotEncoder`` that has been
-        fitted during the instantiation.
+        :math:`[0, 1]^K` by looking up the index of each choice and one-hot encoding it.
 
         Args:
             values (numpy.ndarray):
@@ -127,7 +159,14 @@ class CategoricalHyperParam(BaseHyperParam):
             array([[1, 0, 0],
                    [0, 0, 1]])
         """
-        return self._encoder.transform(values.astype('object')).astype(int)
+        try:
+            indexes = [self._indexes[value] for value in np.asarray(values).reshape(-1)]
+        except (KeyError, TypeError):
+            raise ValueError(
+                'Values found outside of the valid space {}: {}'.format(self.choices, values)
+            )
+
+        return self._encode(indexes)
 
     def sample(self, n_samples):
         """Generate sample values in the hyperparameter search space of ``[0, 1]^K``.
@@ -152,12 +191,56 @@ class CategoricalHyperParam(BaseHyperParam):
             array([[1, 0, 0],
                    [0, 1, 0]])
         """
-        randomized_values = np.random.random((n_samples, self.dimensions))
-        indexes = np.argmax(randomized_values, axis=1)
+        indexes = np.random.randint(self.cardinality, size=n_samples)
+
+        return self._encode(indexes)
+
+    def from_uniform(self, values):
+        """Map uniformly distributed values into the search space of ``[0, 1]^K``.
+
+        Every choice gets an interval of the same length inside ``[0, 1)``, so a single uniform
+        value is enough to select it.
+
+        Args:
+            values (numpy.ndarray):
+                2D array with shape ``(n_samples, 1)`` with values in ``[0, 1)``.
+
+        Returns:
+            numpy.ndarray:
+                2D array with shape of ``(n_samples, self.dimensions)`` with the encoded
+                choices.
+
+        Example:
+            >>> instance = CategoricalHyperParam(choices=['Cat', 'Dog', 'Tiger'])
+            >>> instance.from_uniform(np.array([[0.1], [0.9]]))
+            array([[1, 0, 0],
+                   [0, 0, 1]])
+        """
+        indexes = np.minimum((values[:, 0] * self.cardinality).astype(int), self.cardinality - 1)
+
+        return self._encode(indexes)
 
-        sampled = [self.choices[index] for index in indexes]
+    def to_index(self, values):
+        """Convert search space values into the index of their choice.
 
-        return self.transform(sampled)
+        Example:
+            >>> instance = CategoricalHyperParam(choices=['Cat', 'Dog', 'Tiger'])
+            >>> instance.to_index(np.array([[1, 0, 0], [0, 0, 1]]))
+            array([0, 2])
+        """
+        return self._decode(values)
+
+    def from_index(self, indexes):
+        """Convert choice indexes into search space values.
+
+        Example:
+            >>> instance = CategoricalHyperParam(choices=['Cat', 'Dog', 'Tiger'])
+            >>> instance.from_index(np.array([0, 2]))
+            array([[1, 0, 0],
+                   [0, 0, 1]])
+        """
+        return self._encode(indexes)
 
     def __repr__(self):
-        return 'CategoricalHyperParam(choices={}, default={})'.format(self.choices, self.default)
+        return 'CategoricalHyperParam(choices={}, default={}, encoding={})'.format(
+            self.choices, self.default, self.encoding)
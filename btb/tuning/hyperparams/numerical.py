@@ -17,11 +17,21 @@ class NumericalHyperParam(BaseHyperParam):
     """
 
     dimensions = 1
+    SCALES = ('linear', 'log')
 
     def _within_range(self, values, min=0, max=1):
         if (values < min).any() or (values > max).any():
             raise ValueError('Value not within range [{}, {}]: {}'.format(min, max, values))
 
+    def _check_scale(self, scale, lower):
+        """Validate the ``scale`` given the lowest value that will be mapped to the search space.
+        """
+        if scale not in self.SCALES:
+            raise ValueError('Unknown scale {}. Use one of {}.'.format(scale, self.SCALES))
+
+        if scale == 'log' and lower <= 0:
+            raise ValueError('The ``log`` scale can only be used with positive values.')
+
 
 class FloatHyperParam(NumericalHyperParam):
     """FloatHyperParam class.
@@ -34,7 +44,8 @@ class FloatHyperParam(NumericalHyperParam):
         :math:`h_1, h_2,... h_n` where :math:`h_i = i * (max - min) + min`
 
     Search space:
-        :math:`s_1, s_2,... s_n` where :math:`s_i = (i - min) / (max - min)`
+        :math:`s_1, s_2,... s_n` where :math:`s_i = (i - min) / (max - min)`, or
+        :math:`s_i = (log(i) - log(min)) / (log(max) - log(min))` for the ``log`` scale.
 
     Args:
         min (float):
@@ -54,11 +65,19 @@ class FloatHyperParam(NumericalHyperParam):
 
         include_max (bool):
             Either or not to include the maximum value in the search space.
+
+        scale (str):
+            How the values are mapped to the search space. ``linear`` maps them linearly, while
+            ``log`` maps their logarithm linearly, so every order of magnitude gets the same
+            share of the search space, which suits values like learning rates that span several
+            orders of magnitude. ``log`` can only be used when ``min`` is positive.
+            Defaults to ``linear``.
     """
 
     cardinality = np.inf
 
-    def __init__(self, min=None, max=None, default=None, include_min=True, include_max=True):
+    def __init__(self, min=None, max=None, default=None, include_min=True, include_max=True,
+                 scale='linear'):
 
         self.include_min = include_min
         self.include_max = include_max
@@ -80,6 +99,11 @@ class FloatHyperParam(NumericalHyperParam):
         self.min = float(min)
         self.max = float(max)
         self.range = max - min
+        self._check_scale(scale, self.min)
+        self.scale = scale
+        if scale == 'log':
+            self._log_min = np.log(self.min)
+            self._log_range = np.log(self.max) - self._log_min
 
     def _inverse_transform(self, values):
         """Invert one or more search space values.
@@ -110,6 +134,10 @@ class FloatHyperParam(NumericalHyperParam):
             >>> instance._inverse_transform(np.array([[0.875]]))
             array([[0.8]])
         """
+        if self.scale == 'log':
+            inverted = np.exp(values * self._log_range + self._log_min)
+            return np.clip(inverted, self.min, self.max)
+
         return values * self.range + self.min
 
     def _transform(self, values):
@@ -143,6 +171,9 @@ class FloatHyperParam(NumericalHyperParam):
             >>> instance._transform(np.array([[0.8]]))
             array([[0.875]])
         """
+        if self.scale == 'log':
+            return (np.log(values.astype(float)) - self._log_min) / self._log_range
+
         return (values - self.min) / self.range
 
     def sample(self, n_samples):
@@ -170,9 +201,26 @@ class FloatHyperParam(NumericalHyperParam):
         """
         return np.random.random((n_samples, self.dimensions))
 
+    def from_uniform(self, values):
+        """Map uniformly distributed values into the search space :math:`{0, 1}`.
+
+        The search space of a ``FloatHyperParam`` is already uniform, so the values are
+        returned as they are.
+
+        Args:
+            values (numpy.ndarray):
+                2D array with shape ``(n_samples, 1)`` with values in ``[0, 1)``.
+
+        Returns:
+            numpy.ndarray:
+                2D array with shape of ``(n_samples, 1)`` with values inside the search space.
+        """
+        return values
+
     def __repr__(self):
-        args = (self.min, self.max, self.default, self.include_min, self.include_max)
-        args = 'min={}, max={}, default={}, include_min={}, include_max={}'.format(*args)
+        args = (self.min, self.max, self.default, self.include_min, self.include_max, self.scale)
+        args = 'min={}, max={}, default={}, include_min={}, include_max={}, scale={}'.format(
+            *args)
         return 'FloatHyperParam({})'.format(args)
 
 
@@ -188,6 +236,9 @@ class IntHyperParam(NumericalHyperParam):
 
     Search space:
         :math:`s_1, s_2,... s_n` where :math:`s_i = \\frac{interval}{2} + (i - 1) * interval`
+        for the ``linear`` scale. For the ``log`` scale every value :math:`h_i` gets the
+        interval between :math:`log(h_i - step / 2)` and :math:`log(h_i + step / 2)`,
+        normalized to :math:`[0, 1]`.
 
     Args:
         min (int):
@@ -210,12 +261,18 @@ class IntHyperParam(NumericalHyperParam):
 
         include_max (bool):
             Either or not to include the maximum value in the search space.
+
+        scale (str):
+            How the values are mapped to the search space. ``linear`` gives the same share of
+            the search space to every value, while ``log`` gives the same share to every order
+            of magnitude. ``log`` can only be used when ``min`` is bigger than ``step / 2``.
+            Defaults to ``linear``.
     """
 
     dimensions = 1
 
     def __init__(self, min=None, max=None, default=None,
-                 include_min=True, include_max=True, step=1):
+                 include_min=True, include_max=True, step=1, scale='linear'):
 
         self.include_min = include_min
         self.include_max = include_max
@@ -245,6 +302,12 @@ class IntHyperParam(NumericalHyperParam):
             )
 
         self.interval = self.step / (self.max - self.min + self.step)
+        self._check_scale(scale, self.min - self.step / 2)
+        self.scale = scale
+        if scale == 'log':
+            # Every value gets the interval between its rounding boundaries in log space.
+            self._log_min = np.log(self.min - self.step / 2)
+            self._log_range = np.log(self.max + self.step / 2) - self._log_min
 
     def _inverse_transform(self, values):
         """Invert one or more search space values.
@@ -276,13 +339,18 @@ class IntHyperParam(NumericalHyperParam):
             >>> instance._inverse_trasnfrom(np.array([[0.625]]))
             array([[3]])
         """
-        unscaled_values = values / self.interval - 0.5 + self.min
-        rounded = unscaled_values.round()
+        if self.scale == 'log':
+            unscaled_values = np.exp(values * self._log_range + self._log_min)
+        else:
+            unscaled_values = (values / self.interval - 0.5) * self.step + self.min
+
+        # Round only once, so every value keeps the interval ``(h - step / 2, h + step / 2]``
+        indexes = np.ceil((unscaled_values - self.min) / self.step - 0.5)
 
         # Restrict to make sure that we stay within the valid range
-        restricted = np.minimum(np.maximum(rounded, self.min), self.max)
+        indexes = np.clip(indexes, 0, self.cardinality - 1)
 
-        return restricted.astype(int)
+        return (indexes * self.step + self.min).astype(int)
 
     def _transform(self, values):
         """Transform one or more hyperparameter values.
@@ -315,6 +383,9 @@ class IntHyperParam(NumericalHyperParam):
             >>> instance._trasnfrom(np.array([[3]]))
             array([[0.625]])
         """
+        if self.scale == 'log':
+            return (np.log(values.astype(float)) - self._log_min) / self._log_range
+
         return ((values - self.min) / self.step + 0.5) * self.interval
 
     def sample(self, n_samples):
@@ -341,11 +412,61 @@ class IntHyperParam(NumericalHyperParam):
                    [0.375]])
         """
         sampled = np.random.random((n_samples, self.dimensions))
-        inverted = self._inverse_transform(sampled)
+
+        return self.from_uniform(sampled)
+
+    def from_uniform(self, values):
+        """Map uniformly distributed values into the search space.
+
+        Every integer value gets an interval of the same length inside ``[0, 1)``, and the
+        values are snapped to the center of their interval.
+
+        Args:
+            values (numpy.ndarray):
+                2D array with shape ``(n_samples, 1)`` with values in ``[0, 1)``.
+
+        Returns:
+            numpy.ndarray:
+                2D array with shape of ``(n_samples, 1)`` with values inside the search space.
+
+        Example:
+            >>> instance = IntHyperParam(min=1, max=4)
+            >>> instance.from_uniform(np.array([[0.1], [0.6]]))
+            array([[0.125],
+                   [0.625]])
+        """
+        inverted = self._inverse_transform(values)
 
         return self._transform(inverted)
 
+    def to_index(self, values):
+        """Convert search space values into the position of their value inside the range.
+
+        Example:
+            >>> instance = IntHyperParam(min=1, max=4)
+            >>> instance.to_index(np.array([[0.125], [0.875]]))
+            array([0, 3])
+        """
+        inverted = self._inverse_transform(np.asarray(values, dtype=float)[:, :1])
+        return ((inverted[:, 0] - self.min) // self.step).astype(np.int64)
+
+    def from_index(self, indexes):
+        """Convert value positions into search space values.
+
+        Example:
+            >>> instance = IntHyperParam(min=1, max=4)
+            >>> instance.from_index(np.array([0, 3]))
+            array([[0.125],
+                   [0.875]])
+        """
+        if self.scale == 'log':
+            values = np.asarray(indexes).reshape(-1, 1) * self.step + self.min
+            return self._transform(values)
+
+        return ((np.asarray(indexes).reshape(-1, 1) + 0.5) * self.interval)
+
     def __repr__(self):
-        args = (self.min, self.max, self.default, self.include_min, self.include_max, self.step)
-        args = 'min={}, max={}, default={}, include_min={}, include_max={}, step={}'.format(*args)
+        template = 'min={}, max={}, default={}, include_min={}, include_max={}, step={}, scale={}'
+        args = template.format(self.min, self.max, self.default, self.include_min,
+                               self.include_max, self.step, self.scale)
         return 'IntHyperParam({})'.format(args)
@@ -2,6 +2,14 @@
 
 """Top level where all the metamodels are imported."""
 
-from btb.tuning.metamodels.gaussian_process import GaussianProcessMetaModel
+from btb.tuning.metamodels.gaussian_process import (
+    GaussianProcessMetaModel, IncrementalGaussianProcessMetaModel, SparseGaussianProcessMetaModel)
+from btb.tuning.metamodels.random_forest import ExtraTreesMetaModel, RandomForestMetaModel
 
-__all__ = ('GaussianProcessMetaModel', )
+__all__ = (
+    'ExtraTreesMetaModel',
+    'GaussianProcessMetaModel',
+    'IncrementalGaussianProcessMetaModel',
+    'RandomForestMetaModel',
+    'SparseGaussianProcessMetaModel',
+)
@@ -24,12 +24,16 @@ class BaseMetaModel(metaclass=ABCMeta):
             order to be able to give or set arguments for the model.
         _model (object):
             Instance of ``self._MODEL_CLASS``, defaults to ``None``.
+        _categorical_dimensions (array-like):
+            Columns of the search space that hold the index of a categorical value, and whose
+            distances are therefore meaningless. Defaults to no columns.
     """
 
     _MODEL_CLASS = None
     _MODEL_KWARGS_DEFAULT = None
     _model_kwargs = None
     _model_instance = None
+    _categorical_dimensions = ()
 
     def __init_metamodel__(self, **kwargs):
         pass
@@ -4,12 +4,72 @@ import numpy
 import scipy
 from copulas import EPSILON
 from copulas.univariate import Univariate
+from scipy.linalg import solve_triangular
+from scipy.spatial.distance import cdist
 from sklearn.gaussian_process import GaussianProcessRegressor
 from sklearn.gaussian_process.kernels import RBF
 
 from btb.tuning.metamodels.base import BaseMetaModel
 
 
+class CategoricalRBF(RBF):
+    """Radial-basis function kernel that compares some of the columns as categories.
+
+    The squared distance along the ``categorical`` columns is ``0`` when the values are equal
+    and ``1`` otherwise, regardless of how far the values are, so the arbitrary order of the
+    indexes of a categorical hyperparameter does not leak into the kernel. The rest of the
+    columns are compared like in the ``RBF`` kernel.
+
+    Args:
+        length_scale (float or array):
+            Length scale of the kernel. If an array, one length scale per column.
+        length_scale_bounds (pair of floats >= 0 or "fixed"):
+            The lower and upper bound on ``length_scale``.
+        categorical (array-like):
+            Indexes of the columns that hold categorical values.
+    """
+
+    def __init__(self, length_scale=1.0, length_scale_bounds=(1e-5, 1e5), categorical=()):
+        super().__init__(length_scale=length_scale, length_scale_bounds=length_scale_bounds)
+        self.categorical = categorical
+
+    def __call__(self, X, Y=None, eval_gradient=False):
+        X = numpy.atleast_2d(X)
+        if eval_gradient and Y is not None:
+            raise ValueError('Gradient can only be evaluated when Y is None.')
+
+        Y = X if Y is None else numpy.atleast_2d(Y)
+        num_columns = X.shape[1]
+        length_scale = numpy.broadcast_to(numpy.asarray(self.length_scale, float), num_columns)
+        categorical = numpy.zeros(num_columns, dtype=bool)
+        categorical[numpy.asarray(self.categorical, dtype=int)] = True
+
+        continuous = ~categorical
+        distances = cdist(
+            X[:, continuous] / length_scale[continuous],
+            Y[:, continuous] / length_scale[continuous],
+            metric='sqeuclidean'
+        )
+        for column in numpy.flatnonzero(categorical):
+            distances += (X[:, column, None] != Y[None, :, column]) / length_scale[column] ** 2
+
+        kernel = numpy.exp(-0.5 * distances)
+        if not eval_gradient:
+            return kernel
+
+        if self.hyperparameter_length_scale.fixed:
+            return kernel, numpy.empty((len(X), len(X), 0))
+
+        if not self.anisotropic:
+            return kernel, (kernel * distances)[:, :, numpy.newaxis]
+
+        gradient = (X[:, numpy.newaxis, :] - X[numpy.newaxis, :, :]) ** 2
+        gradient[:, :, categorical] = gradient[:, :, categorical] > 0
+        gradient /= length_scale ** 2
+
+        return kernel, kernel[:, :, numpy.newaxis] * gradient
+
+
 class GaussianProcessMetaModel(BaseMetaModel):
     """GaussianProcessMetaModel class.
 
@@ -34,7 +94,11 @@ class GaussianProcessMetaModel(BaseMetaModel):
         if self._model_kwargs is None:
             self._model_kwargs = {}
 
-        self._model_kwargs['kernel'] = RBF(length_scale=length_scale)
+        if len(self._categorical_dimensions):
+            self._model_kwargs['kernel'] = CategoricalRBF(
+                length_scale=length_scale, categorical=self._categorical_dimensions)
+        else:
+            self._model_kwargs['kernel'] = RBF(length_scale=length_scale)
 
     def _predict(self, candidates):
         predictions = self._model_instance.predict(candidates, return_std=True)
@@ -98,3 +162,234 @@ class GaussianCopulaProcessMetaModel(GaussianProcessMetaModel):
         predicted = super()._predict(trans_candidates)
 
         return self._score_distribution.ppf(scipy.stats.norm.cdf(predicted))
+
+
+class IncrementalGaussianProcessMetaModel(GaussianProcessMetaModel):
+    """IncrementalGaussianProcessMetaModel class.
+
+    This class represents a meta-model that uses the same ``GaussianProcessRegressor`` as
+    ``GaussianProcessMetaModel`` to optimize the kernel hyperparameters, but which updates
+    the Cholesky factor of the kernel matrix with rank-one updates when new trials are
+    appended instead of refitting the model from scratch every time.
+
+    The kernel hyperparameters are only re-optimized, fitting a new ``GaussianProcessRegressor``,
+    every ``refit_every`` new trials or, if ``llh_tolerance`` is given, as soon as the
+    log-likelihood per trial drifts more than ``llh_tolerance`` from the one obtained after the
+    last optimization. In between, the cost of fitting ``n`` trials is :math:`O(n^2)` per
+    appended trial instead of :math:`O(n^3)`.
+
+    Attributes:
+        _MODEL_KWARGS (dict):
+            Dictionary with the default ``kwargs`` for the ``GaussianProcessRegressor``
+            instantiation.
+        _MODEL_CLASS (type):
+            Class to be instantiated and used for the ``self._model`` instantiation. In
+            this case ``sklearn.gaussian_process.GaussainProcessRegressor``
+    """
+
+    _kernel = None
+    _noise = None
+    _chol = None
+    _alpha = None
+    _fit_trials = None
+    _fit_scores = None
+    _y_mean = 0
+    _y_std = 1
+    _optimized_trials = 0
+    _optimized_llh = None
+
+    def __init_metamodel__(self, length_scale=1, refit_every=20, llh_tolerance=None):
+        super().__init_metamodel__(length_scale=length_scale)
+        self._refit_every = refit_every
+        self._llh_tolerance = llh_tolerance
+
+    def _log_likelihood(self):
+        """Compute the log marginal likelihood per trial of the normalized scores."""
+        normalized = (self._fit_scores - self._y_mean) / self._y_std
+        log_likelihood = -0.5 * normalized.dot(self._alpha)
+        log_likelihood -= numpy.log(numpy.diag(self._chol)).sum()
+        log_likelihood -= len(normalized) / 2 * numpy.log(2 * numpy.pi)
+
+        return log_likelihood / len(normalized)
+
+    def _solve_alpha(self):
+        normalized = (self._fit_scores - self._y_mean) / self._y_std
+        partial = solve_triangular(self._chol, normalized, lower=True, check_finite=False)
+        self._alpha = solve_triangular(self._chol.T, partial, lower=False, check_finite=False)
+
+    def _optimize(self, trials, scores):
+        """Optimize the kernel hyperparameters and factorize the whole kernel matrix."""
+        super()._fit(trials, scores)
+        self._kernel = self._model_instance.kernel_
+        self._noise = self._model_instance.alpha
+
+        self._y_mean = numpy.mean(scores)
+        self._y_std = numpy.std(scores) or 1
+        self._fit_trials = trials
+        self._fit_scores = scores
+
+        kernel = self._kernel(trials)
+        kernel[numpy.diag_indices_from(kernel)] += self._noise
+        self._chol = scipy.linalg.cholesky(kernel, lower=True, check_finite=False)
+        self._solve_alpha()
+
+        self._optimized_trials = len(trials)
+        self._optimized_llh = self._log_likelihood()
+
+    def _append(self, trials, scores):
+        """Extend the Cholesky factor with the given new trials.
+
+        Returns:
+            bool:
+                ``False`` if the kernel matrix stopped being numerically positive definite,
+                in which case the model needs to be fitted from scratch.
+        """
+        chol = self._chol
+        fit_trials = self._fit_trials
+        for trial in trials:
+            trial = trial.reshape(1, -1)
+            cross = self._kernel(fit_trials, trial)[:, 0]
+            diagonal = self._kernel.diag(trial)[0] + self._noise
+
+            row = solve_triangular(chol, cross, lower=True, check_finite=False)
+            pivot = diagonal - row.dot(row)
+            if pivot <= 0:
+                return False
+
+            size = len(chol)
+            extended = numpy.zeros((size + 1, size + 1))
+            extended[:size, :size] = chol
+            extended[size, :size] = row
+            extended[size, size] = numpy.sqrt(pivot)
+
+            chol = extended
+            fit_trials = numpy.vstack([fit_trials, trial])
+
+        self._chol = chol
+        self._fit_trials = fit_trials
+        self._fit_scores = numpy.concatenate([self._fit_scores, scores])
+        self._solve_alpha()
+
+        return True
+
+    def _fit(self, trials, scores):
+        trials = numpy.asarray(trials, dtype=float)
+        scores = numpy.asarray(scores, dtype=float).reshape(-1)
+
+        appended = False
+        num_fitted = 0 if self._fit_trials is None else len(self._fit_trials)
+        if 0 < num_fitted <= len(trials):
+            appended = numpy.array_equal(trials[:num_fitted], self._fit_trials)
+
+        if not appended or len(trials) - self._optimized_trials >= self._refit_every:
+            self._optimize(trials, scores)
+            return
+
+        if num_fitted == len(trials):
+            return
+
+        if not self._append(trials[num_fitted:], scores[num_fitted:]):
+            self._optimize(trials, scores)
+            return
+
+        if self._llh_tolerance is not None:
+            drift = abs(self._log_likelihood() - self._optimized_llh)
+            if drift > self._llh_tolerance:
+                self._optimize(trials, scores)
+
+    def _predict(self, candidates):
+        cross = self._kernel(candidates, self._fit_trials)
+        mean = cross.dot(self._alpha) * self._y_std + self._y_mean
+
+        partial = solve_triangular(self._chol, cross.T, lower=True, check_finite=False)
+        variance = self._kernel.diag(candidates) - numpy.einsum('ij,ij->j', partial, partial)
+        std = numpy.sqrt(numpy.clip(variance, 0, None)) * self._y_std
+
+        return numpy.column_stack((mean, std))
+
+
+class SparseGaussianProcessMetaModel(GaussianProcessMetaModel):
+    """SparseGaussianProcessMetaModel class.
+
+    This class represents a meta-model that approximates a Gaussian Process using ``m``
+    inducing points, following the Deterministic Training Conditional (DTC) approximation.
+
+    The inducing points are the trials with the ``num_inducing // 2`` best scores plus a random
+    selection of the rest. The kernel hyperparameters are optimized fitting a
+    ``GaussianProcessRegressor`` over the inducing points only, and afterwards all the
+    trials are used to compute the approximated posterior, which costs :math:`O(n m^2)` time and
+    :math:`O(n m)` memory instead of the :math:`O(n^3)` time and :math:`O(n^2)` memory of an
+    exact Gaussian Process. Predicting the mean costs :math:`O(m)` per candidate and the
+    standard deviation :math:`O(m^2)`.
+
+    Attributes:
+        _MODEL_KWARGS (dict):
+            Dictionary with the default ``kwargs`` for the ``GaussianProcessRegressor``
+            instantiation.
+        _MODEL_CLASS (type):
+            Class to be instantiated and used for the ``self._model`` instantiation. In
+            this case ``sklearn.gaussian_process.GaussainProcessRegressor``
+    """
+
+    _JITTER = 1e-8
+
+    def __init_metamodel__(self, length_scale=1, num_inducing=100, noise=1e-2):
+        super().__init_metamodel__(length_scale=length_scale)
+        self._model_kwargs['alpha'] = noise
+        self._num_inducing = num_inducing
+        self._noise = noise
+
+    def _select_inducing(self, scores):
+        """Select the indexes of the trials to be used as inducing points."""
+        if len(scores) <= self._num_inducing:
+            return numpy.arange(len(scores))
+
+        num_best = self._num_inducing // 2
+        order = numpy.argsort(-scores)
+        rest = numpy.random.choice(
+            order[num_best:], self._num_inducing - num_best, replace=False)
+
+        return numpy.concatenate([order[:num_best], rest])
+
+    def _fit(self, trials, scores):
+        trials = numpy.asarray(trials, dtype=float)
+        scores = numpy.asarray(scores, dtype=float).reshape(-1)
+
+        selected = self._select_inducing(scores)
+        inducing = trials[selected]
+        super()._fit(inducing, scores[selected])
+        self._kernel = self._model_instance.kernel_
+
+        self._y_mean = numpy.mean(scores)
+        self._y_std = numpy.std(scores) or 1
+        normalized = (scores - self._y_mean) / self._y_std
+
+        kernel_mm = self._kernel(inducing)
+        kernel_mm[numpy.diag_indices_from(kernel_mm)] += self._JITTER
+        self._chol_mm = scipy.linalg.cholesky(kernel_mm, lower=True, check_finite=False)
+
+        # V = L_mm^-1 K_mn and A = noise * I + V V^T
+        projected = solve_triangular(
+            self._chol_mm, self._kernel(inducing, trials), lower=True, check_finite=False)
+        posterior = projected.dot(projected.T)
+        posterior[numpy.diag_indices_from(posterior)] += self._noise
+        self._chol_a = scipy.linalg.cholesky(posterior, lower=True, check_finite=False)
+
+        weights = solve_triangular(
+            self._chol_a, projected.dot(normalized), lower=True, check_finite=False)
+        weights = solve_triangular(self._chol_a.T, weights, lower=False, check_finite=False)
+        self._weights = solve_triangular(
+            self._chol_mm.T, weights, lower=False, check_finite=False)
+        self._inducing = inducing
+
+    def _predict(self, candidates):
+        cross = self._kernel(self._inducing, candidates)
+        mean = self._weights.dot(cross) * self._y_std + self._y_mean
+
+        projected = solve_triangular(self._chol_mm, cross, lower=True, check_finite=False)
+        posterior = solve_triangular(self._chol_a, projected, lower=True, check_finite=False)
+        variance = self._kernel.diag(candidates) - numpy.einsum('ij,ij->j', projected, projected)
+        variance += self._noise * numpy.einsum('ij,ij->j', posterior, posterior)
+        std = numpy.sqrt(numpy.clip(variance, 0, None)) * self._y_std
+
+        return numpy.column_stack((mean, std))
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+"""Package where the tree ensemble metamodels are defined."""
+
+import copy
+
+import numpy as np
+from sklearn.ensemble import ExtraTreesRegressor, RandomForestRegressor
+
+from btb.tuning.metamodels.base import BaseMetaModel
+
+
+class RandomForestMetaModel(BaseMetaModel):
+    """RandomForestMetaModel class.
+
+    This class represents a meta-model using an underlying ``RandomForestRegressor`` from
+    ``sklearn.ensemble``, which predicts the mean of the predictions of its trees as the
+    expected score and their standard deviation as its uncertainty.
+
+    The trees are fitted in parallel using all the available cores. If ``trees_per_fit`` is
+    given, instead of fitting a new forest every time, the forest is warm started adding
+    ``trees_per_fit`` new trees fitted over all the trials and dropping the oldest ones, so
+    at most ``n_estimators`` trees are kept.
+
+    Attributes:
+        _MODEL_KWARGS (dict):
+            Dictionary with the default ``kwargs`` for the ``RandomForestRegressor``
+            instantiation.
+        _MODEL_CLASS (type):
+            Class to be instantiated and used for the ``self._model`` instantiation. In
+            this case ``sklearn.ensemble.RandomForestRegressor``
+        _MIN_STD (float):
+            Minimum standard deviation predicted, to avoid a null uncertainty when all the
+            trees agree.
+    """
+    _MODEL_CLASS = RandomForestRegressor
+
+    _MODEL_KWARGS_DEFAULT = {
+        'n_jobs': -1
+    }
+
+    _MIN_STD = 1e-6
+
+    def __init_metamodel__(self, n_estimators=100, trees_per_fit=None):
+        if self._model_kwargs is None:
+            self._model_kwargs = {}
+
+        self._model_kwargs['n_estimators'] = n_estimators
+        self._n_estimators = n_estimators
+        self._trees_per_fit = trees_per_fit
+
+    def _fit(self, trials, scores):
+        if self._trees_per_fit is None or self._model_instance is None:
+            super()._fit(trials, scores)
+            return
+
+        # Work on a copy, so the fitted model is never modified while it is being used.
+        model = copy.copy(self._model_instance)
+        model.estimators_ = list(model.estimators_)
+        model.set_params(
+            warm_start=True,
+            n_estimators=len(model.estimators_) + self._trees_per_fit
+        )
+        model.fit(trials, scores)
+
+        model.estimators_ = model.estimators_[-self._n_estimators:]
+        model.n_estimators = len(model.estimators_)
+        self._model_instance = model
+
+    def _predict(self, candidates):
+        predictions = np.stack([
+            estimator.predict(candidates)
+            for estimator in self._model_instance.estimators_
+        ])
+        std = np.maximum(predictions.std(axis=0), self._MIN_STD)
+
+        return np.column_stack((predictions.mean(axis=0), std))
+
+
+class ExtraTreesMetaModel(RandomForestMetaModel):
+    """ExtraTreesMetaModel class.
+
+    This class represents a meta-model using an underlying ``ExtraTreesRegressor`` from
+    ``sklearn.ensemble``, which works as ``RandomForestMetaModel`` but using extremely
+    randomized trees.
+
+    Attributes:
+        _MODEL_KWARGS (dict):
+            Dictionary with the default ``kwargs`` for the ``ExtraTreesRegressor``
+            instantiation.
+        _MODEL_CLASS (type):
+            Class to be instantiated and used for the ``self._model`` instantiation. In
+            this case ``sklearn.ensemble.ExtraTreesRegressor``
+    """
+    _MODEL_CLASS = ExtraTreesRegressor
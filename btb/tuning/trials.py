@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+"""Package where the TrialStore class is defined."""
+
+import numpy as np
+
+
+class TrialStore:
+    """TrialStore class.
+
+    The TrialStore class keeps the trials and scores recorded by a tuner in arrays that
+    double their capacity when they get full, so recording a trial costs amortized
+    :math:`O(dimensions)` instead of copying the whole history.
+
+    The ``trials``, ``raw_scores`` and ``scores`` attributes are views over the recorded part
+    of the arrays, so accessing them does not copy the data. Recorded rows are never modified
+    afterwards, so the views can be safely kept while new trials are recorded.
+
+    Args:
+        dimensions (int):
+            Number of dimensions of the trials in the search space.
+        maximize (bool):
+            If ``True`` the ``scores`` are the same as the ``raw_scores``, otherwise they are
+            negated so that bigger is always better. Defaults to ``True``.
+        capacity (int):
+            Number of trials that can be recorded before the arrays need to grow.
+            Defaults to 16.
+    """
+
+    def __init__(self, dimensions, maximize=True, capacity=16):
+        self.dimensions = dimensions
+        self.maximize = maximize
+        self._size = 0
+        self._trials = np.empty((capacity, dimensions), dtype=np.float)
+        self._raw_scores = np.empty(capacity, dtype=np.float)
+        self._scores = np.empty(capacity, dtype=np.float)
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def capacity(self):
+        """Number of trials that can be recorded before the arrays need to grow."""
+        return len(self._raw_scores)
+
+    @property
+    def trials(self):
+        """2D array of shape ``(n, dimensions)`` with the recorded trials."""
+        return self._trials[:self._size]
+
+    @property
+    def raw_scores(self):
+        """1D array with the recorded scores."""
+        return self._raw_scores[:self._size]
+
+    @property
+    def scores(self):
+        """1D array with the recorded scores, negated if ``maximize`` is ``False``."""
+        return self._scores[:self._size]
+
+    def _grow(self, size):
+        capacity = max(2 * self.capacity, size)
+
+        trials = np.empty((capacity, self.dimensions), dtype=np.float)
+        trials[:self._size] = self.trials
+        raw_scores = np.empty(capacity, dtype=np.float)
+        raw_scores[:self._size] = self.raw_scores
+        scores = np.empty(capacity, dtype=np.float)
+        scores[:self._size] = self.scores
+
+        # Replace the arrays instead of resizing them in place so that the views that
+        # were already handed out keep pointing to valid data.
+        self._trials = trials
+        self._raw_scores = raw_scores
+        self._scores = scores
+
+    def append(self, trials, scores):
+        """Record one or more trials with their scores.
+
+        Args:
+            trials (array-like):
+                2D array of shape ``(n, dimensions)`` with trials from the search space.
+            scores (array-like):
+                1D array of ``n`` raw scores.
+        """
+        trials = np.asarray(trials, dtype=np.float).reshape(-1, self.dimensions)
+        scores = np.asarray(scores, dtype=np.float).reshape(-1)
+
+        size = self._size + len(scores)
+        if size > self.capacity:
+            self._grow(size)
+
+        self._trials[self._size:size] = trials
+        self._raw_scores[self._size:size] = scores
+        self._scores[self._size:size] = scores if self.maximize else -scores
+        self._size = size
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_trials'] = self.trials.copy()
+        state['_raw_scores'] = self.raw_scores.copy()
+        state['_scores'] = self.scores.copy()
+        return state
+
+    def __repr__(self):
+        return 'TrialStore(dimensions={}, maximize={}, trials={})'.format(
+            self.dimensions, self.maximize, self._size)
+
+
+class UntriedIndex:
+    """UntriedIndex class.
+
+    The UntriedIndex class keeps the set of configuration ranks of a finite search space that
+    have not been tried yet, allowing to sample them uniformly without rejection.
+
+    The ranks are kept in a virtual permutation of ``[0, cardinality)`` where the first
+    ``len(self)`` positions hold the untried ranks. Removing a rank swaps it with the last
+    untried position, and adding it back swaps it with the first tried position, so both
+    operations are :math:`O(1)`. Only the positions that differ from the identity are stored,
+    so the memory used is proportional to the number of ranks removed and not to the
+    cardinality of the search space.
+
+    Args:
+        cardinality (int):
+            Number of possible configurations of the search space.
+    """
+
+    def __init__(self, cardinality):
+        self.cardinality = cardinality
+        self._size = cardinality
+        self._ranks = dict()
+        self._positions = dict()
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, rank):
+        return self._positions.get(rank, rank) < self._size
+
+    def _set(self, position, rank):
+        if position == rank:
+            self._ranks.pop(position, None)
+            self._positions.pop(rank, None)
+        else:
+            self._ranks[position] = rank
+            self._positions[rank] = position
+
+    def _swap(self, position, other):
+        rank = self._ranks.get(position, position)
+        other_rank = self._ranks.get(other, other)
+        self._set(position, other_rank)
+        self._set(other, rank)
+
+    def remove(self, rank):
+        """Mark a rank as tried. Nothing is done if it was already tried."""
+        position = self._positions.get(rank, rank)
+        if position < self._size:
+            self._size -= 1
+            self._swap(position, self._size)
+
+    def add(self, rank):
+        """Mark a rank as untried. Nothing is done if it was already untried."""
+        position = self._positions.get(rank, rank)
+        if position >= self._size:
+            self._swap(position, self._size)
+            self._size += 1
+
+    def sample(self, n_samples):
+        """Sample different untried ranks uniformly.
+
+        Args:
+            n_samples (int):
+                Number of ranks to sample. At most ``len(self)`` are returned.
+
+        Returns:
+            numpy.ndarray:
+                1D array with the sampled ranks.
+        """
+        n_samples = min(n_samples, self._size)
+        sampled = np.empty(n_samples, dtype=np.int64)
+        positions = np.empty(n_samples, dtype=np.int64)
+        for index in range(n_samples):
+            position = np.random.randint(self._size)
+            positions[index] = position
+            sampled[index] = self._ranks.get(position, position)
+            self._size -= 1
+            self._swap(position, self._size)
+
+        # Undo the swaps in reverse order to leave the permutation exactly as it was.
+        for position in positions[::-1]:
+            self._swap(int(position), self._size)
+            self._size += 1
+
+        return sampled
+
+    def __repr__(self):
+        return 'UntriedIndex(cardinality={}, untried={})'.format(self.cardinality, self._size)
@@ -6,6 +6,7 @@ import pandas as pd
 from btb.tuning.hyperparams.boolean import BooleanHyperParam
 from btb.tuning.hyperparams.categorical import CategoricalHyperParam
 from btb.tuning.hyperparams.numerical import FloatHyperParam, IntHyperParam
+from btb.tuning.sampling import get_sampler
 
 """Package where the Tunable class is defined."""
 
@@ -16,29 +17,226 @@ class Tunable:
     The Tunable class represents a collection of ``HyperParams`` that need to be tuned as a
     whole, at once.
 
+    Some hyperparameters may only be relevant when another one takes certain values, like the
+    ``l1_ratio`` of a model which is only used with an ``elasticnet`` penalty. These
+    hyperparameters can be made conditional on a ``CategoricalHyperParam`` or
+    ``BooleanHyperParam`` parent, which can be conditional itself, forming a tree. When a
+    hyperparameter is not active, its search space values are replaced by fixed ones, so
+    configurations that only differ in inactive hyperparameters have the same search space
+    values and are only tried once, and it is left out of the inverted configurations.
+
     Attributes:
         hyperparams:
             Dict of HyperParams.
+        conditions:
+            Dict with the conditions of the conditional hyperparameters.
         cardinality:
             Int or ``np.inf`` amount that indicates the number of combinations possible for this
-            tunable.
+            tunable. Configurations that only differ in inactive hyperparameters are counted
+            once.
 
     Args:
         hyperparams (dict):
             Dictionary object that contains the name and the hyperparameter asociated to it.
+        conditions (dict):
+            Dictionary with the names of the conditional hyperparameters as keys and, as values,
+            a dictionary with the name of their parent hyperparameter as the only key and the
+            list of parent values for which they are active as value. For example,
+            ``{'l1_ratio': {'penalty': ['elasticnet']}}``. Defaults to no conditions.
+
+    Raises:
+        ValueError:
+            If a condition has more than one parent, its parent is not a
+            ``CategoricalHyperParam`` or a ``BooleanHyperParam`` of this tunable, any of its
+            values is not valid for the parent or the conditions form a cycle.
     """
     hyperparams = None
     names = None
+    conditions = None
     dimensions = 0
     cardinality = 1
 
-    def __init__(self, hyperparams):
+    def __init__(self, hyperparams, conditions=None):
         self.hyperparams = hyperparams
         self.names = list(hyperparams)
+        self.conditions = conditions or dict()
+        self._samplers = dict()
+        self._slices = dict()
 
-        for hyperparam in hyperparams.values():
+        for name, hyperparam in hyperparams.items():
+            start = self.dimensions
             self.dimensions = self.dimensions + hyperparam.dimensions
-            self.cardinality = self.cardinality * hyperparam.cardinality
+            self._slices[name] = slice(start, self.dimensions)
+
+        self._parents = dict()
+        self._inactive_values = dict()
+        self._missing_values = dict()
+        for name, condition in self.conditions.items():
+            self._parents[name] = self._get_parent(name, condition)
+            hyperparam = self.hyperparams[name]
+            if hyperparam.default is None:
+                inactive_values = hyperparam.from_uniform(np.zeros((1, 1)))
+            else:
+                inactive_values = hyperparam.transform(hyperparam.default)
+
+            self._inactive_values[name] = inactive_values[0]
+            self._missing_values[name] = hyperparam.inverse_transform(inactive_values)[0][0]
+
+        self._conditional_names = self._sort_conditional_names()
+        self.cardinality = self._get_cardinality()
+
+    def _get_parent(self, name, condition):
+        """Validate the condition of ``name`` and get its parent and the mask of its values.
+
+        Returns:
+            tuple(str, numpy.ndarray):
+                The name of the parent and a boolean array indicating, for each index of the
+                parent values, whether ``name`` is active.
+        """
+        if name not in self.hyperparams or len(condition) != 1:
+            raise ValueError('Invalid condition for {}: {}'.format(name, condition))
+
+        parent, values = next(iter(condition.items()))
+        parent_hyperparam = self.hyperparams.get(parent)
+        if not isinstance(parent_hyperparam, (BooleanHyperParam, CategoricalHyperParam)):
+            raise ValueError(
+                'The parent of {} must be a categorical or boolean hyperparameter.'.format(name))
+
+        if not isinstance(values, (list, tuple, set)):
+            values = [values]
+
+        active = np.zeros(parent_hyperparam.cardinality, dtype=bool)
+        for value in values:
+            active[parent_hyperparam.to_index(parent_hyperparam.transform(value))] = True
+
+        return parent, active
+
+    def _sort_conditional_names(self):
+        """Sort the conditional hyperparameters so that every parent goes before its children.
+        """
+        depths = dict()
+        for name in self._parents:
+            path = [name]
+            while path[-1] in self._parents and path[-1] not in depths:
+                parent = self._parents[path[-1]][0]
+                if parent in path:
+                    raise ValueError('The conditions of {} form a cycle.'.format(name))
+
+                path.append(parent)
+
+            depth = depths.get(path[-1], 0)
+            for child in reversed(path[:-1]):
+                depth += 1
+                depths[child] = depth
+
+        return sorted(self._parents, key=depths.get)
+
+    def _get_cardinality(self, name=None):
+        """Count the configurations of the subtree of ``name``, or of the whole tunable.
+
+        Every value of a parent adds the number of configurations of the children that are
+        active with it, so the configurations that only differ in inactive hyperparameters
+        are counted once.
+        """
+        if name is None:
+            cardinality = 1
+            for root in self.names:
+                if root not in self._parents:
+                    cardinality = cardinality * self._get_cardinality(root)
+
+            return cardinality
+
+        children = [child for child, (parent, _) in self._parents.items() if parent == name]
+        if not children:
+            return self.hyperparams[name].cardinality
+
+        cardinality = 0
+        for index in range(self.hyperparams[name].cardinality):
+            configurations = 1
+            for child in children:
+                if self._parents[child][1][index]:
+                    configurations = configurations * self._get_cardinality(child)
+
+            cardinality = cardinality + configurations
+
+        return cardinality
+
+    def _get_active(self, values):
+        """Find out which conditional hyperparameters are active in the given search values.
+
+        Args:
+            values (numpy.ndarray):
+                2D array of shape ``(n, dimensions)`` with values from the search space.
+
+        Returns:
+            dict:
+                Dictionary with the names of the conditional hyperparameters as keys and 1D
+                boolean arrays indicating whether they are active in each configuration as
+                values.
+        """
+        active = dict()
+        for name in self._conditional_names:
+            parent, parent_active = self._parents[name]
+            parent_hyperparam = self.hyperparams[parent]
+            indexes = parent_hyperparam.to_index(values[:, self._slices[parent]])
+            active[name] = parent_active[indexes]
+            if parent in active:
+                active[name] &= active[parent]
+
+        return active
+
+    def impute(self, values):
+        """Replace the search space values of the inactive hyperparameters.
+
+        The values of every inactive hyperparameter are replaced with the search space values
+        of its default, or of its lowest value if it has no default, so configurations that
+        only differ in inactive hyperparameters become identical. Tunables without conditions
+        return the ``values`` unchanged.
+
+        Args:
+            values (array-like):
+                2D array of shape ``(n, dimensions)`` with values from the search space.
+
+        Returns:
+            numpy.ndarray:
+                2D array of shape ``(n, dimensions)`` with the imputed values.
+
+        Example:
+            >>> from btb.tuning.hyperparams.boolean import BooleanHyperParam
+            >>> from btb.tuning.hyperparams.numerical import FloatHyperParam
+            >>> bhp = BooleanHyperParam()
+            >>> fhp = FloatHyperParam(0, 1, default=0.5)
+            >>> tunable = Tunable({'bhp': bhp, 'fhp': fhp}, conditions={'fhp': {'bhp': True}})
+            >>> tunable.impute([[0, 0.1], [1, 0.1]])
+            array([[0. , 0.5],
+                   [1. , 0.1]])
+        """
+        if not self.conditions:
+            return values
+
+        values = np.array(values, dtype=np.float)
+        for name, active in self._get_active(values).items():
+            values[~active, self._slices[name]] = self._inactive_values[name]
+
+        return values
+
+    def _drop_inactive(self, records, values):
+        """Remove the inactive hyperparameters from the given configuration dicts."""
+        if self.conditions:
+            values = np.asarray(values, dtype=np.float)
+            for name, active in self._get_active(values).items():
+                for record, is_active in zip(records, active.tolist()):
+                    if not is_active:
+                        del record[name]
+
+        return records
+
+    @staticmethod
+    def _is_missing(hyperparam, value):
+        if isinstance(hyperparam, CategoricalHyperParam) and hyperparam._is_choice(value):
+            return False
+
+        return value is None or pd.isnull(value)
 
     def transform(self, values):
         """Transform one or more hyperparameter configurations.
@@ -46,6 +244,9 @@ class Tunable:
         Transform one or more hyperparameter configurations from the original hyperparameter
         space to the normalized search space.
 
+        The conditional hyperparameters can be missing or be ``None`` when they are not
+        active, and the values of the inactive ones are imputed.
+
         Args:
             values (pandas.DataFrame, pandas.Series, dict, list(dict), 2D array-like):
                 Values of shape ``(n, len(self.hyperparams))``.
@@ -80,30 +281,64 @@ class Tunable:
                    [0.  , 1.  , 1.  , 0.05]])
         """
         if isinstance(values, dict):
-            values = pd.DataFrame([values])
+            columns = [
+                [values.get(name) if name in self.conditions else values[name]]
+                for name in self.names
+            ]
 
         elif isinstance(values, list) and isinstance(values[0], dict):
-            values = pd.DataFrame(values, columns=self.names)
+            columns = [[value.get(name, np.nan) for value in values] for name in self.names]
 
         elif isinstance(values, list) and not isinstance(values[0], list):
-            values = pd.DataFrame([values], columns=self.names)
+            if len(values) != len(self.names):
+                raise ValueError('{} values given for {} hyperparameters.'.format(
+                    len(values), len(self.names)))
+
+            columns = [[value] for value in values]
 
-        elif isinstance(values, pd.Series):
-            values = values.to_frame().T
+        else:
+            if isinstance(values, pd.Series):
+                values = values.to_frame().T
 
-        elif not isinstance(values, pd.DataFrame):
-            values = pd.DataFrame(values, columns=self.names)
+            elif not isinstance(values, pd.DataFrame):
+                values = pd.DataFrame(values, columns=self.names)
+
+            columns = [values[name].values for name in self.names]
 
         transformed = list()
 
-        for name in self.names:
+        for name, column in zip(self.names, columns):
             hyperparam = self.hyperparams[name]
-            value = values[name].values
-            transformed.append(hyperparam.transform(value))
+            if name in self.conditions:
+                missing_value = self._missing_values[name]
+                column = [
+                    missing_value if self._is_missing(hyperparam, value) else value
+                    for value in column
+                ]
+
+            if isinstance(column, list):
+                column = self._to_column(hyperparam, column)
+
+            transformed.append(hyperparam.transform(column))
 
-        return np.concatenate(transformed, axis=1)
+        return self.impute(np.concatenate(transformed, axis=1))
 
-    def inverse_transform(self, values):
+    @staticmethod
+    def _to_column(hyperparam, values):
+        """Convert a list of hyperparameter values into a 1D array.
+
+        The dtype is inferred from the values like ``pandas`` would do, except for the
+        categorical values, which are kept as objects so that choices of different types
+        are not converted to strings.
+        """
+        if isinstance(hyperparam, CategoricalHyperParam):
+            column = np.empty(len(values), dtype=object)
+            column[:] = values
+            return column
+
+        return np.array(values)
+
+    def inverse_transform(self, values, validate=True):
         """Invert one or more hyperparameter configurations.
 
         Invert one or more hyperparameter configurations from the normalized search
@@ -114,9 +349,15 @@ class Tunable:
                 2D array of normalized values with shape ``(n, dimensions)`` where ``dimensions``
                 is the sum of dimensions from all the ``HyperParams`` that compose this
                 ``tunable``.
+            validate (bool):
+                Whether to validate that the values are within the search space. Tuners pass
+                ``False`` for the values that they generate themselves. Defaults to ``True``.
 
         Returns:
-            pandas.DataFrame
+            pandas.DataFrame:
+                A ``pandas.DataFrame`` with one column per hyperparameter, each one with the
+                dtype of the values of its hyperparameter. The inactive conditional
+                hyperparameters are ``None``.
 
         Example:
             The example below shows a simple usage of a Tunable class which will inverse transform
@@ -143,34 +384,179 @@ class Tunable:
             0  cat  False  10
             1  dog   True   1
         """
+        columns = self._inverse_transform_columns(values, validate)
+        if self.conditions:
+            for name, active in self._get_active(np.asarray(values, dtype=np.float)).items():
+                columns[name] = columns[name].astype(object)
+                columns[name][~active] = None
 
-        inverse_transform = list()
+        return pd.DataFrame(columns, columns=self.names)
 
-        for value in values:
-            transformed = list()
+    def _inverse_transform_columns(self, values, validate=True):
+        """Invert the search space values into one 1D array per hyperparameter.
 
-            for name in self.names:
-                hyperparam = self.hyperparams[name]
-                item = value[:hyperparam.dimensions]
-                transformed.append(hyperparam.inverse_transform(item))
-                value = value[hyperparam.dimensions:]
+        Every hyperparameter inverts its whole block of columns at once, so the cost does not
+        grow with the number of rows times the number of hyperparameters in python, and every
+        column keeps the dtype returned by its hyperparameter.
 
-            transformed = np.array(transformed, dtype=object)
-            inverse_transform.append(np.concatenate(transformed, axis=1))
+        Args:
+            values (array-like):
+                2D array of normalized values with shape ``(n, dimensions)``.
+            validate (bool):
+                Whether to validate that the values are within the search space.
 
-        return pd.DataFrame(np.concatenate(inverse_transform), columns=self.names)
+        Returns:
+            dict:
+                Dictionary with the hyperparameter names as keys and 1D arrays of ``n``
+                hyperparameter values as values.
 
-    def sample(self, n_samples):
+        Raises:
+            TypeError:
+                If ``values`` is not a 2D array.
+        """
+        values = np.asarray(values)
+        if values.ndim != 2:
+            raise TypeError('Values must be a 2D array of shape (n, dimensions).')
+
+        columns = dict()
+        for name in self.names:
+            hyperparam = self.hyperparams[name]
+            block = values[:, self._slices[name]]
+            inverted = hyperparam.inverse_transform(block, validate=validate)
+            columns[name] = np.asarray(inverted)[:, 0]
+
+        return columns
+
+    def inverse_transform_records(self, values, validate=True):
+        """Invert one or more hyperparameter configurations into a list of dicts.
+
+        This is equivalent to ``self.inverse_transform(values).to_dict(orient='records')``,
+        but every hyperparameter inverts its whole column block at once and no
+        ``pandas.DataFrame`` is built, which makes it much faster for the small batches
+        proposed by the tuners.
+
+        Args:
+            values (array-like):
+                2D array of normalized values with shape ``(n, dimensions)`` where ``dimensions``
+                is the sum of dimensions from all the ``HyperParams`` that compose this
+                ``tunable``.
+            validate (bool):
+                Whether to validate that the values are within the search space. Tuners pass
+                ``False`` for the values that they generate themselves. Defaults to ``True``.
+
+        Returns:
+            list(dict):
+                List of ``n`` dicts with the names of the active hyperparameters as keys and
+                their values, as python objects, as values.
+
+        Example:
+            >>> from btb.tuning.hyperparams.boolean import BooleanHyperParam
+            >>> from btb.tuning.hyperparams.numerical import IntHyperParam
+            >>> tunable = Tunable({'bhp': BooleanHyperParam(), 'ihp': IntHyperParam(1, 10)})
+            >>> tunable.inverse_transform_records([[0, 0.95], [1, 0.05]])
+            [{'bhp': False, 'ihp': 10}, {'bhp': True, 'ihp': 1}]
+        """
+        columns = self._inverse_transform_columns(values, validate)
+        columns = [columns[name].tolist() for name in self.names]
+        records = [dict(zip(self.names, row)) for row in zip(*columns)]
+
+        return self._drop_inactive(records, values)
+
+    def to_ranks(self, values):
+        """Convert search space values into the rank of the configuration they represent.
+
+        The rank of a configuration is its position in the enumeration of all the possible
+        configurations of this tunable, so every configuration gets a different integer in
+        ``[0, self.cardinality)``. Only tunables with a finite ``cardinality`` and without
+        conditions can be ranked.
+
+        Args:
+            values (array-like):
+                2D array of shape ``(n, dimensions)`` with values from the search space.
+
+        Returns:
+            numpy.ndarray:
+                1D array of ``n`` integer ranks.
+
+        Example:
+            >>> from btb.tuning.hyperparams.boolean import BooleanHyperParam
+            >>> from btb.tuning.hyperparams.categorical import CategoricalHyperParam
+            >>> chp = CategoricalHyperParam(['cat', 'dog', 'horse'])
+            >>> bhp = BooleanHyperParam()
+            >>> tunable = Tunable({'chp': chp, 'bhp': bhp})
+            >>> tunable.to_ranks([[0, 1, 0, 1], [0, 0, 1, 0]])
+            array([3, 4])
+        """
+        values = np.asarray(values, dtype=np.float)
+        ranks = np.zeros(len(values), dtype=np.int64)
+        for name in self.names:
+            hyperparam = self.hyperparams[name]
+            indexes = hyperparam.to_index(values[:, self._slices[name]])
+            ranks = ranks * hyperparam.cardinality + indexes
+
+        return ranks
+
+    def from_ranks(self, ranks):
+        """Convert configuration ranks into search space values.
+
+        This is the inverse of ``to_ranks``.
+
+        Args:
+            ranks (array-like):
+                1D array of ``n`` integer ranks.
+
+        Returns:
+            numpy.ndarray:
+                2D array of shape ``(n, dimensions)`` with values from the search space.
+
+        Example:
+            >>> from btb.tuning.hyperparams.boolean import BooleanHyperParam
+            >>> from btb.tuning.hyperparams.categorical import CategoricalHyperParam
+            >>> chp = CategoricalHyperParam(['cat', 'dog', 'horse'])
+            >>> bhp = BooleanHyperParam()
+            >>> tunable = Tunable({'chp': chp, 'bhp': bhp})
+            >>> tunable.from_ranks([3, 4])
+            array([[0., 1., 0., 1.],
+                   [0., 0., 1., 0.]])
+        """
+        ranks = np.asarray(ranks, dtype=np.int64)
+        values = np.empty((len(ranks), self.dimensions), dtype=np.float)
+        for name in reversed(self.names):
+            hyperparam = self.hyperparams[name]
+            values[:, self._slices[name]] = hyperparam.from_index(ranks % hyperparam.cardinality)
+            ranks = ranks // hyperparam.cardinality
+
+        return values
+
+    def _get_sampler(self, method):
+        """Get the sampler for the given method, creating it the first time it is used.
+
+        The samplers are kept so that successive calls continue the same sequence.
+        """
+        sampler = self._samplers.get(method)
+        if sampler is None:
+            sampler = get_sampler(method, len(self.hyperparams))
+            self._samplers[method] = sampler
+
+        return sampler
+
+    def sample(self, n_samples, method='random'):
         """Sample values in the hyperparameters space for this tunable.
 
         Args:
             n_samlpes (int):
                 Number of values to sample.
+            method (str):
+                Sampling method to use. ``random`` samples every hyperparameter independently,
+                while ``sobol``, ``halton`` and ``lhs`` generate quasi-random samples that
+                cover the search space more evenly. The quasi-random sequences continue between
+                calls, so successive batches stay space-filling. Defaults to ``random``.
 
         Returns:
             numpy.ndarray:
                 2D array with shape of ``(n_samples, dimensions)`` where ``dimensions``  is the
-                sum of dimensions from all the ``HyperParams`` that compose this ``tunable``.
+                sum of dimensions from all the ``HyperParams`` that compose this ``tunable``,
+                with the values of the inactive hyperparameters imputed.
 
         Example:
             The example below shows a simple usage of a Tunable class which will generate 2
@@ -194,18 +580,32 @@ class Tunable:
         """
         samples = list()
 
-        for name, hyperparam in self.hyperparams.items():
-            items = hyperparam.sample(n_samples)
-            samples.append(items)
+        if method == 'random':
+            for name, hyperparam in self.hyperparams.items():
+                items = hyperparam.sample(n_samples)
+                samples.append(items)
 
-        return np.concatenate(samples, axis=1)
+        else:
+            uniform = self._get_sampler(method).random(n_samples)
+            for index, hyperparam in enumerate(self.hyperparams.values()):
+                samples.append(hyperparam.from_uniform(uniform[:, index:index + 1]))
+
+        return self.impute(np.concatenate(samples, axis=1))
 
     def get_defaults(self):
-        """Return the default combination for the hyperparameters."""
-        return {
+        """Return the default combination for the hyperparameters.
+
+        The conditional hyperparameters that are not active with the defaults of their
+        parents are left out.
+        """
+        defaults = {
             name: hyperparam.default
             for name, hyperparam in self.hyperparams.items()
         }
+        if self.conditions:
+            self._drop_inactive([defaults], self.transform(defaults))
+
+        return defaults
 
     @classmethod
     def from_dict(cls, dict_hyperparams):
@@ -233,6 +633,19 @@ class Tunable:
                     - Default (str, bool, int, float or None):
                         The default value for the hyperparameter.
 
+                    - Encoding (str):
+                        Optional, only for ``CategoricalHyperParam``. ``onehot`` or ``ordinal``,
+                        the encoding used for the choices in the search space.
+
+                    - Scale (str):
+                        Optional, only for ``NumericalHyperParams``. ``linear`` or ``log``, how
+                        the values are mapped to the search space.
+
+                    - Condition (dict):
+                        Optional. Dictionary with the name of the parent hyperparameter as key
+                        and the list of its values for which this hyperparameter is active as
+                        value, like ``{'penalty': ['elasticnet']}``.
+
         Returns:
             Tunable:
                 A ``Tunable`` instance with the given hyperparameters.
@@ -242,6 +655,7 @@ class Tunable:
             raise TypeError('Hyperparams must be a dictionary.')
 
         hyperparams = {}
+        conditions = {}
 
         for name, hyperparam in dict_hyperparams.items():
             hp_type = hyperparam['type']
@@ -251,24 +665,35 @@ class Tunable:
                 hp_range = hyperparam.get('range') or hyperparam.get('values')
                 hp_min = min(hp_range) if hp_range else None
                 hp_max = max(hp_range) if hp_range else None
-                hp_instance = IntHyperParam(min=hp_min, max=hp_max, default=hp_default)
+                hp_scale = hyperparam.get('scale', 'linear')
+                hp_instance = IntHyperParam(
+                    min=hp_min, max=hp_max, default=hp_default, scale=hp_scale)
 
             elif hp_type == 'float':
                 hp_range = hyperparam.get('range') or hyperparam.get('values')
                 hp_min = min(hp_range)
                 hp_max = max(hp_range)
-                hp_instance = FloatHyperParam(min=hp_min, max=hp_max, default=hp_default)
+                hp_scale = hyperparam.get('scale', 'linear')
+                hp_instance = FloatHyperParam(
+                    min=hp_min, max=hp_max, default=hp_default, scale=hp_scale)
 
             elif hp_type == 'bool':
                 hp_instance = BooleanHyperParam(default=hp_default)
 
             elif hp_type == 'str':
                 hp_choices = hyperparam.get('range') or hyperparam.get('values')
-                hp_instance = CategoricalHyperParam(choices=hp_choices, default=hp_default)
+                hp_encoding = hyperparam.get('encoding', 'onehot')
+                hp_instance = CategoricalHyperParam(
+                    choices=hp_choices, default=hp_default, encoding=hp_encoding)
 
             hyperparams[name] = hp_instance
+            if 'condition' in hyperparam:
+                conditions[name] = hyperparam['condition']
 
-        return cls(hyperparams)
+        return cls(hyperparams, conditions)
 
     def __repr__(self):
+        if self.conditions:
+            return 'Tunable({}, conditions={})'.format(self.hyperparams, self.conditions)
+
         return 'Tunable({})'.format(self.hyperparams)
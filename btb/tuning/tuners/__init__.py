@@ -2,13 +2,28 @@
 
 """Package where all the available tuners are imported."""
 
-from btb.tuning.tuners.gaussian_process import GCPEiTuner, GCPTuner, GPEiTuner, GPTuner
+from btb.tuning.tuners.gaussian_process import (
+    GCPEiTuner, GCPTuner, GPEiTuner, GPTuner, IncrementalGPEiTuner, IncrementalGPTuner,
+    SparseGPEiTuner, SparseGPTuner)
+from btb.tuning.tuners.grid import GridTuner
+from btb.tuning.tuners.random_forest import ETEiTuner, ETTuner, RFEiTuner, RFTuner
+from btb.tuning.tuners.tpe import TPETuner
 from btb.tuning.tuners.uniform import UniformTuner
 
 __all__ = (
+    'ETEiTuner',
+    'ETTuner',
     'GCPEiTuner',
     'GCPTuner',
     'GPEiTuner',
     'GPTuner',
+    'GridTuner',
+    'IncrementalGPEiTuner',
+    'IncrementalGPTuner',
+    'RFEiTuner',
+    'RFTuner',
+    'SparseGPEiTuner',
+    'SparseGPTuner',
+    'TPETuner',
     'UniformTuner',
 )
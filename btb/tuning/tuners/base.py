@@ -2,21 +2,42 @@
 
 """Package where the BaseTuner class and BaseMetaModelTuner are defined."""
 
+import copy
 import logging
 from abc import abstractmethod
 
 import numpy as np
 
 from btb.tuning.acquisition.base import BaseAcquisition
+from btb.tuning.hyperparams.categorical import CategoricalHyperParam
+from btb.tuning.hyperparams.numerical import FloatHyperParam
 from btb.tuning.metamodels.base import BaseMetaModel
+from btb.tuning.trials import TrialStore, UntriedIndex
 
 LOGGER = logging.getLogger(__name__)
 
+# Biggest cardinality for which the configurations are tracked by their rank.
+_MAX_RANKED_CARDINALITY = 2 ** 62
+
 
 class StopTuning(Exception):
     pass
 
 
+def _fit_metamodel(metamodel, trials, scores):
+    """Fit the given metamodel over ``trials`` and ``scores``.
+
+    Defined at module level so it can be submitted to any ``concurrent.futures.Executor``,
+    including a ``ProcessPoolExecutor``.
+
+    Returns:
+        tuple:
+            The fitted metamodel and the number of trials used to fit it.
+    """
+    metamodel._fit(trials, scores)
+    return metamodel, len(trials)
+
+
 class BaseTuner:
     """BaseTuner class.
 
@@ -29,9 +50,9 @@ class BaseTuner:
             A ``numpy.ndarray`` with shape ``(n, self.tunable.dimensions)`` where ``n`` is the
             number of trials recorded.
         raw_scores (numpy.ndarray):
-            A ``numpy.ndarray`` with shape ``(n, 1)`` where ``n`` is the number of scores recorded.
+            A ``numpy.ndarray`` with shape ``(n, )`` where ``n`` is the number of scores recorded.
         scores (numpy.ndarray):
-            A ``numpy.ndarray`` with shape ``(n, 1)`` where ``n`` is the number of normalized
+            A ``numpy.ndarray`` with shape ``(n, )`` where ``n`` is the number of normalized
             scores recorded.
 
     Args:
@@ -40,20 +61,65 @@ class BaseTuner:
         maximize (bool):
             If ``True`` the scores are interpreted as bigger is better, if ``False`` then smaller
             is better. Defaults to ``True``.
+        sampling_method (str):
+            Method used to sample the search space, passed to ``Tunable.sample``. One of
+            ``random``, ``sobol``, ``halton`` or ``lhs``. Defaults to ``random``.
     """
 
-    def __init__(self, tunable, maximize=True):
+    def __init__(self, tunable, maximize=True, sampling_method='random'):
         self.tunable = tunable
-        self.trials = np.empty((0, self.tunable.dimensions), dtype=np.float)
+        self.sampling_method = sampling_method
+        self._store = TrialStore(self.tunable.dimensions, maximize)
         self._trials_set = set()
-        self.raw_scores = np.empty((0, 1), dtype=np.float)
-        self.scores = np.empty((0, 1), dtype=np.float)
+        self._pending_set = set()
         self.maximize = maximize
+
+        # Finite search spaces keep the untried configurations indexed by rank, so they
+        # can be sampled without rejection even when most of them have been tried.
+        # Conditional search spaces can not be ranked, and their configurations are
+        # identified by their imputed values instead.
+        cardinality = self.tunable.cardinality
+        self._untried = None
+        ranked = isinstance(cardinality, int) and cardinality <= _MAX_RANKED_CARDINALITY
+        if ranked and not self.tunable.conditions:
+            self._untried = UntriedIndex(cardinality)
         LOGGER.debug(
             ('Creating %s instance with %s hyperparameters and cardinality %s.'),
             self.__class__.__name__, len(self.tunable.hyperparams), self.tunable.cardinality
         )
 
+    @property
+    def trials(self):
+        return self._store.trials
+
+    @property
+    def raw_scores(self):
+        return self._store.raw_scores
+
+    @property
+    def scores(self):
+        return self._store.scores
+
+    def _get_keys(self, trials):
+        """Get the keys that identify the given search space ``trials``.
+
+        The keys are the configuration ranks if the search space is finite and small enough
+        to rank it, or tuples with the values of the trials otherwise. These keys are the ones
+        stored in ``self._trials_set`` and ``self._pending_set``.
+
+        Args:
+            trials (numpy.ndarray):
+                2D array with values from the search space.
+
+        Returns:
+            list:
+                One key for each trial.
+        """
+        if self._untried is None:
+            return list(map(tuple, trials))
+
+        return self.tunable.to_ranks(trials).tolist()
+
     def _check_proposals(self, num_proposals):
         """Validate ``num_proposals`` with ``self.tunable.cardinality`` and ``self.trials``.
 
@@ -75,7 +141,7 @@ class BaseTuner:
                 'amount of combinations.'.format(self.tunable.cardinality)
             )
 
-        num_tried = len(self._trials_set)
+        num_tried = len(self._trials_set) + len(self._pending_set)
         if num_tried == self.tunable.cardinality:
             raise StopTuning(
                 'All of the possible combinations where recorded. Use ``allow_duplicates=True``'
@@ -94,7 +160,12 @@ class BaseTuner:
         """Generate a ``numpy.ndarray`` of valid proposals.
 
         Generates ``num_proposals`` of valid combinations by generating ``proposals`` until
-        ``len(valid_proposals) == num_proposals`` different from the ones that have been recorded.
+        ``len(valid_proposals) == num_proposals`` different from the ones that have been recorded
+        or that are pending to be recorded.
+
+        If the search space is finite, the untried combinations are sampled directly from their
+        ranks when the ``random`` sampling method is used, or to complete the proposals that
+        other sampling methods could not find in their first batch.
 
         Args:
             num_proposals (int):
@@ -108,18 +179,31 @@ class BaseTuner:
                 A ``numpy.ndarray`` with shape ``(num_proposals, self.tunable.dimensions)``.
         """
         if allow_duplicates:
-            return self.tunable.sample(num_proposals)
+            return self.tunable.sample(num_proposals, self.sampling_method)
 
-        else:
-            valid_proposals = set()
+        if self._untried is not None and self.sampling_method == 'random':
+            return self.tunable.from_ranks(self._untried.sample(num_proposals))
+
+        valid_proposals = dict()
+        while len(valid_proposals) < num_proposals:
+            proposals = self.tunable.sample(num_proposals, self.sampling_method)
+            for key, proposal in zip(self._get_keys(proposals), proposals):
+                if key not in self._trials_set and key not in self._pending_set:
+                    valid_proposals.setdefault(key, proposal)
+
+            if self._untried is not None and len(valid_proposals) < num_proposals:
+                # Complete the proposals with untried ranks not selected yet.
+                for rank in valid_proposals:
+                    self._untried.remove(rank)
 
-            while len(valid_proposals) < num_proposals:
-                proposals = self.tunable.sample(num_proposals)
-                proposals = set(map(tuple, proposals))
+                ranks = self._untried.sample(num_proposals - len(valid_proposals))
+                for rank in valid_proposals:
+                    self._untried.add(rank)
 
-                valid_proposals.update(proposals - self._trials_set)
+                for rank, proposal in zip(ranks.tolist(), self.tunable.from_ranks(ranks)):
+                    valid_proposals[rank] = proposal
 
-            return np.asarray(list(valid_proposals))[:num_proposals]
+        return np.asarray(list(valid_proposals.values()))[:num_proposals]
 
     @abstractmethod
     def _propose(self, num_proposals, allow_duplicates):
@@ -199,14 +283,48 @@ class BaseTuner:
 
         proposed = self._propose(n, allow_duplicates)
 
-        hyperparameters = self.tunable.inverse_transform(proposed)
-        hyperparameters = hyperparameters.to_dict(orient='records')
+        # The proposals are generated by the tuner, so they are valid by construction.
+        hyperparameters = self.tunable.inverse_transform_records(proposed, validate=False)
 
         if n == 1:
             hyperparameters = hyperparameters[0]
 
         return hyperparameters
 
+    def mark_pending(self, trials):
+        """Mark one or more ``trials`` as pending to be recorded.
+
+        Pending trials are being evaluated somewhere else, so they are considered as already
+        tried and they will not be proposed again when ``allow_duplicates`` is ``False``.
+        They stop being pending once they are recorded or cleared.
+
+        Args:
+            trials (pandas.DataFrame, pandas.Series, dict, list(dict), 2D array-like):
+                Values of shape ``(n, len(self.tunable.hyperparameters))`` or dict with keys that
+                are ``self.tunable.names``.
+        """
+        keys = self._get_keys(self.tunable.transform(trials))
+        keys = [key for key in keys if key not in self._trials_set]
+        self._pending_set.update(keys)
+        if self._untried is not None:
+            for key in keys:
+                self._untried.remove(key)
+
+    def clear_pending(self, trials):
+        """Stop considering one or more ``trials`` as pending without recording them.
+
+        Args:
+            trials (pandas.DataFrame, pandas.Series, dict, list(dict), 2D array-like):
+                Values of shape ``(n, len(self.tunable.hyperparameters))`` or dict with keys that
+                are ``self.tunable.names``.
+        """
+        keys = self._get_keys(self.tunable.transform(trials))
+        keys = [key for key in keys if key in self._pending_set]
+        self._pending_set.difference_update(keys)
+        if self._untried is not None:
+            for key in keys:
+                self._untried.add(key)
+
     def record(self, trials, scores):
         """Record one or more ``trials`` with the associated ``scores``.
 
@@ -252,10 +370,13 @@ class BaseTuner:
         if len(trials) != len(scores):
             raise ValueError('The amount of trials must be equal to the amount of scores.')
 
-        self.trials = np.append(self.trials, trials, axis=0)
-        self._trials_set.update(map(tuple, trials))
-        self.raw_scores = np.append(self.raw_scores, scores)
-        self.scores = self.raw_scores if self.maximize else -self.raw_scores
+        self._store.append(trials, scores)
+        recorded = self._get_keys(trials)
+        self._trials_set.update(recorded)
+        self._pending_set.difference_update(recorded)
+        if self._untried is not None:
+            for key in recorded:
+                self._untried.remove(key)
 
     def __str__(self):
         return (
@@ -286,7 +407,7 @@ class BaseMetaModelTuner(BaseTuner, BaseMetaModel, BaseAcquisition):
             A ``numpy.ndarray`` with shape ``(n, self.tunable.dimensions)`` where ``n`` is the
             number of trials recorded.
         scores (numpy.ndarray):
-            A ``numpy.ndarray`` with shape ``(n, 1)`` where ``n`` is the number of scores recorded.
+            A ``numpy.ndarray`` with shape ``(n, )`` where ``n`` is the number of scores recorded.
 
     Args:
         tunable (btb.tuning.tunable.Tunable):
@@ -300,15 +421,50 @@ class BaseMetaModelTuner(BaseTuner, BaseMetaModel, BaseAcquisition):
         min_trials (int):
             Number of recorded ``trials`` needed to perform a fitting over the model.
             Defaults to 5.
+        fit_executor (concurrent.futures.Executor):
+            If given, the model is fitted in the background on this executor while new
+            trials are being scored, and the proposals are generated with the latest model
+            that finished fitting. Defaults to ``None``, which fits the model synchronously
+            every time that new trials are recorded.
+        max_staleness (int):
+            Maximum number of recorded trials that the model used to generate proposals can
+            be missing when fitting in the background. If the latest model is more stale than
+            this, ``propose`` waits for the fit that is running. Defaults to 1.
+        local_search_starts (int):
+            Number of best candidates that are refined with a local search over the ``float``
+            hyperparameters before selecting the proposals. The other hyperparameters keep the
+            sampled values. Defaults to 0, which disables the local search.
+        local_search_iterations (int):
+            Maximum number of steps of the local search. Each step predicts the neighbours of
+            all the candidates being refined at once. Defaults to 10.
+        local_search_step (float):
+            Initial step size of the local search, in the normalized search space. It is halved
+            every time that a candidate has no better neighbour. Defaults to 0.1.
+        sampling_method (str):
+            Method used to sample the candidates and the initial proposals, passed to
+            ``Tunable.sample``. One of ``random``, ``sobol``, ``halton`` or ``lhs``.
+            Defaults to ``random``.
     """
 
     _metamodel_kwargs = None
     _acquisition_kwargs = None
-
-    def __init__(self, tunable, maximize=True, num_candidates=1000, min_trials=5):
+    _fit_executor = None
+    _fit_future = None
+    _metamodel = None
+    _metamodel_trials = 0
+
+    def __init__(self, tunable, maximize=True, num_candidates=1000, min_trials=5,
+                 fit_executor=None, max_staleness=1, local_search_starts=0,
+                 local_search_iterations=10, local_search_step=0.1, sampling_method='random'):
         self.num_candidates = num_candidates
         self.min_trials = min_trials
-        super().__init__(tunable, maximize)
+        self.max_staleness = max_staleness
+        self.local_search_starts = local_search_starts
+        self.local_search_iterations = local_search_iterations
+        self.local_search_step = local_search_step
+        self._fit_executor = fit_executor
+        super().__init__(tunable, maximize, sampling_method)
+        self._categorical_dimensions = self._get_categorical_dimensions()
         self.__init_metamodel__(**(self._metamodel_kwargs or dict()))
         self.__init_acquisition__(**(self._acquisition_kwargs or dict()))
 
@@ -320,15 +476,146 @@ class BaseMetaModelTuner(BaseTuner, BaseMetaModel, BaseAcquisition):
 
         num_samples = num_proposals * self.num_candidates
         if not allow_duplicates:
-            remaining = self.tunable.cardinality - len(self._trials_set)
+            remaining = self.tunable.cardinality - len(self._trials_set) - len(self._pending_set)
             num_samples = min(remaining, num_samples)
 
-        proposals = self._sample(num_samples, allow_duplicates)
+        if self._fit_executor is None:
+            proposals = self._sample(num_samples, allow_duplicates)
+            predicted = self._predict(proposals)
+            if self.local_search_starts:
+                proposals, predicted = self._local_search(
+                    self, proposals, predicted, allow_duplicates)
+
+            index = self._acquire(predicted, num_proposals)
+
+            return proposals[index]
+
+        metamodel = self._get_metamodel()
+        if metamodel is None:
+            LOGGER.debug('The model is still being fitted, generating random proposal.')
+            proposals = self._sample(num_proposals, allow_duplicates)
+
+        else:
+            proposals = self._sample(num_samples, allow_duplicates)
+            predicted = metamodel._predict(proposals)
+            if self.local_search_starts:
+                proposals, predicted = self._local_search(
+                    metamodel, proposals, predicted, allow_duplicates)
+
+            proposals = proposals[self._acquire(predicted, num_proposals)]
+
+        # Fit the model over the latest trials while the proposals are being scored.
+        self._start_fit()
+
+        return proposals
+
+    def _get_continuous_dimensions(self):
+        """Get the search space columns that belong to ``float`` hyperparameters."""
+        dimensions = list()
+        start = 0
+        for name in self.tunable.names:
+            hyperparam = self.tunable.hyperparams[name]
+            if isinstance(hyperparam, FloatHyperParam):
+                dimensions.append(start)
 
-        predicted = self._predict(proposals)
-        index = self._acquire(predicted, num_proposals)
+            start += hyperparam.dimensions
 
-        return proposals[index]
+        return np.array(dimensions, dtype=int)
+
+    def _get_categorical_dimensions(self):
+        """Get the search space columns that hold ``ordinal`` encoded categorical values."""
+        dimensions = list()
+        start = 0
+        for name in self.tunable.names:
+            hyperparam = self.tunable.hyperparams[name]
+            if isinstance(hyperparam, CategoricalHyperParam) and hyperparam.encoding == 'ordinal':
+                dimensions.append(start)
+
+            start += hyperparam.dimensions
+
+        return np.array(dimensions, dtype=int)
+
+    def _local_search(self, metamodel, candidates, predicted, allow_duplicates):
+        """Refine the best candidates with a compass search over the continuous dimensions.
+
+        The ``self.local_search_starts`` candidates with the highest acquisition value are
+        moved, one step at a time, to the best of their neighbours along the continuous
+        dimensions while that improves their acquisition value. The neighbours of all the
+        candidates are predicted in a single call to the metamodel, so the cost of the search
+        is ``self.local_search_iterations`` predictions of ``2 * len(dimensions)`` points per
+        candidate, regardless of ``self.num_candidates``.
+
+        Args:
+            metamodel (BaseMetaModel):
+                Fitted metamodel used to predict the candidates.
+            candidates (numpy.ndarray):
+                2D array with the sampled candidates.
+            predicted (numpy.ndarray):
+                Predictions of the metamodel for the candidates.
+            allow_duplicates (bool):
+                If ``False``, the refined candidates that have already been tried or are pending
+                are discarded in favour of the sampled ones.
+
+        Returns:
+            tuple(numpy.ndarray, numpy.ndarray):
+                The candidates and their predictions, with the best ones replaced by their
+                refined versions.
+        """
+        dimensions = self._get_continuous_dimensions()
+        if not len(dimensions) or not len(candidates):
+            return candidates, predicted
+
+        values = self._score(predicted)
+        num_starts = min(self.local_search_starts, len(candidates))
+        starts = self._get_max_candidates(values, num_starts)
+
+        points = candidates[starts].astype(float)
+        points_predicted = predicted[starts]
+        points_values = values[starts]
+        steps = np.full(num_starts, float(self.local_search_step))
+
+        num_neighbours = 2 * len(dimensions)
+        directions = np.concatenate([np.eye(len(dimensions)), -np.eye(len(dimensions))])
+        for _ in range(self.local_search_iterations):
+            neighbours = np.repeat(points[:, np.newaxis], num_neighbours, axis=1)
+            neighbours[:, :, dimensions] += steps[:, np.newaxis, np.newaxis] * directions
+            np.clip(neighbours, 0, 1, out=neighbours)
+
+            # Moving along an inactive hyperparameter does not change the configuration.
+            neighbours = self.tunable.impute(
+                neighbours.reshape(-1, points.shape[1])).reshape(neighbours.shape)
+
+            neighbours_predicted = metamodel._predict(neighbours.reshape(-1, points.shape[1]))
+            neighbours_values = self._score(neighbours_predicted).reshape(num_starts, -1)
+            neighbours_predicted = neighbours_predicted.reshape(
+                (num_starts, num_neighbours) + neighbours_predicted.shape[1:])
+
+            best = neighbours_values.argmax(axis=1)
+            best_values = neighbours_values[np.arange(num_starts), best]
+            improved = best_values > points_values
+
+            points[improved] = neighbours[improved, best[improved]]
+            points_predicted[improved] = neighbours_predicted[improved, best[improved]]
+            points_values[improved] = best_values[improved]
+            steps[~improved] /= 2
+
+        candidates = candidates.astype(float)
+        predicted = predicted.copy()
+        if allow_duplicates:
+            candidates[starts] = points
+            predicted[starts] = points_predicted
+            return candidates, predicted
+
+        refined = set()
+        keys = self._get_keys(points)
+        for start, key, point, point_predicted in zip(starts, keys, points, points_predicted):
+            used = key in self._trials_set or key in self._pending_set
+            if not used and key not in refined:
+                refined.add(key)
+                candidates[start] = point
+                predicted[start] = point_predicted
+
+        return candidates, predicted
 
     def record(self, trials, scores):
         """Record one or more ``trials`` with the associated ``scores`` and re-fit the model.
@@ -371,6 +658,61 @@ class BaseMetaModelTuner(BaseTuner, BaseMetaModel, BaseAcquisition):
             >>> tuner.record(trials, scores)
         """
         super().record(trials, scores)
-        if len(self.trials) >= self.min_trials:
+        if self._fit_executor is None and len(self.trials) >= self.min_trials:
             LOGGER.debug('Fitting the model with %s samples.' % len(self.trials))
             self._fit(self.trials, self.scores)
+            self._metamodel_trials = len(self.trials)
+
+    @property
+    def staleness(self):
+        """Number of recorded trials not used to fit the model used to generate proposals."""
+        return len(self.trials) - self._metamodel_trials
+
+    def _start_fit(self):
+        """Start fitting a copy of the metamodel in the background.
+
+        The copy is fitted over all the recorded trials using the ``self._fit_executor``. Nothing
+        is done if there is a fit already running or if the latest model is not stale.
+
+        The latest fitted model is the one copied, if there is any, so metamodels that can be
+        updated incrementally keep their state between fits.
+        """
+        if self._fit_future is None and self.staleness > 0:
+            LOGGER.debug('Fitting the model with %s samples in the background.', len(self.trials))
+            metamodel = copy.copy(self._metamodel or self)
+            self._fit_future = self._fit_executor.submit(
+                _fit_metamodel, metamodel, self.trials, self.scores)
+
+    def _refresh_metamodel(self, wait=False):
+        """Collect the model fitted in the background once it is ready.
+
+        Args:
+            wait (bool):
+                Whether to wait for the running fit to finish. Defaults to ``False``.
+        """
+        if self._fit_future is not None and (wait or self._fit_future.done()):
+            future = self._fit_future
+            self._fit_future = None
+            self._metamodel, self._metamodel_trials = future.result()
+
+    def _get_metamodel(self):
+        """Get the latest fitted model, waiting for a new one if it is more stale than allowed.
+
+        Returns:
+            BaseMetaModel or None:
+                Fitted copy of the metamodel, or ``None`` if no model has been fitted yet and
+                the staleness bound allows proposing without it.
+        """
+        self._refresh_metamodel()
+        while self.staleness > self.max_staleness:
+            self._start_fit()
+            self._refresh_metamodel(wait=True)
+
+        return self._metamodel
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_fit_executor', None)
+        state.pop('_fit_future', None)
+        state.pop('_metamodel', None)
+        return state
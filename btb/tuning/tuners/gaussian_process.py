@@ -5,7 +5,8 @@
 from btb.tuning.acquisition.expected_improvement import ExpectedImprovementAcquisition
 from btb.tuning.acquisition.predicted_score import PredictedScoreAcquisition
 from btb.tuning.metamodels.gaussian_process import (
-    GaussianCopulaProcessMetaModel, GaussianProcessMetaModel)
+    GaussianCopulaProcessMetaModel, GaussianProcessMetaModel, IncrementalGaussianProcessMetaModel,
+    SparseGaussianProcessMetaModel)
 from btb.tuning.tuners.base import BaseMetaModelTuner
 
 
@@ -17,7 +18,7 @@ class GPTuner(GaussianProcessMetaModel, PredictedScoreAcquisition, BaseMetaModel
     from the model.
     """
     def __init__(self, tunable, maximize=True, num_candidates=1000,
-                 min_trials=5, length_scale=0.1):
+                 min_trials=5, length_scale=0.1, **kwargs):
         """Create an instance of ``GPTuner``.
 
         Args:
@@ -34,9 +35,12 @@ class GPTuner(GaussianProcessMetaModel, PredictedScoreAcquisition, BaseMetaModel
                 Defaults to 2.
             length_scale (float or array):
                 A float or array with shape ``(n_features,)``, used for the default ``RBF`` kernel.
+            **kwargs:
+                Additional arguments for ``BaseMetaModelTuner``, like ``fit_executor`` and
+                ``max_staleness``.
         """
         self._metamodel_kwargs = {'length_scale': length_scale}
-        super().__init__(tunable, maximize, num_candidates, min_trials)
+        super().__init__(tunable, maximize, num_candidates, min_trials, **kwargs)
 
     def __repr__(self):
         length_scale = self._metamodel_kwargs.get('length_scale')
@@ -54,7 +58,7 @@ class GPEiTuner(GaussianProcessMetaModel, ExpectedImprovementAcquisition, BaseMe
     predicted from the model.
     """
     def __init__(self, tunable, maximize=True, num_candidates=1000,
-                 min_trials=5, length_scale=0.1):
+                 min_trials=5, length_scale=0.1, **kwargs):
         """Create an instance of ``GPEiTuner``.
 
         Args:
@@ -71,10 +75,13 @@ class GPEiTuner(GaussianProcessMetaModel, ExpectedImprovementAcquisition, BaseMe
                 Defaults to 2.
             length_scale (float or array):
                 A float or array with shape ``(n_features,)``, used for the default ``RBF`` kernel.
+            **kwargs:
+                Additional arguments for ``BaseMetaModelTuner``, like ``fit_executor`` and
+                ``max_staleness``.
         """
         self.length_scale = length_scale
         self._metamodel_kwargs = {'length_scale': self.length_scale}
-        super().__init__(tunable, maximize, num_candidates, min_trials)
+        super().__init__(tunable, maximize, num_candidates, min_trials, **kwargs)
 
     def __repr__(self):
         length_scale = self._metamodel_kwargs.get('length_scale')
@@ -112,3 +119,224 @@ class GCPEiTuner(GaussianCopulaProcessMetaModel, GPEiTuner):
         return ('GCPEiTuner(tunable={}, maximize={}, '
                 'num_candidates={}, min_trials={}, '
                 'length_scale={})').format(*args)
+
+
+class IncrementalGPTuner(IncrementalGaussianProcessMetaModel, PredictedScoreAcquisition,
+                         BaseMetaModelTuner):
+    """Incremental Gaussian Process Tuner.
+
+    This class uses an ``IncrementalGaussianProcessMetaModel``, which extends the Cholesky
+    factor of the kernel matrix when new trials are recorded and only re-optimizes the kernel
+    hyperparameters periodically, using a ``numpy.argmax`` function to return the better
+    configurations predicted from the model.
+    """
+
+    def __init__(self, tunable, maximize=True, num_candidates=1000, min_trials=5,
+                 length_scale=0.1, refit_every=20, llh_tolerance=None, **kwargs):
+        """Create an instance of ``IncrementalGPTuner``.
+
+        Args:
+            tunable (btb.tuning.tunable.Tunable):
+                Instance of a tunable class containing hyperparameters to be tuned.
+            num_candidates (int):
+                Number of samples to generate and select the best of it for each proposal.
+                Defaults to 1000.
+            maximize (bool):
+                If ``True`` the model will understand that the score bigger is better, if ``False``
+                the smaller is better. Defaults to ``True``.
+            min_trials (int):
+                Number of recorded ``trials`` needed to perform a fitting over the model.
+                Defaults to 5.
+            length_scale (float or array):
+                A float or array with shape ``(n_features,)``, used for the default ``RBF`` kernel.
+            refit_every (int):
+                Number of recorded ``trials`` after which the kernel hyperparameters are
+                re-optimized. Defaults to 20.
+            llh_tolerance (float):
+                If given, the kernel hyperparameters are also re-optimized when the
+                log-likelihood per trial drifts more than this from the one obtained after the
+                last optimization. Defaults to ``None``.
+            **kwargs:
+                Additional arguments for ``BaseMetaModelTuner``, like ``fit_executor`` and
+                ``max_staleness``.
+        """
+        self._metamodel_kwargs = {
+            'length_scale': length_scale,
+            'refit_every': refit_every,
+            'llh_tolerance': llh_tolerance
+        }
+        super().__init__(tunable, maximize, num_candidates, min_trials, **kwargs)
+
+    def __repr__(self):
+        args = (self.tunable, self.maximize, self.num_candidates, self.min_trials)
+        args += tuple(
+            self._metamodel_kwargs.get(name)
+            for name in ('length_scale', 'refit_every', 'llh_tolerance')
+        )
+        return ('IncrementalGPTuner(tunable={}, maximize={}, '
+                'num_candidates={}, min_trials={}, '
+                'length_scale={}, refit_every={}, llh_tolerance={})').format(*args)
+
+
+class IncrementalGPEiTuner(IncrementalGaussianProcessMetaModel, ExpectedImprovementAcquisition,
+                           BaseMetaModelTuner):
+    """Incremental Gaussian Process Expected Improvement Tuner.
+
+    This class uses an ``IncrementalGaussianProcessMetaModel``, which extends the Cholesky
+    factor of the kernel matrix when new trials are recorded and only re-optimizes the kernel
+    hyperparameters periodically, using an ``ExpectedImprovement`` function to return the
+    better configurations predicted from the model.
+    """
+
+    def __init__(self, tunable, maximize=True, num_candidates=1000, min_trials=5,
+                 length_scale=0.1, refit_every=20, llh_tolerance=None, **kwargs):
+        """Create an instance of ``IncrementalGPEiTuner``.
+
+        Args:
+            tunable (btb.tuning.tunable.Tunable):
+                Instance of a tunable class containing hyperparameters to be tuned.
+            num_candidates (int):
+                Number of samples to generate and select the best of it for each proposal.
+                Defaults to 1000.
+            maximize (bool):
+                If ``True`` the model will understand that the score bigger is better, if ``False``
+                the smaller is better. Defaults to ``True``.
+            min_trials (int):
+                Number of recorded ``trials`` needed to perform a fitting over the model.
+                Defaults to 5.
+            length_scale (float or array):
+                A float or array with shape ``(n_features,)``, used for the default ``RBF`` kernel.
+            refit_every (int):
+                Number of recorded ``trials`` after which the kernel hyperparameters are
+                re-optimized. Defaults to 20.
+            llh_tolerance (float):
+                If given, the kernel hyperparameters are also re-optimized when the
+                log-likelihood per trial drifts more than this from the one obtained after the
+                last optimization. Defaults to ``None``.
+            **kwargs:
+                Additional arguments for ``BaseMetaModelTuner``, like ``fit_executor`` and
+                ``max_staleness``.
+        """
+        self._metamodel_kwargs = {
+            'length_scale': length_scale,
+            'refit_every': refit_every,
+            'llh_tolerance': llh_tolerance
+        }
+        super().__init__(tunable, maximize, num_candidates, min_trials, **kwargs)
+
+    def __repr__(self):
+        args = (self.tunable, self.maximize, self.num_candidates, self.min_trials)
+        args += tuple(
+            self._metamodel_kwargs.get(name)
+            for name in ('length_scale', 'refit_every', 'llh_tolerance')
+        )
+        return ('IncrementalGPEiTuner(tunable={}, maximize={}, '
+                'num_candidates={}, min_trials={}, '
+                'length_scale={}, refit_every={}, llh_tolerance={})').format(*args)
+
+
+class SparseGPTuner(SparseGaussianProcessMetaModel, PredictedScoreAcquisition,
+                    BaseMetaModelTuner):
+    """Sparse Gaussian Process Tuner.
+
+    This class uses a ``SparseGaussianProcessMetaModel``, which approximates a Gaussian
+    Process using ``num_inducing`` inducing points to scale to long tuning sessions, using
+    a ``numpy.argmax`` function to return the better configurations predicted from the model.
+    """
+
+    def __init__(self, tunable, maximize=True, num_candidates=1000, min_trials=5,
+                 length_scale=0.1, num_inducing=100, noise=1e-2, **kwargs):
+        """Create an instance of ``SparseGPTuner``.
+
+        Args:
+            tunable (btb.tuning.tunable.Tunable):
+                Instance of a tunable class containing hyperparameters to be tuned.
+            num_candidates (int):
+                Number of samples to generate and select the best of it for each proposal.
+                Defaults to 1000.
+            maximize (bool):
+                If ``True`` the model will understand that the score bigger is better, if ``False``
+                the smaller is better. Defaults to ``True``.
+            min_trials (int):
+                Number of recorded ``trials`` needed to perform a fitting over the model.
+                Defaults to 5.
+            length_scale (float or array):
+                A float or array with shape ``(n_features,)``, used for the default ``RBF`` kernel.
+            num_inducing (int):
+                Maximum number of trials used as inducing points. Defaults to 100.
+            noise (float):
+                Variance of the noise of the normalized scores. Defaults to 0.01.
+            **kwargs:
+                Additional arguments for ``BaseMetaModelTuner``, like ``fit_executor`` and
+                ``max_staleness``.
+        """
+        self._metamodel_kwargs = {
+            'length_scale': length_scale,
+            'num_inducing': num_inducing,
+            'noise': noise
+        }
+        super().__init__(tunable, maximize, num_candidates, min_trials, **kwargs)
+
+    def __repr__(self):
+        args = (self.tunable, self.maximize, self.num_candidates, self.min_trials)
+        args += tuple(
+            self._metamodel_kwargs.get(name)
+            for name in ('length_scale', 'num_inducing', 'noise')
+        )
+        return ('SparseGPTuner(tunable={}, maximize={}, '
+                'num_candidates={}, min_trials={}, '
+                'length_scale={}, num_inducing={}, noise={})').format(*args)
+
+
+class SparseGPEiTuner(SparseGaussianProcessMetaModel, ExpectedImprovementAcquisition,
+                      BaseMetaModelTuner):
+    """Sparse Gaussian Process Expected Improvement Tuner.
+
+    This class uses a ``SparseGaussianProcessMetaModel``, which approximates a Gaussian
+    Process using ``num_inducing`` inducing points to scale to long tuning sessions, using
+    an ``ExpectedImprovement`` function to return the better configurations predicted from the
+    model.
+    """
+
+    def __init__(self, tunable, maximize=True, num_candidates=1000, min_trials=5,
+                 length_scale=0.1, num_inducing=100, noise=1e-2, **kwargs):
+        """Create an instance of ``SparseGPEiTuner``.
+
+        Args:
+            tunable (btb.tuning.tunable.Tunable):
+                Instance of a tunable class containing hyperparameters to be tuned.
+            num_candidates (int):
+                Number of samples to generate and select the best of it for each proposal.
+                Defaults to 1000.
+            maximize (bool):
+                If ``True`` the model will understand that the score bigger is better, if ``False``
+                the smaller is better. Defaults to ``True``.
+            min_trials (int):
+                Number of recorded ``trials`` needed to perform a fitting over the model.
+                Defaults to 5.
+            length_scale (float or array):
+                A float or array with shape ``(n_features,)``, used for the default ``RBF`` kernel.
+            num_inducing (int):
+                Maximum number of trials used as inducing points. Defaults to 100.
+            noise (float):
+                Variance of the noise of the normalized scores. Defaults to 0.01.
+            **kwargs:
+                Additional arguments for ``BaseMetaModelTuner``, like ``fit_executor`` and
+                ``max_staleness``.
+        """
+        self._metamodel_kwargs = {
+            'length_scale': length_scale,
+            'num_inducing': num_inducing,
+            'noise': noise
+        }
+        super().__init__(tunable, maximize, num_candidates, min_trials, **kwargs)
+
+    def __repr__(self):
+        args = (self.tunable, self.maximize, self.num_candidates, self.min_trials)
+        args += tuple(
+            self._metamodel_kwargs.get(name)
+            for name in ('length_scale', 'num_inducing', 'noise')
+        )
+        return ('SparseGPEiTuner(tunable={}, maximize={}, '
+                'num_candidates={}, min_trials={}, '
+                'length_scale={}, num_inducing={}, noise={})').format(*args)
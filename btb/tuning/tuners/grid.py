@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+"""Package where the GridTuner class is defined."""
+
+import math
+
+import numpy as np
+
+from btb.tuning.tuners.base import BaseTuner
+
+_GOLDEN_RATIO = (1 + math.sqrt(5)) / 2
+_FEISTEL_ROUNDS = 4
+_MASK_64 = (1 << 64) - 1
+
+
+class GridTuner(BaseTuner):
+    """GridTuner class.
+
+    The GridTuner enumerates all the possible configurations of a ``Tunable`` with a finite
+    cardinality, proposing each one of them once before proposing any duplicate.
+
+    The grid is never materialized: the configuration proposed in the position ``i`` of the
+    enumeration is the image of ``i`` by a permutation of all the ranks which is computed on
+    the fly, so proposing costs :math:`O(1)` per configuration. The ``random`` order uses a
+    Feistel network with random keys, restricted to ``[0, cardinality)`` by cycle walking, and
+    the ``space_filling`` order uses the rank ``(step * i) % cardinality``, where ``step`` is
+    coprime with the cardinality. The configurations that have already been recorded or are
+    pending, for example when resuming from previous trials, are skipped.
+
+    Args:
+        tunable (btb.tuning.tunable.Tunable):
+            Instance of a tunable class containing hyperparameters to be tuned. It must have a
+            finite cardinality and no conditions.
+        maximize (bool):
+            If ``True`` the scores are interpreted as bigger is better, if ``False`` then smaller
+            is better. Defaults to ``True``.
+        order (str):
+            Order in which the configurations are enumerated. ``random`` uses a random
+            permutation, and ``space_filling`` a deterministic one that moves the golden ratio
+            of the grid between consecutive proposals so that the first proposals are spread
+            over the whole grid. Defaults to ``random``.
+
+    Raises:
+        ValueError:
+            If the ``tunable`` does not have a finite cardinality, has conditions or the
+            ``order`` is not valid.
+    """
+
+    def __init__(self, tunable, maximize=True, order='random'):
+        super().__init__(tunable, maximize)
+        if self._untried is None:
+            raise ValueError(
+                'GridTuner can only be used with tunables of finite cardinality without '
+                'conditions.')
+
+        cardinality = self.tunable.cardinality
+        if order == 'random':
+            # The network permutes ``[0, 4 ** half_bits)``, the smallest power of 4 that
+            # contains all the ranks, so cycle walking takes less than 4 steps on average.
+            self._half_bits = max(1, (int(cardinality - 1).bit_length() + 1) // 2)
+            self._keys = [int(key) for key in np.random.randint(2 ** 62, size=_FEISTEL_ROUNDS)]
+        elif order == 'space_filling':
+            self._step = self._get_coprime(round(cardinality / _GOLDEN_RATIO), cardinality)
+            self._offset = 0
+        else:
+            raise ValueError('Unknown order {}. Use random or space_filling.'.format(order))
+
+        self.order = order
+        self._position = 0
+
+    @staticmethod
+    def _get_coprime(value, cardinality):
+        """Get the closest number to ``value`` that is coprime with ``cardinality``."""
+        value = int(value)
+        for distance in range(cardinality):
+            for candidate in (value - distance, value + distance):
+                if 0 < candidate < cardinality and math.gcd(candidate, cardinality) == 1:
+                    return candidate
+
+        return 1
+
+    @staticmethod
+    def _mix(value):
+        """Scramble the bits of a 64 bits integer (SplitMix64 finalizer)."""
+        value = (value + 0x9E3779B97F4A7C15) & _MASK_64
+        value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+        value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK_64
+        return value ^ (value >> 31)
+
+    def _feistel(self, value):
+        """Apply the keyed Feistel network, a bijection on ``[0, 4 ** half_bits)``."""
+        mask = (1 << self._half_bits) - 1
+        left = value >> self._half_bits
+        right = value & mask
+        for key in self._keys:
+            left, right = right, left ^ (self._mix(right ^ key) & mask)
+
+        return (left << self._half_bits) | right
+
+    def _get_rank(self, position):
+        cardinality = self.tunable.cardinality
+        position = position % cardinality
+        if self.order == 'space_filling':
+            return (self._offset + self._step * position) % cardinality
+
+        # Cycle walking: the ranks outside of the grid are mapped again until one falls inside.
+        rank = self._feistel(position)
+        while rank >= cardinality:
+            rank = self._feistel(rank)
+
+        return rank
+
+    def _propose(self, num_proposals, allow_duplicates):
+        """Generate ``num_proposals`` number of candidates.
+
+        Args:
+            num_proposals (int):
+                Number of candidates to create.
+            allow_duplicates (bool):
+                If it's ``False``, the tuner will propose trials that are not recorded. Otherwise
+                the enumeration starts again once all the configurations have been proposed.
+
+        Returns:
+            numpy.ndarray:
+                It returns ``numpy.ndarray`` with shape
+                ``(num_proposals, len(self.tunable.hyperparameters)``.
+        """
+        if allow_duplicates:
+            positions = range(self._position, self._position + num_proposals)
+            self._position += num_proposals
+            return self.tunable.from_ranks([self._get_rank(position) for position in positions])
+
+        ranks = dict()
+        while len(ranks) < num_proposals and self._position < self.tunable.cardinality:
+            rank = self._get_rank(self._position)
+            self._position += 1
+            if rank not in self._trials_set and rank not in self._pending_set:
+                ranks[rank] = None
+
+        if len(ranks) < num_proposals:
+            # The enumeration is over, but some pending configurations were cleared.
+            for rank in self._untried.sample(num_proposals + len(ranks)).tolist():
+                if len(ranks) < num_proposals:
+                    ranks[rank] = None
+
+        return self.tunable.from_ranks(list(ranks))
+
+    def __repr__(self):
+        return 'GridTuner(tunable={}, maximize={}, order={})'.format(
+            self.tunable, self.maximize, self.order)
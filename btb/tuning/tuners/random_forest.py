@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+
+"""Package where the tuners based on tree ensemble metamodels are defined."""
+
+from btb.tuning.acquisition.expected_improvement import ExpectedImprovementAcquisition
+from btb.tuning.acquisition.predicted_score import PredictedScoreAcquisition
+from btb.tuning.metamodels.random_forest import ExtraTreesMetaModel, RandomForestMetaModel
+from btb.tuning.tuners.base import BaseMetaModelTuner
+
+
+class RFTuner(RandomForestMetaModel, PredictedScoreAcquisition, BaseMetaModelTuner):
+    """Random Forest Tuner.
+
+    This class uses a ``RandomForestRegressor`` model from the ``sklearn.ensemble`` package,
+    using a ``numpy.argmax`` function to return the better configurations predicted from the
+    model.
+    """
+
+    def __init__(self, tunable, maximize=True, num_candidates=1000, min_trials=5,
+                 n_estimators=100, trees_per_fit=None, **kwargs):
+        """Create an instance of ``RFTuner``.
+
+        Args:
+            tunable (btb.tuning.tunable.Tunable):
+                Instance of a tunable class containing hyperparameters to be tuned.
+            num_candidates (int):
+                Number of samples to generate and select the best of it for each proposal.
+                Defaults to 1000.
+            maximize (bool):
+                If ``True`` the model will understand that the score bigger is better, if ``False``
+                the smaller is better. Defaults to ``True``.
+            min_trials (int):
+                Number of recorded ``trials`` needed to perform a fitting over the model.
+                Defaults to 5.
+            n_estimators (int):
+                Number of trees in the forest. Defaults to 100.
+            trees_per_fit (int):
+                If given, the forest is warm started adding this number of trees every time
+                that it is fitted and dropping the oldest ones. Defaults to ``None``, which
+                fits a new forest every time.
+            **kwargs:
+                Additional arguments for ``BaseMetaModelTuner``, like ``fit_executor`` and
+                ``max_staleness``.
+        """
+        self._metamodel_kwargs = {
+            'n_estimators': n_estimators,
+            'trees_per_fit': trees_per_fit
+        }
+        super().__init__(tunable, maximize, num_candidates, min_trials, **kwargs)
+
+    def __repr__(self):
+        args = (self.tunable, self.maximize, self.num_candidates, self.min_trials)
+        args += tuple(
+            self._metamodel_kwargs.get(name)
+            for name in ('n_estimators', 'trees_per_fit')
+        )
+        return ('RFTuner(tunable={}, maximize={}, '
+                'num_candidates={}, min_trials={}, '
+                'n_estimators={}, trees_per_fit={})').format(*args)
+
+
+class RFEiTuner(RandomForestMetaModel, ExpectedImprovementAcquisition, BaseMetaModelTuner):
+    """Random Forest Expected Improvement Tuner.
+
+    This class uses a ``RandomForestRegressor`` model from the ``sklearn.ensemble`` package,
+    using an ``ExpectedImprovement`` function to return the better configurations predicted
+    from the model.
+    """
+
+    def __init__(self, tunable, maximize=True, num_candidates=1000, min_trials=5,
+                 n_estimators=100, trees_per_fit=None, **kwargs):
+        """Create an instance of ``RFEiTuner``.
+
+        Args:
+            tunable (btb.tuning.tunable.Tunable):
+                Instance of a tunable class containing hyperparameters to be tuned.
+            num_candidates (int):
+                Number of samples to generate and select the best of it for each proposal.
+                Defaults to 1000.
+            maximize (bool):
+                If ``True`` the model will understand that the score bigger is better, if ``False``
+                the smaller is better. Defaults to ``True``.
+            min_trials (int):
+                Number of recorded ``trials`` needed to perform a fitting over the model.
+                Defaults to 5.
+            n_estimators (int):
+                Number of trees in the forest. Defaults to 100.
+            trees_per_fit (int):
+                If given, the forest is warm started adding this number of trees every time
+                that it is fitted and dropping the oldest ones. Defaults to ``None``, which
+                fits a new forest every time.
+            **kwargs:
+                Additional arguments for ``BaseMetaModelTuner``, like ``fit_executor`` and
+                ``max_staleness``.
+        """
+        self._metamodel_kwargs = {
+            'n_estimators': n_estimators,
+            'trees_per_fit': trees_per_fit
+        }
+        super().__init__(tunable, maximize, num_candidates, min_trials, **kwargs)
+
+    def __repr__(self):
+        args = (self.tunable, self.maximize, self.num_candidates, self.min_trials)
+        args += tuple(
+            self._metamodel_kwargs.get(name)
+            for name in ('n_estimators', 'trees_per_fit')
+        )
+        return ('RFEiTuner(tunable={}, maximize={}, '
+                'num_candidates={}, min_trials={}, '
+                'n_estimators={}, trees_per_fit={})').format(*args)
+
+
+class ETTuner(ExtraTreesMetaModel, PredictedScoreAcquisition, BaseMetaModelTuner):
+    """Extra Trees Tuner.
+
+    This class uses an ``ExtraTreesRegressor`` model from the ``sklearn.ensemble`` package,
+    using a ``numpy.argmax`` function to return the better configurations predicted from the
+    model.
+    """
+
+    def __init__(self, tunable, maximize=True, num_candidates=1000, min_trials=5,
+                 n_estimators=100, trees_per_fit=None, **kwargs):
+        """Create an instance of ``ETTuner``.
+
+        Args:
+            tunable (btb.tuning.tunable.Tunable):
+                Instance of a tunable class containing hyperparameters to be tuned.
+            num_candidates (int):
+                Number of samples to generate and select the best of it for each proposal.
+                Defaults to 1000.
+            maximize (bool):
+                If ``True`` the model will understand that the score bigger is better, if ``False``
+                the smaller is better. Defaults to ``True``.
+            min_trials (int):
+                Number of recorded ``trials`` needed to perform a fitting over the model.
+                Defaults to 5.
+            n_estimators (int):
+                Number of trees in the forest. Defaults to 100.
+            trees_per_fit (int):
+                If given, the forest is warm started adding this number of trees every time
+                that it is fitted and dropping the oldest ones. Defaults to ``None``, which
+                fits a new forest every time.
+            **kwargs:
+                Additional arguments for ``BaseMetaModelTuner``, like ``fit_executor`` and
+                ``max_staleness``.
+        """
+        self._metamodel_kwargs = {
+            'n_estimators': n_estimators,
+            'trees_per_fit': trees_per_fit
+        }
+        super().__init__(tunable, maximize, num_candidates, min_trials, **kwargs)
+
+    def __repr__(self):
+        args = (self.tunable, self.maximize, self.num_candidates, self.min_trials)
+        args += tuple(
+            self._metamodel_kwargs.get(name)
+            for name in ('n_estimators', 'trees_per_fit')
+        )
+        return ('ETTuner(tunable={}, maximize={}, '
+                'num_candidates={}, min_trials={}, '
+                'n_estimators={}, trees_per_fit={})').format(*args)
+
+
+class ETEiTuner(ExtraTreesMetaModel, ExpectedImprovementAcquisition, BaseMetaModelTuner):
+    """Extra Trees Expected Improvement Tuner.
+
+    This class uses an ``ExtraTreesRegressor`` model from the ``sklearn.ensemble`` package,
+    using an ``ExpectedImprovement`` function to return the better configurations predicted
+    from the model.
+    """
+
+    def __init__(self, tunable, maximize=True, num_candidates=1000, min_trials=5,
+                 n_estimators=100, trees_per_fit=None, **kwargs):
+        """Create an instance of ``ETEiTuner``.
+
+        Args:
+            tunable (btb.tuning.tunable.Tunable):
+                Instance of a tunable class containing hyperparameters to be tuned.
+            num_candidates (int):
+                Number of samples to generate and select the best of it for each proposal.
+                Defaults to 1000.
+            maximize (bool):
+                If ``True`` the model will understand that the score bigger is better, if ``False``
+                the smaller is better. Defaults to ``True``.
+            min_trials (int):
+                Number of recorded ``trials`` needed to perform a fitting over the model.
+                Defaults to 5.
+            n_estimators (int):
+                Number of trees in the forest. Defaults to 100.
+            trees_per_fit (int):
+                If given, the forest is warm started adding this number of trees every time
+                that it is fitted and dropping the oldest ones. Defaults to ``None``, which
+                fits a new forest every time.
+            **kwargs:
+                Additional arguments for ``BaseMetaModelTuner``, like ``fit_executor`` and
+                ``max_staleness``.
+        """
+        self._metamodel_kwargs = {
+            'n_estimators': n_estimators,
+            'trees_per_fit': trees_per_fit
+        }
+        super().__init__(tunable, maximize, num_candidates, min_trials, **kwargs)
+
+    def __repr__(self):
+        args = (self.tunable, self.maximize, self.num_candidates, self.min_trials)
+        args += tuple(
+            self._metamodel_kwargs.get(name)
+            for name in ('n_estimators', 'trees_per_fit')
+        )
+        return ('ETEiTuner(tunable={}, maximize={}, '
+                'num_candidates={}, min_trials={}, '
+                'n_estimators={}, trees_per_fit={})').format(*args)
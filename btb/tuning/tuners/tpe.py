@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+
+"""Package where the TPETuner class is defined."""
+
+import numpy as np
+
+from btb.tuning.hyperparams.boolean import BooleanHyperParam
+from btb.tuning.hyperparams.categorical import CategoricalHyperParam
+from btb.tuning.hyperparams.numerical import IntHyperParam
+from btb.tuning.tuners.base import BaseTuner
+
+_CATEGORICAL = 'categorical'
+_BOOLEAN = 'boolean'
+_INTEGER = 'integer'
+_BINNED = 'binned'
+
+
+class TPETuner(BaseTuner):
+    """Tree-structured Parzen Estimator Tuner.
+
+    This tuner splits the recorded trials in two groups, the ``gamma`` fraction of trials
+    with the best scores and the rest, and models each group with a Parzen density per
+    hyperparameter, assuming that the hyperparameters are independent. The candidates are
+    sampled from the density of the best trials and the ones that maximize the ratio between
+    the density of the best trials and the density of the rest are proposed.
+
+    The densities are histograms over the search space: ``CategoricalHyperParam``,
+    ``BooleanHyperParam`` and ``IntHyperParam`` with at most ``num_bins`` values have one bin
+    per value, and the rest of the numerical hyperparameters are split in ``num_bins`` bins
+    which are smoothed with their neighbours. The bin of every recorded trial is computed
+    only once, when it is recorded, so proposing costs :math:`O(n)` on the number of trials.
+
+    Args:
+        tunable (btb.tuning.tunable.Tunable):
+            Instance of a tunable class containing hyperparameters to be tuned.
+        maximize (bool):
+            If ``True`` the tuner will understand that the score bigger is better, if ``False``
+            the smaller is better. Defaults to ``True``.
+        num_candidates (int):
+            Number of samples to generate and select the best of it for each proposal.
+            Defaults to 100.
+        min_trials (int):
+            Number of recorded ``trials`` needed to start modeling them. Until then, the
+            proposals are sampled uniformly. Defaults to 10.
+        gamma (float):
+            Fraction of the recorded trials considered to be the best ones. Defaults to 0.25.
+        num_bins (int):
+            Number of bins used to model the numerical hyperparameters. Defaults to 32.
+        prior_weight (float):
+            Weight of the uniform prior added to every density, as a number of trials. It must
+            be positive so that no value gets a zero density. Defaults to 1.
+        sampling_method (str):
+            Method used to sample the proposals until ``min_trials`` are recorded, passed to
+            ``Tunable.sample``. Defaults to ``random``.
+
+    Raises:
+        ValueError:
+            If ``prior_weight`` is not positive.
+    """
+
+    def __init__(self, tunable, maximize=True, num_candidates=100, min_trials=10, gamma=0.25,
+                 num_bins=32, prior_weight=1.0, sampling_method='random'):
+        if not prior_weight > 0:
+            raise ValueError('The ``prior_weight`` must be positive, got {}.'.format(prior_weight))
+
+        self.num_candidates = num_candidates
+        self.min_trials = min_trials
+        self.gamma = gamma
+        self.num_bins = num_bins
+        self.prior_weight = prior_weight
+        super().__init__(tunable, maximize, sampling_method)
+
+        self._dimensions = list()
+        start = 0
+        for name in tunable.names:
+            hyperparam = tunable.hyperparams[name]
+            end = start + hyperparam.dimensions
+            if isinstance(hyperparam, CategoricalHyperParam):
+                dimension = (_CATEGORICAL, start, end, hyperparam, hyperparam.cardinality)
+            elif isinstance(hyperparam, BooleanHyperParam):
+                dimension = (_BOOLEAN, start, end, hyperparam, 2)
+            elif isinstance(hyperparam, IntHyperParam) and hyperparam.cardinality <= num_bins:
+                dimension = (_INTEGER, start, end, hyperparam, hyperparam.cardinality)
+            else:
+                dimension = (_BINNED, start, end, hyperparam, num_bins)
+
+            self._dimensions.append(dimension)
+            start = end
+
+        self._code_buffer = np.empty((len(self._dimensions), 16), dtype=int)
+        self._num_codes = 0
+        self._counts = [np.zeros(dimension[-1]) for dimension in self._dimensions]
+
+    @property
+    def _codes(self):
+        """2D array of shape ``(len(self._dimensions), n)`` with the bins of the recorded trials.
+        """
+        return self._code_buffer[:, :self._num_codes]
+
+    def _append_codes(self, codes):
+        """Add the bins of new trials, doubling the capacity of the buffer when it gets full."""
+        size = self._num_codes + codes.shape[1]
+        capacity = self._code_buffer.shape[1]
+        if size > capacity:
+            buffer = np.empty((len(self._dimensions), max(2 * capacity, size)), dtype=int)
+            buffer[:, :self._num_codes] = self._codes
+            self._code_buffer = buffer
+
+        self._code_buffer[:, self._num_codes:size] = codes
+        self._num_codes = size
+
+    def _encode(self, trials):
+        """Compute the bin of each hyperparameter of the given search space trials.
+
+        Returns:
+            numpy.ndarray:
+                2D array of ``int`` with shape ``(len(self._dimensions), len(trials))``.
+        """
+        trials = np.asarray(trials, dtype=float)
+        codes = np.empty((len(self._dimensions), len(trials)), dtype=int)
+        for index, (kind, start, end, hyperparam, num_codes) in enumerate(self._dimensions):
+            values = trials[:, start:end]
+            if kind == _CATEGORICAL:
+                codes[index] = hyperparam.to_index(values)
+            elif kind == _BOOLEAN:
+                codes[index] = values[:, 0].round()
+            elif kind == _INTEGER:
+                codes[index] = hyperparam.to_index(values)
+            else:
+                codes[index] = values[:, 0] * num_codes
+
+            np.clip(codes[index], 0, num_codes - 1, out=codes[index])
+
+        return codes
+
+    def _decode(self, codes):
+        """Convert the bins of each hyperparameter into search space values.
+
+        The values of the numerical hyperparameters which are modeled with bins are sampled
+        uniformly within their bin.
+        """
+        trials = np.empty((codes.shape[1], self.tunable.dimensions))
+        for index, (kind, start, end, hyperparam, num_codes) in enumerate(self._dimensions):
+            code = codes[index]
+            if kind == _CATEGORICAL:
+                trials[:, start:end] = hyperparam.from_index(code)
+            elif kind == _BOOLEAN:
+                trials[:, start] = code
+            elif kind == _INTEGER:
+                trials[:, start:end] = hyperparam.from_index(code)
+            else:
+                values = ((code + np.random.random(len(code))) / num_codes).reshape(-1, 1)
+                if isinstance(hyperparam, IntHyperParam):
+                    values = hyperparam._transform(hyperparam._inverse_transform(values))
+
+                trials[:, start:end] = values
+
+        return trials
+
+    def _density(self, counts, total, kind):
+        """Compute the smoothed density of the given histogram counts."""
+        if kind == _BINNED:
+            counts = np.convolve(counts, [0.25, 0.5, 0.25], mode='same')
+
+        return (counts + self.prior_weight / len(counts)) / (total + self.prior_weight)
+
+    def _select(self, candidates, scores, num_proposals, allow_duplicates):
+        """Select the ``num_proposals`` candidates with the best scores."""
+        order = np.argsort(-scores)
+        if allow_duplicates:
+            return candidates[order[:num_proposals]]
+
+        selected = dict()
+
+        def select(candidates):
+            for key, candidate in zip(self._get_keys(candidates), candidates):
+                if len(selected) == num_proposals:
+                    break
+
+                if key not in self._trials_set and key not in self._pending_set:
+                    selected.setdefault(key, candidate)
+
+        select(candidates[order])
+        while len(selected) < num_proposals:
+            select(self._sample(num_proposals, False))
+
+        return np.asarray(list(selected.values()))
+
+    def _propose(self, num_proposals, allow_duplicates):
+        """Generate ``num_proposals`` number of candidates.
+
+        Args:
+            num_proposals (int):
+                Number of candidates to create.
+            allow_duplicates (bool):
+                If it's ``False``, the tuner will propose trials that are not recorded. Otherwise
+                will generate trials that can be repeated.
+
+        Returns:
+            numpy.ndarray:
+                It returns ``numpy.ndarray`` with shape
+                ``(num_proposals, len(self.tunable.hyperparameters)``.
+        """
+        num_trials = len(self.scores)
+        if num_trials < self.min_trials:
+            return self._sample(num_proposals, allow_duplicates)
+
+        num_good = max(1, int(np.ceil(self.gamma * num_trials)))
+        good = np.argpartition(-self.scores, num_good - 1)[:num_good]
+
+        num_samples = num_proposals * self.num_candidates
+        codes = np.empty((len(self._dimensions), num_samples), dtype=int)
+        scores = np.zeros(num_samples)
+        for index, dimension in enumerate(self._dimensions):
+            kind = dimension[0]
+            good_counts = np.bincount(self._codes[index, good], minlength=len(self._counts[index]))
+            bad_counts = self._counts[index] - good_counts
+
+            good_density = self._density(good_counts, num_good, kind)
+            bad_density = self._density(bad_counts, num_trials - num_good, kind)
+            good_density /= good_density.sum()
+
+            code = np.random.choice(len(good_density), num_samples, p=good_density)
+            codes[index] = code
+            scores += np.log(good_density[code]) - np.log(bad_density[code])
+
+        candidates = self.tunable.impute(self._decode(codes))
+
+        return self._select(candidates, scores, num_proposals, allow_duplicates)
+
+    def record(self, trials, scores):
+        """Record one or more ``trials`` with the associated ``scores``.
+
+        The bins of the new trials are computed and added to the histograms of the tuner.
+
+        Args:
+            trials (pandas.DataFrame, pandas.Series, dict, list(dict), 2D array-like):
+                Values of shape ``(n, len(self.tunable.hyperparameters))`` or dict with keys that
+                are ``self.tunable.names``.
+
+            scores (single value or array-like):
+                A single value or array-like of values representing the score achieved with the
+                trials.
+        """
+        super().record(trials, scores)
+
+        codes = self._encode(self.trials[self._num_codes:])
+        for index, counts in enumerate(self._counts):
+            counts += np.bincount(codes[index], minlength=len(counts))
+
+        self._append_codes(codes)
+
+    def __repr__(self):
+        args = (self.tunable, self.maximize, self.num_candidates, self.min_trials, self.gamma,
+                self.num_bins, self.prior_weight)
+        return ('TPETuner(tunable={}, maximize={}, num_candidates={}, min_trials={}, '
+                'gamma={}, num_bins={}, prior_weight={})').format(*args)
@@ -1,11 +1,14 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
 from unittest import TestCase
 
 import pytest
 
+from btb.selection import (
+    DiscountedUCB, GaussianThompsonSampling, HierarchicalSelector, SlidingWindowUCB)
 from btb.session import BTBSession
-from btb.tuning import StopTuning
+from btb.tuning import GridTuner, StopTuning, UniformTuner
 
 
 class BTBSessionTest(TestCase):
@@ -98,6 +101,74 @@ class BTBSessionTest(TestCase):
         assert best['name'] == 'another_tunable'
         assert best['config'] == {'a_parameter': 2}
 
+    def test_tuner_class_dict(self):
+        tunables = {
+            'a_tunable': {
+                'a_parameter': {
+                    'type': 'int',
+                    'default': 0,
+                    'range': [0, 2]
+                }
+            },
+            'another_tunable': {
+                'a_parameter': {
+                    'type': 'int',
+                    'default': 0,
+                    'range': [0, 2]
+                }
+            }
+        }
+        tuner_class = {'a_tunable': GridTuner, 'another_tunable': UniformTuner}
+
+        session = BTBSession(tunables, self.scorer, tuner_class=tuner_class)
+
+        best = session.run(6)
+
+        assert isinstance(session._tuners['a_tunable'], GridTuner)
+        assert isinstance(session._tuners['another_tunable'], UniformTuner)
+        assert best['name'] == 'another_tunable'
+        assert best['config'] == {'a_parameter': 2}
+
+    def test_selector_class(self):
+        tunable = {
+            'a_parameter': {
+                'type': 'int',
+                'default': 0,
+                'range': [0, 2]
+            }
+        }
+
+        for selector_class in (GaussianThompsonSampling, DiscountedUCB, SlidingWindowUCB):
+            tunables = {'a_tunable': tunable, 'another_tunable': tunable}
+            session = BTBSession(tunables, self.scorer, selector_class=selector_class)
+
+            best = session.run(6)
+
+            assert isinstance(session._selector, selector_class)
+            assert best['name'] == 'another_tunable'
+            assert best['config'] == {'a_parameter': 2}
+
+    def test_hierarchical_selector(self):
+        tunable = {
+            'a_parameter': {
+                'type': 'int',
+                'default': 0,
+                'range': [0, 2]
+            }
+        }
+        tunables = {
+            'a_group/a_tunable': tunable,
+            'a_group/another_tunable': tunable,
+            'another_tunable': tunable,
+        }
+
+        session = BTBSession(tunables, self.scorer, selector_class=HierarchicalSelector)
+
+        best = session.run(9)
+
+        assert best['name'] == 'a_group/another_tunable'
+        assert best['config'] == {'a_parameter': 2}
+
     def test_errors(self):
         tunables = {
             'a_tunable': {
@@ -221,3 +292,86 @@ class BTBSessionTest(TestCase):
 
         assert best['name'] == 'a_tunable'
         assert best['config'] == {'a_parameter': 1}
+
+    def test_run_n_workers(self):
+        tunables = {
+            'a_tunable': {
+                'a_parameter': {
+                    'type': 'int',
+                    'default': 0,
+                    'range': [0, 9]
+                }
+            }
+        }
+
+        session = BTBSession(tunables, self.scorer)
+
+        best = session.run(10, n_workers=4)
+
+        configs = [proposal['config']['a_parameter'] for proposal in session.proposals.values()]
+        assert sorted(configs) == list(range(10))
+        assert all('score' in proposal for proposal in session.proposals.values())
+        assert best['config'] == {'a_parameter': 9}
+        assert session._pending == {}
+
+        with pytest.raises(StopTuning):
+            session.run(n_workers=4)
+
+    def test_ask_tell(self):
+        tunables = {
+            'a_tunable': {
+                'a_parameter': {
+                    'type': 'int',
+                    'default': 0,
+                    'range': [0, 9]
+                }
+            }
+        }
+
+        session = BTBSession(tunables, self.scorer)
+
+        trials = session.ask(4)
+        assert len({trial.id for trial in trials}) == 4
+        assert len({trial.config['a_parameter'] for trial in trials}) == 4
+
+        scores = [self.scorer(trial.name, trial.config) for trial in trials]
+        session.tell_many(trials, scores)
+
+        best = max(scores)
+        assert session.best_score == best
+        assert all('score' in proposal for proposal in session.proposals.values())
+
+        with pytest.raises(ValueError):
+            session.tell(trials[0], 1)
+
+    def test_arun(self):
+        tunables = {
+            'a_tunable': {
+                'a_parameter': {
+                    'type': 'int',
+                    'default': 0,
+                    'range': [0, 9]
+                }
+            }
+        }
+
+        async def scorer(name, proposal):
+            await asyncio.sleep(0.01)
+            return proposal['a_parameter']
+
+        session = BTBSession(tunables, scorer)
+
+        loop = asyncio.new_event_loop()
+        try:
+            best = loop.run_until_complete(session.arun(10, concurrency=4))
+
+            proposals = session.proposals.values()
+            configs = [proposal['config']['a_parameter'] for proposal in proposals]
+            assert sorted(configs) == list(range(10))
+            assert best['config'] == {'a_parameter': 9}
+
+            with pytest.raises(StopTuning):
+                loop.run_until_complete(session.arun(concurrency=4))
+
+        finally:
+            loop.close()
@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 
+import pickle
 import random
+from concurrent.futures import ThreadPoolExecutor
 
-from btb.tuning import GPTuner, Tunable
+from btb.tuning import GPEiTuner, GPTuner, Tunable
 from btb.tuning.hyperparams import (
     BooleanHyperParam, CategoricalHyperParam, FloatHyperParam, IntHyperParam)
 
@@ -49,3 +51,93 @@ def test_tuning_minimize():
     assert len(tuner.raw_scores) == 10
     assert len(tuner.scores) == 10
     assert all(-tuner.raw_scores == tuner.scores)
+
+
+def test_tuning_fit_executor():
+    hyperparams = {
+        'bhp': BooleanHyperParam(default=False),
+        'chp': CategoricalHyperParam(choices=['a', 'b', None], default=None),
+        'fhp': FloatHyperParam(min=0.1, max=1.0, default=0.5),
+        'ihp': IntHyperParam(min=-1, max=1)
+    }
+    tunable = Tunable(hyperparams)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        tuner = GPTuner(tunable, fit_executor=executor, max_staleness=2)
+
+        for _ in range(10):
+            proposed = tuner.propose(1)
+            tuner.record(proposed, random.random())
+
+        tuner.propose(1)
+
+    # asserts
+    assert len(tuner.trials) == 10
+    assert tuner.staleness <= 2
+    assert tuner._metamodel is not None
+    assert pickle.loads(pickle.dumps(tuner))._fit_executor is None
+
+
+def test_tuning_local_search():
+    hyperparams = {
+        'bhp': BooleanHyperParam(default=False),
+        'chp': CategoricalHyperParam(choices=['a', 'b', None], default=None),
+        'fhp': FloatHyperParam(min=0.1, max=1.0, default=0.5),
+        'ihp': IntHyperParam(min=-1, max=1)
+    }
+    tunable = Tunable(hyperparams)
+    tuner = GPEiTuner(tunable, num_candidates=10, local_search_starts=3)
+
+    for _ in range(10):
+        proposed = tuner.propose(1)
+        tuner.record(proposed, proposed['fhp'])
+
+    proposed = tuner.propose(5)
+
+    # asserts
+    assert len(proposed) == 5
+    assert all(0.1 <= proposal['fhp'] <= 1.0 for proposal in proposed)
+
+
+def test_tuning_sampling_method():
+    hyperparams = {
+        'bhp': BooleanHyperParam(default=False),
+        'chp': CategoricalHyperParam(choices=['a', 'b', None], default=None),
+        'fhp': FloatHyperParam(min=0.1, max=1.0, default=0.5),
+        'ihp': IntHyperParam(min=-1, max=1)
+    }
+    tunable = Tunable(hyperparams)
+
+    for method in ('sobol', 'halton', 'lhs'):
+        tuner = GPTuner(tunable, sampling_method=method)
+
+        for _ in range(10):
+            proposed = tuner.propose(1)
+            tuner.record(proposed, random.random())
+
+        proposed = tuner.propose(5)
+
+        # asserts
+        assert len(proposed) == 5
+        assert len(tuner.trials) == 10
+
+
+def test_tuning_conditional():
+    hyperparams = {
+        'kernel': CategoricalHyperParam(choices=['rbf', 'poly'], default='rbf'),
+        'degree': IntHyperParam(min=2, max=4),
+        'fhp': FloatHyperParam(min=0.1, max=1.0, default=0.5),
+    }
+    tunable = Tunable(hyperparams, conditions={'degree': {'kernel': ['poly']}})
+    tuner = GPTuner(tunable, local_search_starts=2)
+
+    for _ in range(10):
+        proposed = tuner.propose(1)
+        tuner.record(proposed, random.random())
+
+    proposed = tuner.propose(5)
+
+    # asserts
+    assert len(proposed) == 5
+    for proposal in proposed:
+        assert ('degree' in proposal) == (proposal['kernel'] == 'poly')
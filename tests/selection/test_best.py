@@ -136,6 +136,76 @@ class TestBestKReward(TestCase):
         }
         bandit_mock.assert_called_once_with(choice_rewards)
 
+    # METHOD: update(self, choice, score)
+    # VALIDATE:
+    #     * rewards computed from the best scores
+
+    def test_update(self):
+        """The rewards are the same as the ones computed from all the scores"""
+
+        # Set-up
+        selector = BestKReward(['RF', 'SVM'], k=3)
+        choice_scores = {
+            'RF': [0.5, 0.8, 0.6, 0.9, 0.75],
+            'SVM': [0.7, 0.65],
+        }
+
+        # Run
+        for choice, scores in choice_scores.items():
+            for score in scores:
+                selector.update(choice, score)
+
+        average_rewards, pulls = selector._get_best_k_rewards()
+
+        # Assert
+        np.testing.assert_allclose(average_rewards, [0.816666, 0.675], rtol=1e-5)
+        np.testing.assert_array_equal(pulls, [5, 2])
+
+    def test_remove(self):
+        """The best scores of the removed choice are forgotten"""
+
+        # Set-up
+        selector = BestKReward(['RF', 'SVM'], k=2)
+        for score in [0.9, 0.6, 0.75]:
+            selector.update('RF', score)
+
+        # Run
+        selector.remove('RF')
+        selector.update('RF', 0.5)
+
+        # Assert
+        average_rewards, pulls = selector._get_best_k_rewards()
+        np.testing.assert_allclose(average_rewards, [0.5, 0.])
+        np.testing.assert_array_equal(pulls, [1, 0])
+
+    # METHOD: select(self, choice_scores=None)
+    # VALIDATE:
+    #     * returned values when the scores are recorded with update
+
+    def test_select_updated(self):
+        """Only the choices with scores are selected"""
+
+        # Set-up
+        selector = BestKReward(['DT', 'RF', 'SVM'])
+        for score in [0.8, 0.85, 0.83]:
+            selector.update('RF', score)
+
+        # Run
+        best = selector.select()
+
+        # Assert
+        assert best == 'RF'
+
+    def test_select_no_scores(self):
+        """If no scores have been recorded, select fails"""
+
+        # Set-up
+        selector = BestKReward(['RF', 'SVM'])
+
+        # Run / Assert
+        with self.assertRaises(ValueError):
+            selector.select()
+
 
 class TestBestKVelocity(TestCase):
 
@@ -174,3 +244,47 @@ class TestBestKVelocity(TestCase):
             np.sort(rewards),
             np.sort([0.05, 0.15, 0.1, np.nan, np.nan])
         )
+
+    # METHOD: update(self, choice, score)
+    # VALIDATE:
+    #     * rewards computed from the best scores
+
+    def test_update(self):
+        """The rewards are the same as the ones computed from all the scores"""
+
+        # Set-up
+        selector = BestKVelocity(['RF', 'SVM'], k=3)
+        choice_scores = {
+            'RF': [0.5, 0.8, 0.1, 0.75, 0.6],
+            'SVM': [0.65, 0.7],
+        }
+
+        # Run
+        for choice, scores in choice_scores.items():
+            for score in scores:
+                selector.update(choice, score)
+
+        average_rewards, pulls = selector._get_best_k_rewards()
+
+        # Assert
+        np.testing.assert_allclose(average_rewards, [0.1, 0.05])
+        np.testing.assert_array_equal(pulls, [5, 1])
+
+    # METHOD: select_batch(self, choice_scores=None, k=1, pending=None)
+    # VALIDATE:
+    #     * pending pulls
+
+    def test_select_batch_pending(self):
+        """The choices with pending pulls have a lower UCB1 index"""
+
+        # Set-up
+        selector = BestKVelocity(['DT', 'RF', 'SVM'])
+        for choice in ('RF', 'SVM'):
+            for score in [0.8, 0.85, 0.83]:
+                selector.update(choice, score)
+
+        # Run
+        best = selector.select_batch(k=2, pending={'RF': 3})
+
+        # Assert
+        assert best == ['SVM', 'SVM']
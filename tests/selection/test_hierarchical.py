@@ -1,7 +1,175 @@
 from unittest import TestCase
 from unittest.mock import patch
 
-from btb.selection.hierarchical import HierarchicalByAlgorithm
+import numpy as np
+
+from btb.selection.hierarchical import HierarchicalByAlgorithm, HierarchicalSelector
+
+
+class TestHierarchicalSelector(TestCase):
+
+    CHOICES = ['trees/RF/default', 'trees/RF/deep', 'trees/ET', 'svm/SVC', 'KNN']
+
+    # METHOD: __init__(self, choices, groups=None, separator='/')
+    # VALIDATE:
+    #     * groups taken from the choice names
+    #     * tree structure
+
+    def test___init__(self):
+
+        # Run
+        selector = HierarchicalSelector(self.CHOICES)
+
+        # Assert
+        assert selector.choices == self.CHOICES
+        assert selector.groups == {
+            'trees/RF/default': ('trees', 'RF'),
+            'trees/RF/deep': ('trees', 'RF'),
+            'trees/ET': ('trees', ),
+            'svm/SVC': ('svm', ),
+            'KNN': (),
+        }
+
+        # root, trees, trees/RF and svm
+        assert selector._num_groups == 4
+        np.testing.assert_array_equal(selector._paths[0], [0, 1, 2, 4])
+        np.testing.assert_array_equal(selector._paths[2], [0, 1, 6])
+        np.testing.assert_array_equal(selector._paths[4], [0, 8])
+        np.testing.assert_array_equal(selector._children[0], [1, 3, 8])
+
+    def test___init__groups(self):
+
+        # Setup
+        groups = {'RF': ('trees', ), 'ET': ('trees', )}
+
+        # Run
+        selector = HierarchicalSelector(['RF', 'ET', 'SVC'], groups=groups)
+
+        # Assert
+        assert selector.groups == groups
+        assert selector._num_groups == 2
+        np.testing.assert_array_equal(selector._children[0], [1, 4])
+        np.testing.assert_array_equal(selector._children[1], [2, 3])
+
+    # METHOD: update(self, choice, score)
+    # VALIDATE:
+    #     * statistics of the choice and its groups
+
+    def test_update(self):
+
+        # Set-up
+        selector = HierarchicalSelector(self.CHOICES)
+
+        # Run
+        selector.update('trees/RF/default', 0.8)
+        selector.update('trees/ET', 0.6)
+        selector.update('trees/RF/deep', np.nan)
+
+        # Assert
+        np.testing.assert_array_equal(selector._node_counts, [3, 3, 2, 0, 1, 1, 1, 0, 0])
+        np.testing.assert_allclose(selector._node_sums, [1.4, 1.4, 0.8, 0, 0.8, 0, 0.6, 0, 0])
+        np.testing.assert_array_equal(selector._node_num_rewards, [2, 2, 1, 0, 1, 0, 1, 0, 0])
+
+    def test_remove(self):
+
+        # Set-up
+        selector = HierarchicalSelector(self.CHOICES)
+        selector.update('trees/RF/default', 0.8)
+        selector.update('trees/RF/default', 0.7)
+        selector.update('trees/ET', 0.6)
+
+        # Run
+        selector.remove('trees/RF/default')
+
+        # Assert
+        np.testing.assert_array_equal(selector._node_counts, [1, 1, 0, 0, 0, 0, 1, 0, 0])
+        np.testing.assert_allclose(selector._node_sums, [0.6, 0.6, 0, 0, 0, 0, 0.6, 0, 0])
+        assert selector.select() == 'trees/ET'
+
+    # METHOD: select(self, choice_scores=None)
+    # VALIDATE:
+    #     * returned values
+
+    def test_select_updated(self):
+        """Only the choices with scores are selected"""
+
+        # Set-up
+        selector = HierarchicalSelector(self.CHOICES)
+        selector.update('trees/RF/deep', 0.8)
+        selector.update('trees/RF/deep', 0.9)
+
+        # Run
+        best = selector.select()
+
+        # Assert
+        assert best == 'trees/RF/deep'
+
+    def test_select_updated_best_group(self):
+        """The group with the best scores is selected first"""
+
+        # Set-up
+        selector = HierarchicalSelector(self.CHOICES)
+        for _ in range(50):
+            selector.update('trees/RF/default', 0.9)
+            selector.update('trees/ET', 0.8)
+            selector.update('svm/SVC', 0.1)
+            selector.update('KNN', 0.1)
+
+        # Run
+        best = selector.select()
+
+        # Assert
+        assert best == 'trees/RF/default'
+
+    def test_select_choice_scores(self):
+        """The given scores are aggregated, and only the given choices are selected"""
+
+        # Set-up
+        selector = HierarchicalSelector(self.CHOICES)
+
+        # Run
+        choice_scores = {
+            'trees/RF/default': [0.9] * 50,
+            'trees/ET': [0.8] * 50,
+            'svm/SVC': [0.1] * 50,
+            'unknown': [1.0] * 50,
+        }
+        best = selector.select(choice_scores)
+
+        # Assert
+        assert best == 'trees/RF/default'
+
+    def test_select_no_scores(self):
+        """If no scores have been recorded, select fails"""
+
+        # Set-up
+        selector = HierarchicalSelector(self.CHOICES)
+
+        # Run / Assert
+        with self.assertRaises(ValueError):
+            selector.select()
+
+    # METHOD: select_batch(self, choice_scores=None, k=1, pending=None)
+    # VALIDATE:
+    #     * virtual pulls of the choices and their groups
+
+    def test_select_batch(self):
+        """The pending pulls count for the choices and all their groups"""
+
+        # Set-up
+        selector = HierarchicalSelector(['a/x', 'a/y', 'b/z'])
+        selector.update('a/x', 0.8)
+        selector.update('a/y', 0.8)
+        selector.update('b/z', 0.8)
+
+        # Run
+        group_best = selector.select_batch(k=1, pending={'a/x': 1})
+        choice_best = selector.select_batch(k=1, pending={'a/x': 1, 'b/z': 5})
+
+        # Assert
+        assert group_best == ['b/z']
+        assert choice_best == ['a/y']
+        np.testing.assert_array_equal(selector._node_counts, [3, 2, 1, 1, 1, 1])
 
 
 class TestHierarchicalByAlgorithm(TestCase):
@@ -23,6 +191,13 @@ class TestHierarchicalByAlgorithm(TestCase):
         # Assert
         assert selector.choices is None
         assert selector.by_algorithm == by_algorithm
+        assert selector.groups == {
+            'DT': ('DT', ),
+            'RF': ('DT', ),
+            'ET': ('DT', ),
+            'LSVC': ('SVM', ),
+            'NuSVC': ('SVM', ),
+        }
 
     # METHOD: select(self, choice_scores)
     # VALIDATE:
@@ -69,3 +244,21 @@ class TestHierarchicalByAlgorithm(TestCase):
             'SVM': [0.88, 0.95, 0.93, 0.89, 0.91, 0.92]
         }
         bandit_mock.assert_called_once_with(alg_scores)
+
+    def test_select_updated(self):
+        """The algorithms are selected from the scores recorded with update"""
+
+        # Set-up
+        by_algorithm = {
+            'DT': ('DT', 'RF', 'ET'),
+            'SVM': ('LSVC', 'NuSVC'),
+        }
+        selector = HierarchicalByAlgorithm(choices=None, by_algorithm=by_algorithm)
+        selector.update('LSVC', 0.9)
+        selector.update('LSVC', 0.95)
+
+        # Run
+        best = selector.select()
+
+        # Assert
+        assert best == 'LSVC'
@@ -0,0 +1,237 @@
+from unittest import TestCase
+
+import numpy as np
+
+from btb.selection.nonstationary import DiscountedUCB, SlidingWindowUCB, _ucb
+
+
+def test__ucb():
+    # Run
+    values = _ucb(
+        np.array([0.5, 0.8, 0.2, 0.9]),
+        np.array([2., 0.5, 0., 3.]),
+        np.array([True, True, True, False]),
+        exploration=1,
+    )
+
+    # Assert
+    errors = np.sqrt(np.log(2.5) / np.array([2., 0.5]))
+    np.testing.assert_allclose(values, [0.5 + errors[0], 0.8 + errors[1], np.inf, -np.inf])
+
+
+class TestDiscountedUCB(TestCase):
+
+    # METHOD: __init__(self, choices, discount=0.99, exploration=0.5)
+    # VALIDATE:
+    #     * attribute values
+    #     * invalid discount
+
+    def test___init__(self):
+        # Run
+        selector = DiscountedUCB(['DT', 'SVM'], discount=0.5, exploration=1)
+
+        # Assert
+        assert selector.choices == ['DT', 'SVM']
+        assert selector.discount == 0.5
+        assert selector.exploration == 1
+
+    def test___init__invalid_discount(self):
+        # Run / Assert
+        with self.assertRaises(ValueError):
+            DiscountedUCB(['DT', 'SVM'], discount=1.5)
+
+    # METHOD: update(self, choice, score)
+    # VALIDATE:
+    #     * discounted statistics
+
+    def test_update(self):
+        # Set-up
+        selector = DiscountedUCB(['DT', 'SVM', 'RF'], discount=0.5)
+
+        # Run
+        selector.update('SVM', 0.4)
+        selector.update('SVM', 0.8)
+        selector.update('RF', np.nan)
+
+        # Assert
+        np.testing.assert_allclose(selector._discounted_counts, [0, 0.75, 1])
+        np.testing.assert_allclose(selector._discounted_sums, [0, 0.5, 0])
+        np.testing.assert_allclose(selector._discounted_num_rewards, [0, 0.75, 0])
+
+    def test_remove(self):
+        # Set-up
+        selector = DiscountedUCB(['DT', 'SVM', 'RF'], discount=0.5)
+        selector.update('SVM', 0.4)
+        selector.update('RF', 0.8)
+
+        # Run
+        selector.remove('SVM')
+
+        # Assert
+        np.testing.assert_allclose(selector._discounted_counts, [0, 0, 1])
+        assert selector.select() == 'RF'
+
+    # METHOD: select(self, choice_scores=None)
+    # VALIDATE:
+    #     * returned values
+
+    def test_select_updated(self):
+        """The choices that have not been selected for a while are explored again"""
+
+        # Set-up
+        selector = DiscountedUCB(['DT', 'SVM'], discount=0.5)
+        selector.update('DT', 0.5)
+        for _ in range(10):
+            selector.update('SVM', 0.9)
+
+        # Run
+        best = selector.select()
+
+        # Assert
+        assert best == 'DT'
+
+    def test_select_choice_scores(self):
+        """The scores of each choice are discounted by their position"""
+
+        # Set-up
+        selector = DiscountedUCB(['DT', 'SVM', 'RF'], discount=0.5, exploration=0)
+
+        # Run
+        choice_scores = {
+            'DT': [0.9, 0.9, 0.1],
+            'SVM': [0.1, 0.5, 0.6],
+        }
+        best = selector.select(choice_scores)
+
+        # Assert
+        assert best == 'SVM'
+
+    def test_select_no_scores(self):
+        """If no scores have been recorded, select fails"""
+
+        # Set-up
+        selector = DiscountedUCB(['DT', 'SVM'])
+
+        # Run / Assert
+        with self.assertRaises(ValueError):
+            selector.select()
+
+
+class TestSlidingWindowUCB(TestCase):
+
+    # METHOD: __init__(self, choices, window=100, exploration=0.5)
+    # VALIDATE:
+    #     * attribute values
+    #     * invalid window
+
+    def test___init__(self):
+        # Run
+        selector = SlidingWindowUCB(['DT', 'SVM'], window=10, exploration=1)
+
+        # Assert
+        assert selector.choices == ['DT', 'SVM']
+        assert selector.window == 10
+        assert selector.exploration == 1
+
+    def test___init__invalid_window(self):
+        # Run / Assert
+        with self.assertRaises(ValueError):
+            SlidingWindowUCB(['DT', 'SVM'], window=0)
+
+    # METHOD: update(self, choice, score)
+    # VALIDATE:
+    #     * statistics of the scores within the window
+
+    def test_update(self):
+        # Set-up
+        selector = SlidingWindowUCB(['DT', 'SVM', 'RF'], window=3)
+
+        # Run
+        selector.update('DT', 0.2)
+        selector.update('SVM', 0.4)
+        selector.update('SVM', 0.8)
+        selector.update('RF', np.nan)
+
+        # Assert
+        assert list(selector._window) == [(1, 0.4), (1, 0.8), (2, selector._window[2][1])]
+        np.testing.assert_array_equal(selector._window_counts, [0, 2, 1])
+        np.testing.assert_allclose(selector._window_sums, [0, 1.2, 0])
+        np.testing.assert_array_equal(selector._window_num_rewards, [0, 2, 0])
+
+    def test_remove(self):
+        # Set-up
+        selector = SlidingWindowUCB(['DT', 'SVM', 'RF'], window=3)
+        selector.update('SVM', 0.4)
+        selector.update('RF', 0.8)
+        selector.update('SVM', 0.6)
+
+        # Run
+        selector.remove('SVM')
+
+        # Assert
+        assert list(selector._window) == [(2, 0.8)]
+        np.testing.assert_array_equal(selector._window_counts, [0, 0, 1])
+        assert selector.select() == 'RF'
+
+    # METHOD: select(self, choice_scores=None)
+    # VALIDATE:
+    #     * returned values
+
+    def test_select_updated(self):
+        """The choices without scores within the window are explored again"""
+
+        # Set-up
+        selector = SlidingWindowUCB(['DT', 'SVM'], window=5)
+        selector.update('DT', 0.5)
+        for _ in range(5):
+            selector.update('SVM', 0.9)
+
+        # Run
+        best = selector.select()
+
+        # Assert
+        assert best == 'DT'
+
+    def test_select_choice_scores(self):
+        """Only the most recent scores of each choice are used"""
+
+        # Set-up
+        selector = SlidingWindowUCB(['DT', 'SVM', 'RF'], window=2, exploration=0)
+
+        # Run
+        choice_scores = {
+            'DT': [0.9, 0.9, 0.1, 0.1],
+            'SVM': [0.1, 0.5, 0.6],
+        }
+        best = selector.select(choice_scores)
+
+        # Assert
+        assert best == 'SVM'
+
+    def test_select_no_scores(self):
+        """If no scores have been recorded, select fails"""
+
+        # Set-up
+        selector = SlidingWindowUCB(['DT', 'SVM'])
+
+        # Run / Assert
+        with self.assertRaises(ValueError):
+            selector.select()
+
+    # METHOD: select_batch(self, choice_scores=None, k=1, pending=None)
+    # VALIDATE:
+    #     * pending pulls
+
+    def test_select_batch_pending(self):
+        """The choices with pending pulls have a lower UCB index"""
+
+        # Set-up
+        selector = SlidingWindowUCB(['DT', 'SVM', 'RF'])
+        selector.update('SVM', 0.8)
+        selector.update('RF', 0.8)
+
+        # Run
+        best = selector.select_batch(k=2, pending={'SVM': 3})
+
+        # Assert
+        assert best == ['RF', 'RF']
@@ -117,3 +117,75 @@ class TestPureBestKVelocity(TestCase):
             'SVM': [1],
         }
         bandit_mock.assert_called_once_with(choice_rewards)
+
+    # METHOD: select(self, choice_scores=None)
+    # VALIDATE:
+    #     * returned values when the scores are recorded with update
+
+    def test_select_updated_more_scores_than_k_min(self):
+        """The choice with the highest best-K velocity is selected"""
+
+        # Set-up
+        selector = PureBestKVelocity(['DT', 'RF', 'SVM'])
+        choice_scores = {
+            'DT': [0.7, 0.75, 0.73],
+            'RF': [0.8, 0.85, 0.83],
+            'SVM': [0.8, 0.95, 0.91],
+        }
+        for choice, scores in choice_scores.items():
+            for score in scores:
+                selector.update(choice, score)
+
+        # Run
+        best = selector.select()
+
+        # Assert
+        assert best == selector.select(choice_scores)
+        assert best == 'SVM'
+
+    def test_select_updated_less_scores_than_k_min(self):
+        """The choice with the fewest scores is selected"""
+
+        # Set-up
+        selector = PureBestKVelocity(['DT', 'RF', 'SVM'])
+        selector.update('DT', 0.7)
+        selector.update('RF', 0.8)
+        selector.update('RF', 0.85)
+
+        # Run
+        best = selector.select()
+
+        # Assert
+        assert best == 'DT'
+
+    def test_select_no_scores(self):
+        """If no scores have been recorded, select fails"""
+
+        # Set-up
+        selector = PureBestKVelocity(['RF', 'SVM'])
+
+        # Run / Assert
+        with self.assertRaises(ValueError):
+            selector.select()
+
+    # METHOD: select_batch(self, choice_scores=None, k=1, pending=None)
+    # VALIDATE:
+    #     * pending pulls
+
+    def test_select_batch_pending(self):
+        """The pending pulls count as scores of their choices"""
+
+        # Set-up
+        selector = PureBestKVelocity(['DT', 'RF', 'SVM'])
+        selector.update('DT', 0.7)
+        selector.update('RF', 0.8)
+        selector.update('RF', 0.85)
+        selector.update('SVM', 0.8)
+        selector.update('SVM', 0.85)
+        selector.update('SVM', 0.9)
+
+        # Run
+        best = selector.select_batch(k=3, pending={'DT': 1})
+
+        # Assert
+        assert best == ['DT', 'RF', 'DT']
@@ -26,7 +26,7 @@ class TestRecentKReward(TestCase):
     #     * returned values
 
     def test_compute_rewards(self):
-        """Last scores are zeroed"""
+        """Oldest scores are zeroed"""
 
         # Set-up
         selector = RecentKReward(['RF', 'SVM'], k=3)
@@ -36,7 +36,8 @@ class TestRecentKReward(TestCase):
         rewards = selector.compute_rewards(scores)
 
         # Assert
-        assert rewards == [0.5, 0.6, 0.75, 0., 0.]
+        assert rewards == [0., 0., 0.75, 0.8, 0.9]
+        assert scores == [0.5, 0.6, 0.75, 0.8, 0.9]
 
     # METHOD: select(self, choice_scores)
     # VALIDATE:
@@ -69,8 +70,8 @@ class TestRecentKReward(TestCase):
         assert best == 'SVM'
 
         choice_rewards = {
-            'RF': [0.8, 0.85, 0.],
-            'SVM': [0.9, 0.95, 0.],
+            'RF': [0., 0.85, 0.83],
+            'SVM': [0., 0.95, 0.93],
         }
         bandit_mock.assert_called_once_with(choice_rewards)
 
@@ -103,6 +104,76 @@ class TestRecentKReward(TestCase):
         }
         bandit_mock.assert_called_once_with(choice_rewards)
 
+    # METHOD: update(self, choice, score)
+    # VALIDATE:
+    #     * rewards computed from the recent scores
+
+    def test_update(self):
+        """The rewards are the same as the ones computed from all the scores"""
+
+        # Set-up
+        selector = RecentKReward(['RF', 'SVM'], k=3)
+        choice_scores = {
+            'RF': [0.5, 0.6, 0.75, 0.8, 0.9],
+            'SVM': [0.7, 0.65],
+        }
+
+        # Run
+        for choice, scores in choice_scores.items():
+            for score in scores:
+                selector.update(choice, score)
+
+        average_rewards, pulls = selector._get_recent_k_rewards()
+
+        # Assert
+        np.testing.assert_allclose(average_rewards, [0.49, 0.675])
+        np.testing.assert_array_equal(pulls, [5, 2])
+
+    def test_remove(self):
+        """The recent scores of the removed choice are forgotten"""
+
+        # Set-up
+        selector = RecentKReward(['RF', 'SVM'], k=2)
+        for score in [0.5, 0.6, 0.75]:
+            selector.update('RF', score)
+
+        # Run
+        selector.remove('RF')
+        selector.update('RF', 0.9)
+
+        # Assert
+        average_rewards, pulls = selector._get_recent_k_rewards()
+        np.testing.assert_allclose(average_rewards, [0.9, 0.])
+        np.testing.assert_array_equal(pulls, [1, 0])
+
+    # METHOD: select(self, choice_scores=None)
+    # VALIDATE:
+    #     * returned values when the scores are recorded with update
+
+    def test_select_updated(self):
+        """Only the choices with scores are selected"""
+
+        # Set-up
+        selector = RecentKReward(['DT', 'RF', 'SVM'])
+        for score in [0.8, 0.85, 0.83]:
+            selector.update('RF', score)
+
+        # Run
+        best = selector.select()
+
+        # Assert
+        assert best == 'RF'
+
+    def test_select_no_scores(self):
+        """If no scores have been recorded, select fails"""
+
+        # Set-up
+        selector = RecentKReward(['RF', 'SVM'])
+
+        # Run / Assert
+        with self.assertRaises(ValueError):
+            selector.select()
+
 
 class TestRecentKVelocity(TestCase):
 
@@ -135,3 +206,28 @@ class TestRecentKVelocity(TestCase):
 
         # Assert
         np.testing.assert_allclose(rewards, [0.05, 0.15, 0.1, 0., 0.])
+
+    # METHOD: update(self, choice, score)
+    # VALIDATE:
+    #     * rewards computed from the recent scores
+
+    def test_update(self):
+        """The rewards are the same as the ones computed from all the scores"""
+
+        # Set-up
+        selector = RecentKVelocity(['RF', 'SVM'], k=3)
+        choice_scores = {
+            'RF': [0.1, 0.5, 0.6, 0.75, 0.8],
+            'SVM': [0.7, 0.65],
+        }
+
+        # Run
+        for choice, scores in choice_scores.items():
+            for score in scores:
+                selector.update(choice, score)
+
+        average_rewards, pulls = selector._get_recent_k_rewards()
+
+        # Assert
+        np.testing.assert_allclose(average_rewards, [0.06, -0.05])
+        np.testing.assert_array_equal(pulls, [5, 1])
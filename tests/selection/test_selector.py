@@ -1,4 +1,8 @@
 from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+from pytest import approx
 
 from btb.selection.selector import Selector
 
@@ -72,3 +76,90 @@ class TestSelector(TestCase):
 
         # Assert
         assert best == 'SVM'
+
+    def test_update(self):
+
+        # Set-up
+        selector = Selector(['RF', 'SVM'])
+
+        # Run
+        selector.update('RF', 0.8)
+        selector.update('RF', 0.9)
+
+        # Assert
+        assert selector._choice_scores == {'RF': [0.8, 0.9]}
+
+    def test_update_unknown_choice(self):
+
+        # Set-up
+        selector = Selector(['RF', 'SVM'])
+
+        # Run / Assert
+        with self.assertRaises(ValueError):
+            selector.update('DT', 0.8)
+
+    def test_select_updated(self):
+        """Only the choices with recorded scores are considered."""
+
+        # Set-up
+        selector = Selector(['RF', 'SVM', 'DT'])
+        selector.update('RF', 0.8)
+        selector.update('SVM', 0.9)
+        selector.update('SVM', 0.95)
+        selector.remove('SVM')
+
+        # Run
+        best = selector.select()
+
+        # Assert
+        assert best == 'RF'
+
+    # METHOD: select_batch(self, choice_scores=None, k=1, pending=None)
+    # VALIDATE:
+    #     * hallucinated scores passed to select
+    #     * given scores are not modified
+
+    @patch('btb.selection.selector.Selector.select')
+    def test_select_batch(self, select_mock):
+        """The pending and selected choices get scores equal to their mean."""
+
+        # Set-up
+        selector = Selector(['RF', 'SVM', 'DT'])
+        select_mock.side_effect = ['SVM', 'DT']
+
+        # Run
+        choice_scores = {
+            'RF': [0.8, 0.9, np.nan],
+            'SVM': [0.6],
+            'DT': [],
+        }
+        best = selector.select_batch(choice_scores, k=2, pending={'RF': 2, 'KNN': 1})
+
+        # Assert
+        assert best == ['SVM', 'DT']
+        assert choice_scores == {
+            'RF': [0.8, 0.9, approx(np.nan, nan_ok=True)],
+            'SVM': [0.6],
+            'DT': [],
+        }
+
+        hallucinated = select_mock.call_args[0][0]
+        assert hallucinated == {
+            'RF': [0.8, 0.9, approx(np.nan, nan_ok=True), approx(0.85), approx(0.85)],
+            'SVM': [0.6, 0.6],
+            'DT': [0.],
+        }
+
+    def test_select_batch_updated(self):
+        """The scores recorded with update are used and not modified."""
+
+        # Set-up
+        selector = Selector(['RF', 'SVM'])
+        selector.update('RF', 0.8)
+
+        # Run
+        best = selector.select_batch(k=2, pending={'RF': 1})
+
+        # Assert
+        assert best == ['RF', 'RF']
+        assert selector._choice_scores == {'RF': [0.8]}
@@ -0,0 +1,192 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+
+from btb.selection.thompson import BetaThompsonSampling, GaussianThompsonSampling, ThompsonSampling
+
+
+class TestThompsonSampling(TestCase):
+
+    def test___init__abstract(self):
+        with self.assertRaises(TypeError):
+            ThompsonSampling(['DT', 'SVM'])
+
+
+class TestGaussianThompsonSampling(TestCase):
+
+    # METHOD: update(self, choice, score)
+    # VALIDATE:
+    #     * statistics of the rewards
+
+    def test_update(self):
+        # Set-up
+        selector = GaussianThompsonSampling(['DT', 'SVM', 'RF'])
+
+        # Run
+        selector.update('SVM', 0.5)
+        selector.update('SVM', 0.7)
+        selector.update('RF', np.nan)
+
+        # Assert
+        np.testing.assert_array_equal(selector._counts, [0, 2, 1])
+        np.testing.assert_array_equal(selector._num_rewards, [0, 2, 0])
+        np.testing.assert_allclose(selector._sums, [0, 1.2, 0])
+        np.testing.assert_allclose(selector._squares, [0, 0.74, 0])
+
+    def test_remove(self):
+        # Set-up
+        selector = GaussianThompsonSampling(['DT', 'SVM', 'RF'])
+        selector.update('SVM', 0.5)
+        selector.update('RF', 0.7)
+
+        # Run
+        selector.remove('SVM')
+
+        # Assert
+        np.testing.assert_array_equal(selector._counts, [0, 0, 1])
+        np.testing.assert_allclose(selector._sums, [0, 0, 0.7])
+        assert selector.select() == 'RF'
+
+    # METHOD: _sample(self, num_rewards, sums, squares)
+    # VALIDATE:
+    #     * arguments passed to np.random.normal
+
+    @patch('btb.selection.thompson.np.random.normal')
+    def test__sample(self, normal_mock):
+        # Set-up
+        selector = GaussianThompsonSampling(['DT', 'SVM'])
+        normal_mock.return_value = np.array([0.5, 0.8])
+
+        # Run
+        samples = selector._sample(
+            np.array([0, 3]), np.array([0., 2.4]), np.array([0., 1.94]))
+
+        # Assert
+        np.testing.assert_array_equal(samples, [0.5, 0.8])
+
+        # prior mean 0.8 and variance 0.02 / 3, which is also the variance of SVM
+        means, stds = normal_mock.call_args[0]
+        np.testing.assert_allclose(means, [0.8, 0.8])
+        np.testing.assert_allclose(stds, [np.sqrt(0.02 / 3), np.sqrt(0.02 / 3) / 2])
+
+    # METHOD: select(self, choice_scores=None)
+    # VALIDATE:
+    #     * returned values
+
+    def test_select_updated(self):
+        """The choice with clearly better scores is selected"""
+
+        # Set-up
+        selector = GaussianThompsonSampling(['DT', 'SVM', 'RF'])
+        for score in [0.9, 0.91, 0.92]:
+            selector.update('SVM', score)
+
+        for score in [0.1, 0.11, 0.12]:
+            selector.update('RF', score)
+
+        # Run
+        best = selector.select()
+
+        # Assert
+        assert best == 'SVM'
+
+    def test_select_choice_scores(self):
+        """Only the given choices are selected"""
+
+        # Set-up
+        selector = GaussianThompsonSampling(['DT', 'SVM', 'RF'])
+
+        # Run
+        choice_scores = {
+            'DT': [0.1, 0.11, 0.12],
+            'RF': [0.9, 0.91, 0.92],
+            'KNN': [1.0, 1.0, 1.0],
+        }
+        best = selector.select(choice_scores)
+
+        # Assert
+        assert best == 'RF'
+
+    def test_select_no_scores(self):
+        """If no scores have been recorded, select fails"""
+
+        # Set-up
+        selector = GaussianThompsonSampling(['DT', 'SVM'])
+
+        # Run / Assert
+        with self.assertRaises(ValueError):
+            selector.select()
+
+
+class TestBetaThompsonSampling(TestCase):
+
+    # METHOD: compute_rewards(self, scores)
+    # VALIDATE:
+    #     * returned values
+
+    def test_compute_rewards(self):
+        # Set-up
+        selector = BetaThompsonSampling(['DT', 'SVM'])
+
+        # Run
+        rewards = selector.compute_rewards([-0.5, 0.5, 1.5])
+
+        # Assert
+        assert rewards == [0., 0.5, 1.]
+
+    # METHOD: select(self, choice_scores=None)
+    # VALIDATE:
+    #     * arguments passed to np.random.beta
+
+    @patch('btb.selection.thompson.np.random.beta')
+    def test_select_updated(self, beta_mock):
+        # Set-up
+        selector = BetaThompsonSampling(['DT', 'SVM', 'RF'])
+        selector.update('SVM', 0.5)
+        selector.update('SVM', 1.5)
+        selector.update('RF', 0.2)
+        beta_mock.return_value = np.array([1., 0.3, 0.6])
+
+        # Run
+        best = selector.select()
+
+        # Assert
+        assert best == 'RF'
+
+        alphas, betas = beta_mock.call_args[0]
+        np.testing.assert_allclose(alphas, [1, 2.5, 1.2])
+        np.testing.assert_allclose(betas, [1, 1.5, 1.8])
+
+    # METHOD: select_batch(self, choice_scores=None, k=1, pending=None)
+    # VALIDATE:
+    #     * hallucinated rewards
+
+    def test__add_hallucinated(self):
+        # Run
+        num_rewards, sums, squares = BetaThompsonSampling._add_hallucinated(
+            np.array([0, 2, 2]), np.array([0., 1., 1.6]), np.array([0., 0.5, 1.3]),
+            np.array([1, 2, 0]))
+
+        # Assert
+        np.testing.assert_array_equal(num_rewards, [1, 4, 2])
+        np.testing.assert_allclose(sums, [0.65, 2., 1.6])
+        np.testing.assert_allclose(squares, [0.4225, 1., 1.3])
+
+    @patch('btb.selection.thompson.np.random.beta')
+    def test_select_batch(self, beta_mock):
+        # Set-up
+        selector = BetaThompsonSampling(['DT', 'SVM', 'RF'])
+        selector.update('SVM', 0.5)
+        selector.update('RF', 0.2)
+        beta_mock.side_effect = [np.array([1., 0.6, 0.3]), np.array([1., 0.3, 0.6])]
+
+        # Run
+        best = selector.select_batch(k=2, pending={'RF': 1})
+
+        # Assert
+        assert best == ['SVM', 'RF']
+
+        alphas, betas = beta_mock.call_args[0]
+        np.testing.assert_allclose(alphas, [1, 2, 1.4])
+        np.testing.assert_allclose(betas, [1, 2, 2.6])
@@ -1,6 +1,8 @@
 from unittest import TestCase
 from unittest.mock import patch
 
+import numpy as np
+
 from btb.selection.ucb1 import UCB1
 
 
@@ -40,3 +42,141 @@ class TestUCB1(TestCase):
             'SVM': [0.9, 0.93, 0.95]
         }
         mock__shuffle.assert_called_once_with(call_rewards)
+
+    def test_update(self):
+        # Set-up
+        selector = UCB1(['DT', 'SVM', 'RF'])
+
+        # Run
+        selector.update('SVM', 0.5)
+        selector.update('SVM', 0.7)
+        selector.update('RF', np.nan)
+
+        # Assert
+        np.testing.assert_array_equal(selector._counts, [0, 2, 1])
+        np.testing.assert_allclose(selector._sums, [0, 1.2, 0])
+        np.testing.assert_array_equal(selector._num_rewards, [0, 2, 0])
+
+    def test_remove(self):
+        # Set-up
+        selector = UCB1(['DT', 'SVM'])
+        selector.update('SVM', 0.5)
+        selector.update('DT', 0.1)
+
+        # Run
+        selector.remove('SVM')
+
+        # Assert
+        np.testing.assert_array_equal(selector._counts, [1, 0])
+        assert selector.select() == 'DT'
+
+    def test_select_updated(self):
+        """The recorded statistics select the same choice as the score lists."""
+        # Set-up
+        choice_scores = {
+            'DT': [0.7, 0.8, 0.9],
+            'RF': [0.9, 0.93],
+            'SVM': [0.5],
+        }
+        selector = UCB1(['DT', 'SVM', 'RF', 'ET'])
+        for choice, scores in choice_scores.items():
+            for score in scores:
+                selector.update(choice, score)
+
+        # Run
+        best = selector.select()
+
+        # Assert
+        assert best == selector.select(choice_scores) == 'SVM'
+        expected_ucb1 = [
+            0.8 + np.sqrt(2 * np.log(6) / 3),
+            0.5 + np.sqrt(2 * np.log(6)),
+            0.915 + np.sqrt(2 * np.log(6) / 2),
+            -np.inf,
+        ]
+        np.testing.assert_allclose(selector._ucb1(*selector._get_rewards()), expected_ucb1)
+
+    @patch('btb.selection.ucb1.np.random.choice')
+    def test_select_updated_ties(self, mock_choice):
+        """Ties are broken at random."""
+        # Set-up
+        mock_choice.return_value = 2
+        selector = UCB1(['DT', 'SVM', 'RF'])
+        selector.update('RF', 0.9)
+        selector.update('SVM', 0.9)
+
+        # Run
+        best = selector.select()
+
+        # Assert
+        assert best == 'RF'
+        np.testing.assert_array_equal(mock_choice.call_args[0][0], [1, 2])
+
+    def test_select_no_scores(self):
+        # Set-up
+        selector = UCB1(['DT', 'SVM'])
+
+        # Run / Assert
+        with self.assertRaises(ValueError):
+            selector.select()
+
+    # METHOD: select_batch(self, choice_scores=None, k=1, pending=None)
+    # VALIDATE:
+    #     * returned values
+    #     * pending pulls
+
+    def test_select_batch(self):
+        """The virtual pulls of the batch spread it across the choices"""
+
+        # Set-up
+        selector = UCB1(['DT', 'SVM', 'RF'])
+        selector.update('SVM', 0.8)
+        selector.update('RF', 0.8)
+
+        # Run
+        best = selector.select_batch(k=4)
+
+        # Assert
+        assert sorted(best) == ['RF', 'RF', 'SVM', 'SVM']
+        np.testing.assert_array_equal(selector._counts, [0, 1, 1])
+
+    def test_select_batch_pending(self):
+        """The choices with pending pulls have a lower UCB1 index"""
+
+        # Set-up
+        selector = UCB1(['DT', 'SVM', 'RF'])
+        selector.update('SVM', 0.8)
+        selector.update('RF', 0.8)
+
+        # Run
+        best = selector.select_batch(k=2, pending={'SVM': 3})
+
+        # Assert
+        assert best == ['RF', 'RF']
+
+    def test_select_batch_choice_scores(self):
+        """The given scores get hallucinated scores for the pending pulls"""
+
+        # Set-up
+        selector = UCB1(['DT', 'SVM', 'RF'])
+
+        # Run
+        choice_scores = {
+            'SVM': [0.8],
+            'RF': [0.8],
+        }
+        best = selector.select_batch(choice_scores, k=2, pending={'SVM': 3})
+
+        # Assert
+        assert best == ['RF', 'RF']
+        assert choice_scores == {'SVM': [0.8], 'RF': [0.8]}
+
+    def test_select_batch_no_scores(self):
+        """If no scores have been recorded, select_batch fails"""
+
+        # Set-up
+        selector = UCB1(['DT', 'SVM', 'RF'])
+
+        # Run / Assert
+        with self.assertRaises(ValueError):
+            selector.select_batch(k=2)
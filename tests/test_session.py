@@ -1,13 +1,15 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 from unittest.mock import MagicMock, call, patch
 
 import numpy as np
 from tqdm.autonotebook import trange
 
-from btb.session import BTBSession
+from btb.session import BTBSession, Trial
 from btb.tuning.tuners.base import StopTuning
 from btb.tuning.tuners.gaussian_process import GPTuner
 
@@ -52,6 +54,7 @@ class TestBTBSession(TestCase):
         assert instance._range is range
         assert instance._max_errors == 1
         assert instance._maximize
+        assert instance._pending == Counter()
 
         assert instance.best_score is None
         assert instance.best_proposal is None
@@ -112,16 +115,31 @@ class TestBTBSession(TestCase):
 
         assert result == expected_result
 
+    def test__remove_tunable(self):
+        # setup
+        instance = MagicMock(spec_set=BTBSession)
+        instance._normalized_scores = {'test': [0.1], 'other': [0.2]}
+        instance._tunables = {'test': 'test_spec', 'other': 'other_spec'}
+
+        # run
+        BTBSession._remove_tunable(instance, 'test')
+
+        # assert
+        assert instance._normalized_scores == {'other': [0.2]}
+        assert instance._tunables == {'other': 'other_spec'}
+        instance._selector.remove.assert_called_once_with('test')
+
     @patch('btb.session.np.random.choice')
     def test__get_next_tunable_name_normalized_scores(self, mock_np_random_choice):
         # setup
         mock_np_random_choice.return_value = 'test_name'
         selector = MagicMock()
-        selector.select.return_value = 'test_name'
+        selector.select_batch.return_value = ['test_name']
 
         instance = MagicMock(spec_set=BTBSession)
         instance._normalized_scores = [('test_name', 0.1), ('second_test_name', 0.2)]
         instance._selector = selector
+        instance._pending = Counter({'test_name': 1})
 
         # run
         tunable_name = BTBSession._get_next_tunable_name(instance)
@@ -129,10 +147,7 @@ class TestBTBSession(TestCase):
         # assert
         assert tunable_name == 'test_name'
         mock_np_random_choice.assert_not_called()
-        selector.select.assert_called_once_with([
-            ('test_name', 0.1),
-            ('second_test_name', 0.2),
-        ])
+        selector.select_batch.assert_called_once_with(k=1, pending={'test_name': 1})
 
     @patch('btb.session.np.random.choice')
     def test__get_next_tunable_name_normalized_scores_none(self, mock_np_random_choice):
@@ -157,18 +172,43 @@ class TestBTBSession(TestCase):
         assert tunable_name == 'test_name'
         mock_np_random_choice.assert_called_once_with(expected_mock_call)
 
-    def test_propose_no_tunables(self):
+    def test__get_tuner_class(self):
+        # setup
+        instance = MagicMock(spec_set=BTBSession)
+        instance._tuner_class = 'my_tuner'
+
+        # run
+        result = BTBSession._get_tuner_class(instance, 'test_tunable')
+
+        # assert
+        assert result == 'my_tuner'
+
+    def test__get_tuner_class_dict(self):
+        # setup
+        instance = MagicMock(spec_set=BTBSession)
+        instance._tuner_class = {'test_tunable': 'my_tuner'}
+
+        # run
+        result = BTBSession._get_tuner_class(instance, 'test_tunable')
+        default = BTBSession._get_tuner_class(instance, 'other_tunable')
+
+        # assert
+        assert result == 'my_tuner'
+        assert default is GPTuner
+
+    def test__propose_config_no_tunables(self):
         # setup
         instance = MagicMock(spec_set=BTBSession)
         instance._tunables = None
 
         # run
         with self.assertRaises(StopTuning):
-            BTBSession.propose(instance)
+            BTBSession._propose_config(instance)
 
     @patch('btb.session.isinstance')
     @patch('btb.session.Tunable')
-    def test_propose_normalized_scores_lt_tunable_names(self, mock_tunable, mock_isinstance):
+    def test__propose_config_normalized_scores_lt_tunable_names(self, mock_tunable,
+                                                                mock_isinstance):
         # setup
         mock_tunable.from_dict.return_value.get_defaults.return_value = 'defaults'
         mock_isinstance.return_value = True
@@ -176,98 +216,68 @@ class TestBTBSession(TestCase):
         tuner = MagicMock()
 
         instance = MagicMock(spec_set=BTBSession)
-        instance._tuner_class = tuner
-        instance.proposals = {}
-        instance._normalized_scores.__len__.return_value = 0
+        instance._get_tuner_class.return_value = tuner
+        instance._tuners = {}
         instance._tunables = {'test_tunable': 'test_spec'}
         instance._tunable_names = ['test_tunable']
 
-        instance._make_id.return_value = 1
-
         # run
-        res_name, res_config = BTBSession.propose(instance)
+        res_name, res_config = BTBSession._propose_config(instance)
 
         # assert
         assert res_name == 'test_tunable'
         assert res_config == 'defaults'
 
-        expected_proposals = {
-            1: {
-                'id': 1,
-                'name': 'test_tunable',
-                'config': 'defaults'
-            }
-        }
-        assert instance.proposals == expected_proposals
-
-        instance._make_id.assert_called_once_with('test_tunable', 'defaults')
         mock_tunable.from_dict.assert_called_once_with('test_spec')
+        instance._get_tuner_class.assert_called_once_with('test_tunable')
         tuner.assert_called_once_with(mock_tunable.from_dict.return_value)
+        tuner.return_value.mark_pending.assert_called_once_with('defaults')
         mock_tunable.from_dict.return_value.get_defaults.assert_called_once_with()
 
-        expected_isinstance_calls = [call('test_spec', dict), call('defaults', mock_tunable)]
-        mock_isinstance.has_calls(expected_isinstance_calls)
-
-    def test_propose_normalized_scores_gt_tunable_names(self):
+    def test__propose_config_normalized_scores_gt_tunable_names(self):
         # setup
         tuner = MagicMock()
         tuner.propose.return_value = 'parameters'
 
         instance = MagicMock(spec_set=BTBSession)
-        instance.proposals = {}
-        instance._normalized_scores.__len__.return_value = 1
-
-        instance._selector.select.return_value = 'test_tunable'
         instance._tuners = {'test_tunable': tuner}
         instance._tunables = {'test_tunable': 'test_spec'}
         instance._tunable_names = ['test_tunable']
         instance._get_next_tunable_name.return_value = 'test_tunable'
 
-        instance._make_id.return_value = 1
-
         # run
-        res_name, res_config = BTBSession.propose(instance)
+        res_name, res_config = BTBSession._propose_config(instance)
 
         # assert
         assert res_name == 'test_tunable'
         assert res_config == 'parameters'
 
-        expected_proposals = {
-            1: {
-                'id': 1,
-                'name': 'test_tunable',
-                'config': 'parameters'
-            }
-        }
-        assert instance.proposals == expected_proposals
-
-        instance._make_id.assert_called_once_with('test_tunable', 'parameters')
         tuner.propose.assert_called_once_with(1)
+        tuner.mark_pending.assert_called_once_with('parameters')
 
-    def test_propose_raise_error(self):
+    def test__propose_config_raise_error(self):
         # setup
-
         tuner = MagicMock()
         tuner.propose.side_effect = [StopTuning('test')]
 
         instance = MagicMock(spec_set=BTBSession)
-        instance._normalized_scores.__len__.return_value = 1
-
-        instance._selector.select.return_value = 'test_tunable'
         instance._tuners = {'test_tunable': tuner}
         instance._tunables = {'test_tunable': 'test_spec'}
         instance._tunable_names = ['test_tunable']
         instance._get_next_tunable_name.return_value = 'test_tunable'
-
-        instance._make_id.return_value = 1
+        instance._propose_config.return_value = ('other_tunable', 'parameters')
 
         # run
-        with self.assertRaises(ValueError):
-            BTBSession.propose(instance)
+        res_name, res_config = BTBSession._propose_config(instance)
+
+        # assert
+        assert res_name == 'other_tunable'
+        assert res_config == 'parameters'
+        instance._remove_tunable.assert_called_once_with('test_tunable')
 
     @patch('btb.session.isinstance')
     @patch('btb.session.Tunable')
-    def test_propose_tunable_cardinality_eq_one(self, mock_tunable, mock_isinstance):
+    def test__propose_config_tunable_cardinality_eq_one(self, mock_tunable, mock_isinstance):
         # setup
         mock_tunable.from_dict.return_value.cardinality = 1
         mock_tunable.from_dict.return_value.get_defaults.return_value = 'parameters'
@@ -276,32 +286,113 @@ class TestBTBSession(TestCase):
         instance = MagicMock(spec_set=BTBSession)
         instance._tuners = {}
         instance._tunable_names = ['test_tunable']
-        instance.proposals = {}
-
-        instance._make_id.return_value = 1
 
         # run
-        tunable_name, config = BTBSession.propose(instance)
+        tunable_name, config = BTBSession._propose_config(instance)
 
         # assert
-        instance._make_id.assert_called_once_with('test_tunable', 'parameters')
-        instance._tuner_class.assert_not_called()
+        instance._get_tuner_class.assert_not_called()
 
         assert instance._tuners == {'test_tunable': None}
         assert 'test_tunable' == tunable_name
         assert 'parameters' == config
 
-    def test_propose_tuner_is_none(self):
+    def test__propose_config_tuner_is_none(self):
         # setup
         instance = MagicMock(spec_set=BTBSession)
         instance._tuners = {'test_tunable': None}
         instance._tunable_names = ['test_tunable']
-        instance._normalized_scores = None
         instance._get_next_tunable_name.return_value = 'test_tunable'
+        instance._propose_config.return_value = ('other_tunable', 'parameters')
 
         # run
-        with self.assertRaises(ValueError):
-            BTBSession.propose(instance)
+        BTBSession._propose_config(instance)
+
+        # assert
+        instance._remove_tunable.assert_called_once_with('test_tunable')
+
+    def test__make_trial(self):
+        # setup
+        instance = MagicMock(spec_set=BTBSession)
+        instance._trial_ids = iter([3])
+        instance._pending = Counter()
+        instance.proposals = {}
+
+        # run
+        trial = BTBSession._make_trial(instance, 'test_tunable', 'parameters')
+
+        # assert
+        assert trial == Trial(3, 'test_tunable', 'parameters')
+        assert instance._pending == {'test_tunable': 1}
+        assert instance.proposals == {
+            3: {
+                'id': 3,
+                'name': 'test_tunable',
+                'config': 'parameters'
+            }
+        }
+
+    def test_ask(self):
+        # setup
+        instance = MagicMock(spec_set=BTBSession)
+        instance._propose_config.return_value = ('test_tunable', 'parameters')
+
+        # run
+        trial = BTBSession.ask(instance)
+
+        # assert
+        assert trial == instance._make_trial.return_value
+        instance._make_trial.assert_called_once_with('test_tunable', 'parameters')
+
+    def test_ask_n(self):
+        # setup
+        instance = MagicMock(spec_set=BTBSession)
+        instance._propose_config.side_effect = [('a', 'config_a'), ('b', 'config_b')]
+        instance._make_trial.side_effect = ['trial_a', 'trial_b']
+
+        # run
+        trials = BTBSession.ask(instance, 2)
+
+        # assert
+        assert trials == ['trial_a', 'trial_b']
+
+    def test_ask_n_stop_tuning(self):
+        """If the proposals run out, the trials generated until then are returned."""
+        # setup
+        instance = MagicMock(spec_set=BTBSession)
+        instance._propose_config.side_effect = [('a', 'config_a'), StopTuning('test')]
+        instance._make_trial.side_effect = ['trial_a']
+
+        # run
+        trials = BTBSession.ask(instance, 3)
+
+        # assert
+        assert trials == ['trial_a']
+
+    def test_ask_n_stop_tuning_no_trials(self):
+        # setup
+        instance = MagicMock(spec_set=BTBSession)
+        instance._propose_config.side_effect = StopTuning('test')
+
+        # run / assert
+        with self.assertRaises(StopTuning):
+            BTBSession.ask(instance, 3)
+
+    def test_propose(self):
+        # setup
+        instance = MagicMock(spec_set=BTBSession)
+        instance.ask.return_value = Trial(0, 'test_tunable', 'parameters')
+        instance._make_id.return_value = 'proposal_id'
+        instance._proposal_ids = {'proposal_id': [5]}
+
+        # run
+        res_name, res_config = BTBSession.propose(instance)
+
+        # assert
+        assert res_name == 'test_tunable'
+        assert res_config == 'parameters'
+        assert instance._proposal_ids == {'proposal_id': [5, 0]}
+        instance._make_id.assert_called_once_with('test_tunable', 'parameters')
 
     def test_handle_error_errors_lt_max_errors(self):
         # setup
@@ -328,27 +419,33 @@ class TestBTBSession(TestCase):
         # assert
         instance._remove_tunable.assert_called_once_with('test')
 
-    def test_record_score_is_none(self):
+    def test_tell_many_score_is_none(self):
         # setup
+        tuner = MagicMock()
+
         instance = MagicMock(spec_set=BTBSession)
-        instance._make_id.return_value = 0
-        instance.proposals = [{'test': 'test'}]
-        instance.errors = Counter()
-        instance._max_errors = 5
+        instance.proposals = {0: {'test': 'test'}}
+        instance._pending = Counter({'test': 1})
+        instance._tuners = {'test': tuner}
 
         # run
-        BTBSession.record(instance, 'test', 'config', None)
+        BTBSession.tell_many(instance, [Trial(0, 'test', 'config')], [None])
 
         # assert
+        assert instance.proposals == {0: {'test': 'test', 'score': None}}
+        assert instance._pending == Counter()
         instance.handle_error.assert_called_once_with('test')
+        tuner.clear_pending.assert_called_once_with('config')
+        tuner.record.assert_not_called()
 
-    def test_record_score_gt_best(self):
+    def test_tell_many_score_gt_best(self):
         # setup
         tuner = MagicMock()
 
         instance = MagicMock(spec_set=BTBSession)
-        instance._make_id.return_value = 0
-        instance.proposals = [{'test': 'test'}]
+        instance.proposals = {0: {'test': 'test'}}
+        instance._pending = Counter({'test': 1})
+        instance._tunables = {'test': 'test_spec'}
         instance._tuners = {'test': tuner}
         instance.best_proposal = None
 
@@ -357,7 +454,7 @@ class TestBTBSession(TestCase):
         instance._normalized_scores = defaultdict(list)
 
         # run
-        BTBSession.record(instance, 'test', 'config', 1)
+        BTBSession.tell_many(instance, [Trial(0, 'test', 'config')], [1])
 
         # assert
         expected_normalized_scores = defaultdict(list)
@@ -367,13 +464,15 @@ class TestBTBSession(TestCase):
         assert instance.best_proposal == {'test': 'test', 'score': 1}
         assert instance._best_normalized == 1
 
-        tuner.record.assert_called_once_with('config', 1)
+        instance._selector.update.assert_called_once_with('test', 1)
+        tuner.record.assert_called_once_with(['config'], [1])
 
-    def test_record_score_gt_best_tuner_none(self):
+    def test_tell_many_score_gt_best_tuner_none(self):
         # setup
         instance = MagicMock(spec_set=BTBSession)
-        instance._make_id.return_value = 0
-        instance.proposals = [{'test': 'test'}]
+        instance.proposals = {0: {'test': 'test'}}
+        instance._pending = Counter({'test': 1})
+        instance._tunables = {'test': 'test_spec'}
         instance._tuners = {'test': None}
         instance.best_proposal = None
 
@@ -382,7 +481,7 @@ class TestBTBSession(TestCase):
         instance._normalized_scores = defaultdict(list)
 
         # run
-        BTBSession.record(instance, 'test', 'config', 1)
+        BTBSession.tell_many(instance, [Trial(0, 'test', 'config')], [1])
 
         # assert
         expected_normalized_scores = defaultdict(list)
@@ -392,13 +491,14 @@ class TestBTBSession(TestCase):
         assert instance.best_proposal == {'test': 'test', 'score': 1}
         assert instance._best_normalized == 1
 
-    def test_record_score_lt_best(self):
+    def test_tell_many_score_lt_best(self):
         # setup
         tuner = MagicMock()
 
         instance = MagicMock(spec_set=BTBSession)
-        instance._make_id.return_value = 0
-        instance.proposals = [{'test': 'test'}]
+        instance.proposals = {0: {'test': 'test'}}
+        instance._pending = Counter({'test': 1})
+        instance._tunables = {'test': 'test_spec'}
         instance._tuners = {'test': tuner}
         instance.best_proposal = None
 
@@ -407,7 +507,7 @@ class TestBTBSession(TestCase):
         instance._normalized_scores = defaultdict(list)
 
         # run
-        BTBSession.record(instance, 'test', 'config', 1)
+        BTBSession.tell_many(instance, [Trial(0, 'test', 'config')], [1])
 
         # assert
         expected_normalized_scores = defaultdict(list)
@@ -417,12 +517,151 @@ class TestBTBSession(TestCase):
         assert instance._normalized_scores == expected_normalized_scores
         assert instance._best_normalized == 10
 
-        tuner.record.assert_called_once_with('config', 1)
+        tuner.record.assert_called_once_with(['config'], [1])
+
+    def test_tell_many_removed_tunable(self):
+        # setup
+        tuner = MagicMock()
+
+        instance = MagicMock(spec_set=BTBSession)
+        instance.proposals = {0: {'test': 'test'}}
+        instance._pending = Counter({'test': 1})
+        instance._tunables = {}
+        instance._tuners = {'test': tuner}
+        instance.best_proposal = None
+
+        instance._best_normalized = 0
+        instance._normalize.return_value = 1
+        instance._normalized_scores = defaultdict(list)
+
+        # run
+        BTBSession.tell_many(instance, [Trial(0, 'test', 'config')], [1])
+
+        # assert
+        assert instance._normalized_scores == defaultdict(list)
+        assert instance.best_proposal == {'test': 'test', 'score': 1}
+        instance._selector.update.assert_not_called()
+        tuner.record.assert_called_once_with(['config'], [1])
+
+    def test_tell_many_groups_by_tunable(self):
+        """The trials of each tunable are recorded to its tuner with a single call."""
+        # setup
+        tuner_a = MagicMock()
+        tuner_b = MagicMock()
+
+        instance = MagicMock(spec_set=BTBSession)
+        instance.proposals = {0: {}, 1: {}, 2: {}}
+        instance._pending = Counter({'a': 2, 'b': 2})
+        instance._tunables = {'a': 'spec_a', 'b': 'spec_b'}
+        instance._tuners = {'a': tuner_a, 'b': tuner_b}
+        instance._best_normalized = 10
+        instance._normalize.side_effect = lambda score: score
+        instance._normalized_scores = defaultdict(list)
+
+        trials = [Trial(0, 'a', 'config_0'), Trial(1, 'b', 'config_1'), Trial(2, 'a', 'config_2')]
+
+        # run
+        BTBSession.tell_many(instance, trials, [1, 2, 3])
+
+        # assert
+        assert instance._normalized_scores == {'a': [1, 3], 'b': [2]}
+        assert instance._pending == {'b': 1}
+        tuner_a.record.assert_called_once_with(['config_0', 'config_2'], [1, 3])
+        tuner_b.record.assert_called_once_with(['config_1'], [2])
+
+    def test_tell_many_already_recorded(self):
+        # setup
+        instance = MagicMock(spec_set=BTBSession)
+        instance.proposals = {0: {'score': 1}}
+
+        # run / assert
+        with self.assertRaises(ValueError):
+            BTBSession.tell_many(instance, [Trial(0, 'test', 'config')], [1])
+
+    def test_tell_many_duplicate_trial(self):
+        """A batch with a repeated trial is rejected without modifying the session."""
+        # setup
+        tuner = MagicMock()
+
+        instance = MagicMock(spec_set=BTBSession)
+        instance.proposals = {0: {}, 1: {}}
+        instance._pending = Counter({'test': 2})
+        instance._tunables = {'test': 'test_spec'}
+        instance._tuners = {'test': tuner}
+        instance._best_normalized = 0
+        instance._normalize.side_effect = lambda score: score
+        instance._normalized_scores = defaultdict(list)
+
+        trials = [
+            Trial(0, 'test', 'config_0'),
+            Trial(1, 'test', 'config_1'),
+            Trial(0, 'test', 'config_0'),
+        ]
+
+        # run
+        with self.assertRaises(ValueError):
+            BTBSession.tell_many(instance, trials, [1, 2, 3])
+
+        # assert
+        assert instance.proposals == {0: {}, 1: {}}
+        assert instance._pending == Counter({'test': 2})
+        assert instance._normalized_scores == defaultdict(list)
+        assert instance._best_normalized == 0
+        instance._selector.update.assert_not_called()
+        tuner.record.assert_not_called()
+
+    def test_tell_many_len_missmatch(self):
+        # setup
+        instance = MagicMock(spec_set=BTBSession)
+
+        # run / assert
+        with self.assertRaises(ValueError):
+            BTBSession.tell_many(instance, [Trial(0, 'test', 'config')], [1, 2])
+
+    def test_tell(self):
+        # setup
+        instance = MagicMock(spec_set=BTBSession)
+        trial = Trial(0, 'test', 'config')
+
+        # run
+        BTBSession.tell(instance, trial, 1)
+
+        # assert
+        instance.tell_many.assert_called_once_with([trial], [1])
+
+    def test_record(self):
+        """The oldest trial proposed with the same configuration is recorded."""
+        # setup
+        instance = MagicMock(spec_set=BTBSession)
+        instance._make_id.return_value = 'proposal_id'
+        instance._proposal_ids = {'proposal_id': [3, 5]}
+
+        # run
+        BTBSession.record(instance, 'test', 'config', 1)
+
+        # assert
+        instance._make_id.assert_called_once_with('test', 'config')
+        instance.tell.assert_called_once_with(Trial(3, 'test', 'config'), 1)
+        assert instance._proposal_ids == {'proposal_id': [5]}
+
+    def test_record_last_trial(self):
+        # setup
+        instance = MagicMock(spec_set=BTBSession)
+        instance._make_id.return_value = 'proposal_id'
+        instance._proposal_ids = {'proposal_id': [3]}
+
+        # run
+        BTBSession.record(instance, 'test', 'config', 1)
+
+        # assert
+        instance.tell.assert_called_once_with(Trial(3, 'test', 'config'), 1)
+        assert instance._proposal_ids == {}
 
     def test_run_score(self):
         # setup
+        trial = Trial(0, 'test', 'config')
         instance = MagicMock(spec_set=BTBSession)
-        instance.propose.return_value = ('test', 'config')
+        instance.ask.return_value = trial
         instance._scorer.return_value = 1
         instance.best_proposal = {'test': 'config'}
         instance._range = range
@@ -433,14 +672,15 @@ class TestBTBSession(TestCase):
 
         # assert
         instance._scorer.assert_called_once_with('test', 'config')
-        instance.record.assert_called_once_with('test', 'config', 1)
+        instance.tell.assert_called_once_with(trial, 1)
         assert result == {'test': 'config'}
         assert instance.iterations == 1
 
     def test_run_score_none(self):
         # setup
+        trial = Trial(0, 'test', {'hp': 'test'})
         instance = MagicMock(spec_set=BTBSession)
-        instance.propose.return_value = ('test', {'hp': 'test'})
+        instance.ask.return_value = trial
         instance._scorer.side_effect = Exception()
         instance.best_proposal = {'test': 'config'}
         instance._range = range
@@ -451,6 +691,161 @@ class TestBTBSession(TestCase):
 
         # assert
         instance._scorer.assert_called_once_with('test', {'hp': 'test'})
-        instance.record.assert_called_once_with('test', {'hp': 'test'}, None)
+        instance.tell.assert_called_once_with(trial, None)
         assert result == {'test': 'config'}
         assert instance.iterations == 1
+
+    def test_run_executor(self):
+        # setup
+        instance = MagicMock(spec_set=BTBSession)
+        instance._range = range
+        executor = MagicMock()
+
+        # run
+        result = BTBSession.run(instance, 3, n_workers=2, executor=executor)
+
+        # assert
+        assert result == instance._run_parallel.return_value
+        instance._run_parallel.assert_called_once_with(range(3), 2, executor)
+        instance.ask.assert_not_called()
+
+    @patch('btb.session.ThreadPoolExecutor')
+    def test_run_n_workers(self, mock_thread_pool_executor):
+        # setup
+        instance = MagicMock(spec_set=BTBSession)
+        instance._range = range
+        executor = mock_thread_pool_executor.return_value.__enter__.return_value
+
+        # run
+        result = BTBSession.run(instance, 3, n_workers=2)
+
+        # assert
+        assert result == instance._run_parallel.return_value
+        mock_thread_pool_executor.assert_called_once_with(max_workers=2)
+        instance._run_parallel.assert_called_once_with(range(3), 2, executor)
+
+    def test__run_parallel(self):
+        # setup
+        trials = [Trial(0, 'test', {'hp': 1}), Trial(1, 'test', {'hp': 2})]
+        instance = MagicMock(spec_set=BTBSession)
+        instance.ask.side_effect = trials
+        instance._scorer.side_effect = lambda name, config: config['hp'] / 10
+        instance.best_proposal = {'test': 'config'}
+        instance.iterations = 0
+
+        # run
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = BTBSession._run_parallel(instance, range(2), 2, executor)
+
+        # assert
+        assert result == {'test': 'config'}
+        assert instance.iterations == 2
+        expected_calls = [call(trials[0], 0.1), call(trials[1], 0.2)]
+        instance.tell.assert_has_calls(expected_calls, any_order=True)
+
+    def test__run_parallel_score_none(self):
+        # setup
+        trial = Trial(0, 'test', {'hp': 'test'})
+        instance = MagicMock(spec_set=BTBSession)
+        instance.ask.return_value = trial
+        instance._scorer.side_effect = Exception()
+        instance.iterations = 0
+
+        # run
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            BTBSession._run_parallel(instance, range(1), 1, executor)
+
+        # assert
+        instance._log_crash.assert_called_once_with(1, 'test', {'hp': 'test'})
+        instance.tell.assert_called_once_with(trial, None)
+
+    def test__run_parallel_stop_tuning(self):
+        # setup
+        trial = Trial(0, 'test', {'hp': 1})
+        instance = MagicMock(spec_set=BTBSession)
+        instance.ask.side_effect = [trial, StopTuning('test')]
+        instance._scorer.return_value = 1
+        instance.iterations = 0
+
+        # run
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with self.assertRaises(StopTuning):
+                BTBSession._run_parallel(instance, range(5), 2, executor)
+
+        # assert
+        instance.tell.assert_called_once_with(trial, 1)
+
+    @staticmethod
+    def _run_coroutine(coroutine):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+
+    def test_arun(self):
+        # setup
+        trials = [Trial(0, 'test', {'hp': 1}), Trial(1, 'test', {'hp': 2})]
+
+        async def scorer(name, config):
+            return config['hp'] / 10
+
+        instance = MagicMock(spec_set=BTBSession)
+        instance.ask.side_effect = trials
+        instance._scorer = scorer
+        instance._range = range
+        instance.best_proposal = {'test': 'config'}
+        instance.iterations = 0
+
+        # run
+        result = self._run_coroutine(BTBSession.arun(instance, 2, concurrency=2))
+
+        # assert
+        assert result == {'test': 'config'}
+        assert instance.iterations == 2
+        told = [
+            (trial, score)
+            for args in instance.tell_many.call_args_list
+            for trial, score in zip(*args[0])
+        ]
+        assert sorted(told) == [(trials[0], 0.1), (trials[1], 0.2)]
+
+    def test_arun_score_none(self):
+        # setup
+        trial = Trial(0, 'test', {'hp': 'test'})
+
+        async def scorer(name, config):
+            raise Exception()
+
+        instance = MagicMock(spec_set=BTBSession)
+        instance.ask.return_value = trial
+        instance._scorer = scorer
+        instance._range = range
+        instance.iterations = 0
+
+        # run
+        self._run_coroutine(BTBSession.arun(instance, 1))
+
+        # assert
+        instance._log_crash.assert_called_once_with(1, 'test', {'hp': 'test'})
+        instance.tell_many.assert_called_once_with([trial], [None])
+
+    def test_arun_stop_tuning(self):
+        # setup
+        trial = Trial(0, 'test', {'hp': 1})
+
+        async def scorer(name, config):
+            return 1
+
+        instance = MagicMock(spec_set=BTBSession)
+        instance.ask.side_effect = [trial, StopTuning('test')]
+        instance._scorer = scorer
+        instance._range = range
+        instance.iterations = 0
+
+        # run
+        with self.assertRaises(StopTuning):
+            self._run_coroutine(BTBSession.arun(instance, 5, concurrency=2))
+
+        # assert
+        instance.tell_many.assert_called_once_with([trial], [1])
@@ -38,3 +38,14 @@ class TestExpectedImprovementAcquisition(TestCase):
 
         # assert
         np.testing.assert_array_equal(best, np.array([1, 3]))
+
+    def test__score(self):
+        # setup
+        instance = ExpectedImprovementAcquisition()
+        instance.scores = np.array([0.5])
+
+        # run
+        result = instance._score(np.array([[0.5, 1.], [1.5, 1.]]))
+
+        # assert
+        np.testing.assert_allclose(result, [0.39894228, 1.08331547])
@@ -72,6 +72,32 @@ class TestBaseHyperParam(TestCase):
 
         assert result == 3
 
+    def test_inverse_transform_no_validate(self):
+        """The values are inverted as they are, without validating them."""
+        # setup
+        instance = MagicMock()
+        instance._inverse_transform = MagicMock(return_value=3)
+        values = np.array([[1]])
+
+        # run
+        result = BaseHyperParam.inverse_transform(instance, values, validate=False)
+
+        # assert
+        instance._to_array.assert_not_called()
+        instance._within_search_space.assert_not_called()
+        instance._inverse_transform.assert_called_once_with(values)
+
+        assert result == 3
+
+    def test__within_range_nan(self):
+        # setup
+        instance = MagicMock()
+        values = np.array([[0.5], [np.nan]])
+
+        # run / assert
+        with self.assertRaises(ValueError):
+            BaseHyperParam._within_range(instance, values, min=0, max=1)
+
     @patch('btb.tuning.hyperparams.base.np.asarray')
     def test_transform_values_not_ndarray(self, mock_np_asarray):
         # setup
@@ -109,3 +109,28 @@ class TestBooleanHyperParam(TestCase):
         mock_np_random.assert_called_once_with((4, 1))
         self.assertEqual(len(result), 4)
         np.testing.assert_array_equal(result, expected_result)
+
+    def test_from_uniform(self):
+        """Test that the method ``from_uniform`` rounds the uniform values."""
+        # setup
+        values = np.array([[0.1], [0.49], [0.51], [0.99]])
+
+        # run
+        result = self.instance.from_uniform(values)
+
+        # assert
+        np.testing.assert_array_equal(result, np.array([[0], [0], [1], [1]]))
+
+    def test_to_index(self):
+        # run
+        result = self.instance.to_index(np.array([[1], [0]]))
+
+        # assert
+        np.testing.assert_array_equal(result, np.array([1, 0]))
+
+    def test_from_index(self):
+        # run
+        result = self.instance.from_index(np.array([1, 0]))
+
+        # assert
+        np.testing.assert_array_equal(result, np.array([[1], [0]]))
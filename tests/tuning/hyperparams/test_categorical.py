@@ -1,34 +1,23 @@
 # -*- coding: utf-8 -*-
 
 from unittest import TestCase
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import patch
 
 import numpy as np
 
 from btb.tuning.hyperparams.categorical import CategoricalHyperParam
 
 
-def assert_called_with_np_array(mock_calls, real_calls):
-    assert len(mock_calls) == len(real_calls)
-
-    for mock_call, real_call in zip(mock_calls, real_calls):
-        np.testing.assert_array_equal(mock_call[0], real_call[1])
-
-
 class TestCategoricalHyperParam(TestCase):
 
     @classmethod
     def setUpClass(cls):
         cls.instance = CategoricalHyperParam(choices=['Cat', 'Dog', 'Horse', 'Tiger'])
 
-    @patch('btb.tuning.hyperparams.categorical.OneHotEncoder')
-    def test___init__(self, mock_one_hot_encoder):
-        """Test that during instantiation we create a OneHotEncoder and we fit it with the given
-        choices."""
+    def test___init__(self):
+        """Test that during instantiation we build the lookup tables of the given choices."""
         # setup
         choices = ['cat', 'dog', 'parrot']
-        encoder_instance = MagicMock()
-        mock_one_hot_encoder.return_value = encoder_instance
 
         # run
         instance = CategoricalHyperParam(choices=choices)
@@ -36,18 +25,8 @@ class TestCategoricalHyperParam(TestCase):
         # assert
         self.assertEqual(instance.choices, choices)
         self.assertEqual(instance.default, 'cat')
-
-        # TODO: Fix / reimplmement assert_called_with_np
-        # expected_encoder_calls = [
-        #     call(categories=[np.array(['cat', 'dog', 'parrot'], dtype=object)], sparse=True)
-        # ]
-
-        # assert_called_with_np_array(
-        #     mock_one_hot_encoder.call_args_list,
-        #     expected_encoder_calls
-        # )
-        expected_encoder_fit_call = [call(np.array(choices).reshape(-1, 1))]
-        assert_called_with_np_array(encoder_instance.fit.call_args_list, expected_encoder_fit_call)
+        self.assertEqual(instance._indexes, {'cat': 0, 'dog': 1, 'parrot': 2})
+        np.testing.assert_array_equal(instance._choices, np.array(choices, dtype=object))
 
     def test__within_hyperparam_space_values_in_space(self):
         """Test that when we call ``_within_hyperparam_space`` with values in the hyperparameter
@@ -140,14 +119,11 @@ class TestCategoricalHyperParam(TestCase):
         # assert
         np.testing.assert_array_equal(results, np.array([['Cat'], ['Dog']]))
 
-    @patch('btb.tuning.hyperparams.categorical.np.random.random')
-    def test_sample(self, mock_np_random):
-        """Test that sample returns values."""
+    @patch('btb.tuning.hyperparams.categorical.np.random.randint')
+    def test_sample(self, mock_np_random_randint):
+        """Test that sample draws the indexes of the choices directly."""
         # setup
-        mock_np_random.return_value = np.array([
-            [0.5, 0.1, 0.2, 0.6],
-            [0.1, 0.9, 0.1, 0.6],
-        ])
+        mock_np_random_randint.return_value = np.array([3, 1])
         n = 2
 
         # run
@@ -156,8 +132,113 @@ class TestCategoricalHyperParam(TestCase):
         # assert
         expected_results = np.array([[0, 0, 0, 1], [0, 1, 0, 0]])
 
-        mock_np_random.assert_called_once_with((n, self.instance.dimensions))
+        mock_np_random_randint.assert_called_once_with(self.instance.dimensions, size=n)
 
         np.testing.assert_array_equal(results, expected_results)
 
         self.assertEqual(len(results), n)
+
+    def test_transform_mixed_types(self):
+        """Test that choices of different types are encoded and decoded back."""
+        # setup
+        instance = CategoricalHyperParam(choices=['auto', 1, None])
+
+        # run
+        transformed = instance.transform(np.array([[None], [1], ['auto']], dtype=object))
+        result = instance.inverse_transform(transformed)
+
+        # assert
+        np.testing.assert_array_equal(transformed, [[0, 0, 1], [0, 1, 0], [1, 0, 0]])
+        assert result[:, 0].tolist() == [None, 1, 'auto']
+
+    def test_from_uniform(self):
+        """Test that the method ``from_uniform`` selects the choice of every interval."""
+        # setup
+        values = np.array([[0.], [0.3], [0.74], [0.99]])
+
+        # run
+        results = self.instance.from_uniform(values)
+
+        # assert
+        expected_results = np.array([
+            [1, 0, 0, 0],
+            [0, 1, 0, 0],
+            [0, 0, 1, 0],
+            [0, 0, 0, 1],
+        ])
+        np.testing.assert_array_equal(results, expected_results)
+
+    def test_to_index(self):
+        # run
+        result = self.instance.to_index(np.array([[0, 0, 1, 0], [1, 0, 0, 0]]))
+
+        # assert
+        np.testing.assert_array_equal(result, np.array([2, 0]))
+
+    def test_from_index(self):
+        # run
+        result = self.instance.from_index(np.array([2, 0]))
+
+        # assert
+        np.testing.assert_array_equal(result, np.array([[0, 0, 1, 0], [1, 0, 0, 0]]))
+
+
+class TestCategoricalHyperParamOrdinal(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.instance = CategoricalHyperParam(
+            choices=['Cat', 'Dog', 'Horse', 'Tiger'], encoding='ordinal')
+
+    def test___init__(self):
+        # assert
+        assert self.instance.dimensions == 1
+        assert self.instance.cardinality == 4
+
+    def test___init__unknown_encoding(self):
+        # run / assert
+        with self.assertRaises(ValueError):
+            CategoricalHyperParam(choices=['Cat', 'Dog'], encoding='unknown')
+
+    def test_transform(self):
+        # run
+        result = self.instance.transform(np.array([['Cat'], ['Tiger']]))
+
+        # assert
+        np.testing.assert_array_equal(result, [[0.125], [0.875]])
+
+    def test_inverse_transform(self):
+        # run
+        result = self.instance.inverse_transform(np.array([[0.], [0.3], [0.875], [1.]]))
+
+        # assert
+        np.testing.assert_array_equal(result, [['Cat'], ['Dog'], ['Tiger'], ['Tiger']])
+
+    def test_sample(self):
+        # run
+        result = self.instance.sample(20)
+
+        # assert
+        assert result.shape == (20, 1)
+        assert set(result[:, 0]) <= {0.125, 0.375, 0.625, 0.875}
+
+    def test_from_uniform(self):
+        # run
+        result = self.instance.from_uniform(np.array([[0.], [0.3], [0.99]]))
+
+        # assert
+        np.testing.assert_array_equal(result, [[0.125], [0.375], [0.875]])
+
+    def test_to_index(self):
+        # run
+        result = self.instance.to_index(np.array([[0.625], [0.125]]))
+
+        # assert
+        np.testing.assert_array_equal(result, [2, 0])
+
+    def test_from_index(self):
+        # run
+        result = self.instance.from_index(np.array([2, 0]))
+
+        # assert
+        np.testing.assert_array_equal(result, [[0.625], [0.125]])
@@ -273,6 +273,63 @@ class TestFloatHyperParam(TestCase):
         mock_np_random.assert_called_once_with((n_samples, instance.dimensions))
         np.testing.assert_array_equal(result, expected_result)
 
+    def test_from_uniform(self):
+        """Test that the method ``from_uniform`` returns the uniform values."""
+        # setup
+        instance = FloatHyperParam(min=0.1, max=0.9)
+        values = np.array([[0.1], [0.2]])
+
+        # run
+        result = instance.from_uniform(values)
+
+        # assert
+        np.testing.assert_array_equal(result, values)
+
+    def test_to_index(self):
+        """Test that a ``FloatHyperParam`` can not be indexed."""
+        # setup
+        instance = FloatHyperParam(min=0.1, max=0.9)
+
+        # run / assert
+        with self.assertRaises(ValueError):
+            instance.to_index(np.array([[0.1]]))
+
+    def test___init__log_scale_not_positive(self):
+        """Test that the ``log`` scale can not be used with non positive values."""
+        # run / assert
+        with self.assertRaises(ValueError):
+            FloatHyperParam(min=0, max=1, scale='log')
+
+    def test___init__unknown_scale(self):
+        # run / assert
+        with self.assertRaises(ValueError):
+            FloatHyperParam(min=0, max=1, scale='unknown')
+
+    def test__transform_log_scale(self):
+        """Test that every order of magnitude gets the same share of the search space."""
+        # setup
+        instance = FloatHyperParam(min=0.001, max=10, scale='log')
+        values = np.array([[0.001], [0.01], [1], [10]])
+
+        # run
+        result = instance._transform(values)
+
+        # assert
+        np.testing.assert_allclose(result, np.array([[0], [0.25], [0.75], [1]]), atol=1e-12)
+
+    def test__inverse_transform_log_scale(self):
+        # setup
+        instance = FloatHyperParam(min=0.001, max=10, scale='log')
+        values = np.array([[0], [0.25], [0.75], [1]])
+
+        # run
+        result = instance._inverse_transform(values)
+
+        # assert
+        np.testing.assert_allclose(result, np.array([[0.001], [0.01], [1], [10]]))
+        assert result.min() >= 0.001
+        assert result.max() <= 10
+
 
 class TestIntHyperParam(TestCase):
 
@@ -580,3 +637,130 @@ class TestIntHyperParam(TestCase):
         mock__inverse_transform.assert_called_once_with(mock_np_random.return_value)
         mock__transform.assert_called_once_with(mock__inverse_transform.return_value)
         self.assertEqual(result, mock__transform.return_value)
+
+    def test_from_uniform(self):
+        """Test that the method ``from_uniform`` snaps the values to the center of their
+        interval."""
+        # setup
+        instance = IntHyperParam(min=1, max=4)
+        values = np.array([[0.], [0.3], [0.6], [0.99]])
+
+        # run
+        result = instance.from_uniform(values)
+
+        # assert
+        np.testing.assert_array_equal(result, np.array([[0.125], [0.375], [0.625], [0.875]]))
+
+    def test_to_index(self):
+        # setup
+        instance = IntHyperParam(min=1, max=4)
+
+        # run
+        result = instance.to_index(np.array([[0.125], [0.375], [0.875]]))
+
+        # assert
+        np.testing.assert_array_equal(result, np.array([0, 1, 3]))
+
+    def test_from_index(self):
+        # setup
+        instance = IntHyperParam(min=1, max=4)
+
+        # run
+        result = instance.from_index(np.array([0, 1, 3]))
+
+        # assert
+        np.testing.assert_array_equal(result, np.array([[0.125], [0.375], [0.875]]))
+
+    def test__inverse_transform_step(self):
+        """Test that the values are rounded to a multiple of ``step``."""
+        # setup
+        instance = IntHyperParam(min=0, max=10, step=5)
+        values = np.array([[0.1], [0.5], [0.9]])
+
+        # run
+        result = instance._inverse_transform(values)
+
+        # assert
+        np.testing.assert_array_equal(result, np.array([[0], [5], [10]]))
+
+    def test__inverse_transform_step_distribution(self):
+        """Test that every multiple of ``step`` gets the same share of the search space."""
+        # setup
+        instance = IntHyperParam(min=2, max=10, step=2)
+        values = ((np.arange(1000) + 0.5) / 1000).reshape(-1, 1)
+
+        # run
+        result = instance._inverse_transform(values)
+
+        # assert
+        _, counts = np.unique(result, return_counts=True)
+        np.testing.assert_array_equal(counts, [200, 200, 200, 200, 200])
+
+    def test__inverse_transform_step_distribution_log_scale(self):
+        """Test that every multiple of ``step`` gets its log-uniform share of the search space."""
+        # setup
+        instance = IntHyperParam(min=2, max=10, step=2, scale='log')
+        values = ((np.arange(1000) + 0.5) / 1000).reshape(-1, 1)
+
+        # run
+        result = instance._inverse_transform(values)
+
+        # assert
+        hyperparams, counts = np.unique(result, return_counts=True)
+        expected_counts = 1000 * np.log((hyperparams + 1) / (hyperparams - 1)) / np.log(11)
+        np.testing.assert_array_equal(hyperparams, [2, 4, 6, 8, 10])
+        np.testing.assert_allclose(counts, expected_counts, atol=1)
+
+    def test___init__log_scale_not_positive(self):
+        """Test that the ``log`` scale needs the lowest rounding boundary to be positive."""
+        # run / assert
+        with self.assertRaises(ValueError):
+            IntHyperParam(min=2, max=10, step=4, scale='log')
+
+    def test__transform_log_scale(self):
+        # setup
+        instance = IntHyperParam(min=1, max=4, scale='log')
+        values = np.array([[1], [4]])
+
+        # run
+        result = instance._transform(values)
+
+        # assert
+        expected_result = np.log(np.array([[1 / 0.5], [4 / 0.5]])) / np.log(4.5 / 0.5)
+        np.testing.assert_allclose(result, expected_result)
+
+    def test__inverse_transform_log_scale(self):
+        """Test that the values are rounded to the closest integer after leaving the log space."""
+        # setup
+        instance = IntHyperParam(min=1, max=1000, scale='log')
+        values = np.array([[0], [0.5], [1]])
+
+        # run
+        result = instance._inverse_transform(values)
+
+        # assert
+        expected_result = np.exp(np.log(0.5) + 0.5 * (np.log(1000.5) - np.log(0.5))).round()
+        np.testing.assert_array_equal(result, np.array([[1], [expected_result], [1000]]))
+
+    def test_transform_inverse_transform_log_scale(self):
+        """Test that every value is recovered after being transformed."""
+        # setup
+        instance = IntHyperParam(min=2, max=40, step=2, scale='log')
+        values = np.arange(2, 41, 2).reshape(-1, 1)
+
+        # run
+        result = instance._inverse_transform(instance._transform(values))
+
+        # assert
+        np.testing.assert_array_equal(result, values)
+
+    def test_to_index_from_index_log_scale(self):
+        # setup
+        instance = IntHyperParam(min=1, max=100, scale='log')
+        indexes = np.array([0, 9, 99])
+
+        # run
+        result = instance.to_index(instance.from_index(indexes))
+
+        # assert
+        np.testing.assert_array_equal(result, indexes)
@@ -6,9 +6,64 @@ from unittest.mock import MagicMock, patch
 import numpy as np
 from copulas.univariate import Univariate
 from sklearn.gaussian_process import GaussianProcessRegressor
+from sklearn.gaussian_process.kernels import RBF
 
 from btb.tuning.metamodels.gaussian_process import (
-    GaussianCopulaProcessMetaModel, GaussianProcessMetaModel)
+    CategoricalRBF, GaussianCopulaProcessMetaModel, GaussianProcessMetaModel,
+    IncrementalGaussianProcessMetaModel, SparseGaussianProcessMetaModel)
+
+
+class TestCategoricalRBF(TestCase):
+
+    def test___call__(self):
+        """The categorical columns only count whether the values are equal."""
+        # setup
+        instance = CategoricalRBF(length_scale=1, categorical=[1])
+        X = np.array([[0., 0.1], [0., 0.9], [1., 0.1]])
+
+        # run
+        result = instance(X)
+
+        # assert
+        expected = np.array([
+            [1, np.exp(-0.5), np.exp(-0.5)],
+            [np.exp(-0.5), 1, np.exp(-1)],
+            [np.exp(-0.5), np.exp(-1), 1],
+        ])
+        np.testing.assert_allclose(result, expected)
+
+    def test___call__no_categorical(self):
+        """Without categorical columns it is the same as the RBF kernel."""
+        # setup
+        instance = CategoricalRBF(length_scale=[0.5, 2.])
+        X = np.random.random((5, 2))
+        Y = np.random.random((3, 2))
+
+        # run
+        result = instance(X, Y)
+
+        # assert
+        np.testing.assert_allclose(result, RBF(length_scale=[0.5, 2.])(X, Y))
+
+    def test___call__gradient(self):
+        """The gradient matches the finite differences of the log length scales."""
+        # setup
+        X = np.random.random((6, 3))
+        X[:, 1] = np.random.randint(3, size=6) / 3
+
+        for length_scale in (0.7, [0.5, 0.8, 1.3]):
+            instance = CategoricalRBF(length_scale=length_scale, categorical=[1])
+
+            # run
+            kernel, gradient = instance(X, eval_gradient=True)
+
+            # assert
+            for index in range(len(instance.theta)):
+                theta = instance.theta.copy()
+                theta[index] += 1e-6
+                shifted = instance.clone_with_theta(theta)(X)
+                np.testing.assert_allclose(
+                    (shifted - kernel) / 1e-6, gradient[:, :, index], atol=1e-5)
 
 
 class TestGaussianProcessMetaModel(TestCase):
@@ -21,6 +76,30 @@ class TestGaussianProcessMetaModel(TestCase):
         assert instance._MODEL_KWARGS_DEFAULT == {'normalize_y': True}
         assert instance._MODEL_CLASS == GaussianProcessRegressor
 
+    def test___init_metamodel__(self):
+        # setup
+        instance = GaussianProcessMetaModel()
+
+        # run
+        instance.__init_metamodel__(length_scale=0.5)
+
+        # assert
+        assert type(instance._model_kwargs['kernel']) is RBF
+
+    def test___init_metamodel__categorical_dimensions(self):
+        # setup
+        instance = GaussianProcessMetaModel()
+        instance._categorical_dimensions = np.array([1])
+
+        # run
+        instance.__init_metamodel__(length_scale=0.5)
+
+        # assert
+        kernel = instance._model_kwargs['kernel']
+        assert isinstance(kernel, CategoricalRBF)
+        assert kernel.length_scale == 0.5
+        np.testing.assert_array_equal(kernel.categorical, [1])
+
     def test__predict(self):
         # setup
         instance = MagicMock()
@@ -173,3 +252,209 @@ class TestGaussianCopulaProcessMetaModel(TestCase):
         expected_scores = np.array([0.54393124, 0.1])
 
         np.testing.assert_allclose(expected_scores, predicted_scores)
+
+
+class TestIncrementalGaussianProcessMetaModel(TestCase):
+
+    @staticmethod
+    def _get_data(n_trials):
+        random_state = np.random.RandomState(0)
+        trials = random_state.random_sample((n_trials, 3))
+        scores = np.sin(3 * trials.sum(axis=1))
+        return trials, scores
+
+    @staticmethod
+    def _get_instance(**kwargs):
+        instance = IncrementalGaussianProcessMetaModel()
+        instance.__init_metamodel__(**kwargs)
+        return instance
+
+    def test___init_metamodel__(self):
+        # run
+        instance = self._get_instance(refit_every=5, llh_tolerance=0.1)
+
+        # assert
+        assert instance._MODEL_CLASS == GaussianProcessRegressor
+        assert instance._refit_every == 5
+        assert instance._llh_tolerance == 0.1
+
+    def test__fit_first_time_optimizes(self):
+        # setup
+        instance = self._get_instance()
+        instance._optimize = MagicMock()
+        trials, scores = self._get_data(5)
+
+        # run
+        instance._fit(trials, scores)
+
+        # assert
+        instance._optimize.assert_called_once()
+
+    def test__fit_appended_trials(self):
+        """New trials are appended to the Cholesky factor without optimizing the kernel."""
+        # setup
+        instance = self._get_instance(refit_every=10)
+        trials, scores = self._get_data(8)
+        instance._fit(trials[:5], scores[:5])
+        instance._optimize = MagicMock()
+
+        # run
+        instance._fit(trials, scores)
+
+        # assert
+        instance._optimize.assert_not_called()
+        assert instance._chol.shape == (8, 8)
+        np.testing.assert_array_equal(instance._fit_trials, trials)
+
+    def test__fit_refit_every(self):
+        # setup
+        instance = self._get_instance(refit_every=3)
+        trials, scores = self._get_data(8)
+        instance._fit(trials[:5], scores[:5])
+        instance._optimize = MagicMock()
+
+        # run
+        instance._fit(trials, scores)
+
+        # assert
+        instance._optimize.assert_called_once()
+
+    def test__fit_different_trials(self):
+        """If the trials are not an extension of the fitted ones, the model is refitted."""
+        # setup
+        instance = self._get_instance(refit_every=10)
+        trials, scores = self._get_data(8)
+        instance._fit(trials[:5], scores[:5])
+        instance._optimize = MagicMock()
+
+        # run
+        instance._fit(trials[1:], scores[1:])
+
+        # assert
+        instance._optimize.assert_called_once()
+
+    def test__fit_llh_tolerance(self):
+        # setup
+        instance = self._get_instance(refit_every=10, llh_tolerance=0)
+        trials, scores = self._get_data(8)
+        instance._fit(trials[:5], scores[:5])
+        instance._optimized_llh = np.inf
+
+        # run
+        instance._fit(trials, scores)
+
+        # assert
+        assert instance._optimized_trials == 8
+
+    def test__predict_matches_exact_gaussian_process(self):
+        """The incrementally updated model predicts as the GP fitted with the same kernel."""
+        # setup
+        instance = self._get_instance(length_scale=0.5, refit_every=100)
+        trials, scores = self._get_data(20)
+        instance._fit(trials[:10], scores[:10])
+        for num_trials in range(11, 21):
+            instance._fit(trials[:num_trials], scores[:num_trials])
+
+        candidates = np.array([
+            [0.2, 0.8, 0.4],
+            [0.1, 0.8, 0.2]
+        ])
+
+        # run
+        predicted = instance._predict(candidates)
+
+        # assert
+        model = GaussianProcessRegressor(kernel=instance._kernel, optimizer=None)
+        model.fit(trials, (scores - instance._y_mean) / instance._y_std)
+        mean, std = model.predict(candidates, return_std=True)
+
+        assert predicted.shape == (2, 2)
+        np.testing.assert_allclose(predicted[:, 0], mean * instance._y_std + instance._y_mean)
+        np.testing.assert_allclose(predicted[:, 1], std * instance._y_std, atol=1e-7)
+
+
+class TestSparseGaussianProcessMetaModel(TestCase):
+
+    @staticmethod
+    def _get_data(n_trials):
+        random_state = np.random.RandomState(0)
+        trials = random_state.random_sample((n_trials, 3))
+        scores = np.sin(3 * trials.sum(axis=1))
+        return trials, scores
+
+    @staticmethod
+    def _get_instance(**kwargs):
+        instance = SparseGaussianProcessMetaModel()
+        instance.__init_metamodel__(**kwargs)
+        return instance
+
+    def test___init_metamodel__(self):
+        # run
+        instance = self._get_instance(num_inducing=10, noise=0.1)
+
+        # assert
+        assert instance._MODEL_CLASS == GaussianProcessRegressor
+        assert instance._num_inducing == 10
+        assert instance._noise == 0.1
+        assert instance._model_kwargs['alpha'] == 0.1
+
+    def test__select_inducing_all(self):
+        # setup
+        instance = self._get_instance(num_inducing=10)
+
+        # run
+        result = instance._select_inducing(np.array([0.1, 0.3, 0.2]))
+
+        # assert
+        np.testing.assert_array_equal(result, [0, 1, 2])
+
+    def test__select_inducing_best_and_random(self):
+        # setup
+        instance = self._get_instance(num_inducing=4)
+        scores = np.array([0.1, 0.9, 0.2, 0.8, 0.3, 0.4])
+
+        # run
+        result = instance._select_inducing(scores)
+
+        # assert
+        assert len(result) == 4
+        assert len(set(result)) == 4
+        np.testing.assert_array_equal(result[:2], [1, 3])
+
+    def test__fit_inducing_points(self):
+        # setup
+        instance = self._get_instance(num_inducing=10)
+        trials, scores = self._get_data(50)
+
+        # run
+        instance._fit(trials, scores)
+
+        # assert
+        assert instance._inducing.shape == (10, 3)
+        assert instance._chol_mm.shape == (10, 10)
+        assert instance._weights.shape == (10, )
+
+    def test__predict_matches_exact_gaussian_process(self):
+        """With as many inducing points as trials the exact Gaussian Process is obtained."""
+        # setup
+        instance = self._get_instance(length_scale=0.5, num_inducing=50, noise=0.01)
+        trials, scores = self._get_data(20)
+        instance._fit(trials, scores)
+
+        candidates = np.array([
+            [0.2, 0.8, 0.4],
+            [0.1, 0.8, 0.2]
+        ])
+
+        # run
+        predicted = instance._predict(candidates)
+
+        # assert
+        model = GaussianProcessRegressor(
+            kernel=instance._kernel, alpha=0.01, optimizer=None, normalize_y=True)
+        model.fit(trials, scores)
+        mean, std = model.predict(candidates, return_std=True)
+
+        assert predicted.shape == (2, 2)
+        np.testing.assert_allclose(predicted[:, 0], mean, rtol=1e-5)
+        np.testing.assert_allclose(predicted[:, 1], std, rtol=1e-5)
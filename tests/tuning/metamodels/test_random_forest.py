@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+from sklearn.ensemble import ExtraTreesRegressor, RandomForestRegressor
+
+from btb.tuning.metamodels.random_forest import ExtraTreesMetaModel, RandomForestMetaModel
+
+
+class TestRandomForestMetaModel(TestCase):
+
+    @staticmethod
+    def _get_data(n_trials):
+        random_state = np.random.RandomState(0)
+        trials = random_state.random_sample((n_trials, 3))
+        scores = np.sin(3 * trials.sum(axis=1))
+        return trials, scores
+
+    @staticmethod
+    def _get_instance(**kwargs):
+        instance = RandomForestMetaModel()
+        instance.__init_metamodel__(**kwargs)
+        return instance
+
+    def test___init_metamodel__(self):
+        # run
+        instance = self._get_instance(n_estimators=10, trees_per_fit=2)
+
+        # assert
+        assert instance._MODEL_CLASS == RandomForestRegressor
+        assert instance._MODEL_KWARGS_DEFAULT == {'n_jobs': -1}
+        assert instance._model_kwargs == {'n_estimators': 10}
+        assert instance._n_estimators == 10
+        assert instance._trees_per_fit == 2
+
+    @patch('btb.tuning.metamodels.random_forest.super')
+    def test__fit_no_trees_per_fit(self, mock_super):
+        # setup
+        instance = MagicMock()
+        instance._trees_per_fit = None
+
+        # run
+        RandomForestMetaModel._fit(instance, 'trials', 'scores')
+
+        # assert
+        mock_super.return_value._fit.assert_called_once_with('trials', 'scores')
+
+    def test__fit_warm_start(self):
+        """The new trees are added to a copy of the forest, dropping the oldest ones."""
+        # setup
+        instance = self._get_instance(n_estimators=10, trees_per_fit=3)
+        trials, scores = self._get_data(20)
+        instance._fit(trials[:10], scores[:10])
+        model = instance._model_instance
+        estimators = list(model.estimators_)
+
+        # run
+        instance._fit(trials, scores)
+
+        # assert
+        assert instance._model_instance is not model
+        assert model.estimators_ == estimators
+        assert len(instance._model_instance.estimators_) == 10
+        assert instance._model_instance.estimators_[:7] == estimators[3:]
+
+    def test__predict(self):
+        # setup
+        first = MagicMock()
+        first.predict.return_value = np.array([1., 2.])
+        second = MagicMock()
+        second.predict.return_value = np.array([3., 2.])
+
+        instance = MagicMock()
+        instance._MIN_STD = 1e-6
+        instance._model_instance.estimators_ = [first, second]
+
+        # run
+        result = RandomForestMetaModel._predict(instance, 'candidates')
+
+        # assert
+        first.predict.assert_called_once_with('candidates')
+        second.predict.assert_called_once_with('candidates')
+        np.testing.assert_array_equal(result, np.array([[2., 1.], [2., 1e-6]]))
+
+    def test__predict_fitted(self):
+        # setup
+        instance = self._get_instance(n_estimators=10)
+        trials, scores = self._get_data(20)
+        instance._fit(trials, scores)
+
+        # run
+        result = instance._predict(trials[:5])
+
+        # assert
+        assert result.shape == (5, 2)
+        assert (result[:, 1] > 0).all()
+
+
+class TestExtraTreesMetaModel(TestCase):
+
+    def test___init__(self):
+        # run
+        instance = ExtraTreesMetaModel()
+
+        # assert
+        assert instance._MODEL_CLASS == ExtraTreesRegressor
+        assert instance._MODEL_KWARGS_DEFAULT == {'n_jobs': -1}
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+
+from btb.tuning.sampling import (
+    HaltonSampler, LatinHypercubeSampler, RandomSampler, SobolSampler, get_sampler)
+
+
+class TestRandomSampler(TestCase):
+
+    @patch('btb.tuning.sampling.np.random.random')
+    def test_random(self, mock_np_random):
+        # setup
+        instance = RandomSampler(3)
+
+        # run
+        result = instance.random(2)
+
+        # assert
+        mock_np_random.assert_called_once_with((2, 3))
+        assert result == mock_np_random.return_value
+
+
+class TestLatinHypercubeSampler(TestCase):
+
+    def test_random(self):
+        # setup
+        instance = LatinHypercubeSampler(3)
+
+        # run
+        result = instance.random(10)
+
+        # assert
+        assert result.shape == (10, 3)
+        for column in result.T:
+            np.testing.assert_array_equal(np.sort((column * 10).astype(int)), np.arange(10))
+
+    def test_random_successive_calls(self):
+        """Single point calls are stratified with the points generated before them."""
+        # setup
+        instance = LatinHypercubeSampler(3)
+
+        # run
+        result = np.concatenate([instance.random(1) for _ in range(8)])
+
+        # assert
+        for size in (1, 2, 4, 8):
+            for column in result[:size].T:
+                strata = np.sort((column * size).astype(int))
+                np.testing.assert_array_equal(strata, np.arange(size))
+
+    def test_random_successive_batches(self):
+        """Successive batches complete a Latin hypercube with all their points."""
+        # setup
+        instance = LatinHypercubeSampler(2)
+
+        # run
+        first = instance.random(5)
+        second = instance.random(5)
+
+        # assert
+        result = np.concatenate([first, second])
+        for column in result.T:
+            np.testing.assert_array_equal(np.sort((column * 10).astype(int)), np.arange(10))
+
+
+class TestHaltonSampler(TestCase):
+
+    def test__get_primes(self):
+        # run
+        result = HaltonSampler._get_primes(6)
+
+        # assert
+        assert result == [2, 3, 5, 7, 11, 13]
+
+    def test_random_not_scrambled(self):
+        # setup
+        instance = HaltonSampler(2, scramble=False)
+
+        # run
+        first = instance.random(2)
+        second = instance.random(2)
+
+        # assert
+        np.testing.assert_allclose(first, [[1 / 2, 1 / 3], [1 / 4, 2 / 3]])
+        np.testing.assert_allclose(second, [[3 / 4, 1 / 9], [1 / 8, 4 / 9]])
+
+    def test_random_scrambled(self):
+        """Every dimension has one point in each interval of length ``1 / base``."""
+        # setup
+        instance = HaltonSampler(2)
+
+        # run
+        result = instance.random(5)
+
+        # assert
+        np.testing.assert_array_equal(np.sort((result[:4, 0] * 4).astype(int)), np.arange(4))
+        np.testing.assert_array_equal(np.sort((result[:3, 1] * 3).astype(int)), np.arange(3))
+
+
+class TestSobolSampler(TestCase):
+
+    def test___init__too_many_dimensions(self):
+        # run / assert
+        with self.assertRaises(ValueError):
+            SobolSampler(SobolSampler.max_dimensions + 1)
+
+    def test_random_not_scrambled(self):
+        # setup
+        instance = SobolSampler(3, scramble=False)
+
+        # run
+        first = instance.random(3)
+        second = instance.random(3)
+
+        # assert
+        expected_first = [[0., 0., 0.], [0.5, 0.5, 0.5], [0.75, 0.25, 0.25]]
+        expected_second = [[0.25, 0.75, 0.75], [0.375, 0.375, 0.625], [0.875, 0.875, 0.125]]
+        np.testing.assert_array_equal(first, expected_first)
+        np.testing.assert_array_equal(second, expected_second)
+
+    def test_random_scrambled(self):
+        """Every dimension has one point in each interval of length ``1 / 8``."""
+        # setup
+        instance = SobolSampler(5)
+
+        # run
+        result = instance.random(8)
+
+        # assert
+        assert ((0 <= result) & (result < 1)).all()
+        for column in result.T:
+            np.testing.assert_array_equal(np.sort((column * 8).astype(int)), np.arange(8))
+
+
+class TestGetSampler(TestCase):
+
+    def test_get_sampler(self):
+        # run
+        result = get_sampler('halton', 3)
+
+        # assert
+        assert isinstance(result, HaltonSampler)
+        assert result.dimensions == 3
+
+    def test_get_sampler_unknown(self):
+        # run / assert
+        with self.assertRaises(ValueError):
+            get_sampler('unknown', 3)
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+from unittest import TestCase
+
+import numpy as np
+
+from btb.tuning.trials import TrialStore, UntriedIndex
+
+
+class TestTrialStore(TestCase):
+
+    def test___init__(self):
+        # run
+        instance = TrialStore(3, capacity=4)
+
+        # assert
+        assert len(instance) == 0
+        assert instance.capacity == 4
+        assert instance.trials.shape == (0, 3)
+        assert instance.raw_scores.shape == (0, )
+        assert instance.scores.shape == (0, )
+
+    def test_append(self):
+        # setup
+        instance = TrialStore(2, capacity=4)
+
+        # run
+        instance.append([[1, 0], [0, 1]], [0.1, 0.2])
+        instance.append([[1, 1]], 0.3)
+
+        # assert
+        assert len(instance) == 3
+        assert instance.capacity == 4
+        np.testing.assert_array_equal(instance.trials, [[1, 0], [0, 1], [1, 1]])
+        np.testing.assert_array_equal(instance.raw_scores, [0.1, 0.2, 0.3])
+        np.testing.assert_array_equal(instance.scores, [0.1, 0.2, 0.3])
+
+    def test_append_minimize(self):
+        # setup
+        instance = TrialStore(1, maximize=False)
+
+        # run
+        instance.append([[1]], [0.1])
+
+        # assert
+        np.testing.assert_array_equal(instance.raw_scores, [0.1])
+        np.testing.assert_array_equal(instance.scores, [-0.1])
+
+    def test_append_grow(self):
+        """The capacity is doubled and the previous views are not modified."""
+        # setup
+        instance = TrialStore(1, capacity=2)
+        instance.append([[1], [2]], [1, 2])
+        trials = instance.trials
+
+        # run
+        instance.append([[3]], [3])
+
+        # assert
+        assert instance.capacity == 4
+        np.testing.assert_array_equal(instance.trials, [[1], [2], [3]])
+        np.testing.assert_array_equal(trials, [[1], [2]])
+
+    def test_append_grow_more_than_double(self):
+        # setup
+        instance = TrialStore(1, capacity=2)
+
+        # run
+        instance.append(np.ones((5, 1)), np.ones(5))
+
+        # assert
+        assert instance.capacity == 5
+        assert len(instance) == 5
+
+    def test_trials_view(self):
+        """Accessing the trials does not copy them."""
+        # setup
+        instance = TrialStore(1)
+        instance.append([[1]], [1])
+
+        # run
+        result = instance.trials
+
+        # assert
+        assert result.base is instance._trials
+
+    def test_pickle(self):
+        """Only the recorded trials are pickled."""
+        # setup
+        instance = TrialStore(2, capacity=100)
+        instance.append([[1, 0]], [0.5])
+
+        # run
+        result = pickle.loads(pickle.dumps(instance))
+        result.append([[0, 1]], [0.2])
+
+        # assert
+        assert len(result._raw_scores) == 2
+        np.testing.assert_array_equal(result.trials, [[1, 0], [0, 1]])
+        np.testing.assert_array_equal(result.scores, [0.5, 0.2])
+
+
+class TestUntriedIndex(TestCase):
+
+    def test___init__(self):
+        # run
+        instance = UntriedIndex(5)
+
+        # assert
+        assert len(instance) == 5
+        assert all(rank in instance for rank in range(5))
+
+    def test_remove(self):
+        # setup
+        instance = UntriedIndex(5)
+
+        # run
+        instance.remove(1)
+        instance.remove(1)
+        instance.remove(4)
+
+        # assert
+        assert len(instance) == 3
+        assert [rank for rank in range(5) if rank in instance] == [0, 2, 3]
+
+    def test_add(self):
+        # setup
+        instance = UntriedIndex(5)
+        instance.remove(1)
+        instance.remove(3)
+
+        # run
+        instance.add(1)
+        instance.add(1)
+        instance.add(0)
+
+        # assert
+        assert len(instance) == 4
+        assert [rank for rank in range(5) if rank in instance] == [0, 1, 2, 4]
+
+    def test_sample_restores_index(self):
+        """Sampling does not modify the index."""
+        # setup
+        instance = UntriedIndex(10)
+        for rank in (3, 7, 1):
+            instance.remove(rank)
+
+        ranks = instance._ranks.copy()
+        positions = instance._positions.copy()
+
+        # run
+        instance.sample(5)
+
+        # assert
+        assert len(instance) == 7
+        assert instance._ranks == ranks
+        assert instance._positions == positions
+
+    def test_sample(self):
+        # setup
+        instance = UntriedIndex(10)
+        for rank in range(8):
+            instance.remove(rank)
+
+        # run
+        result = instance.sample(5)
+
+        # assert
+        assert sorted(result) == [8, 9]
+        assert len(instance) == 2
+
+    def test_sample_huge_cardinality(self):
+        # setup
+        instance = UntriedIndex(2 ** 62)
+
+        # run
+        result = instance.sample(3)
+
+        # assert
+        assert len(set(result)) == 3
+        assert len(instance) == 2 ** 62
+        assert instance._ranks == dict()
@@ -8,7 +8,7 @@ import pandas as pd
 
 from btb.tuning.hyperparams.boolean import BooleanHyperParam
 from btb.tuning.hyperparams.categorical import CategoricalHyperParam
-from btb.tuning.hyperparams.numerical import IntHyperParam
+from btb.tuning.hyperparams.numerical import FloatHyperParam, IntHyperParam
 from btb.tuning.tunable import Tunable
 
 
@@ -28,6 +28,9 @@ class TestTunable(TestCase):
         self.bhp = MagicMock(spec_set=BooleanHyperParam)
         self.chp = MagicMock(spec_set=CategoricalHyperParam)
         self.ihp = MagicMock(spec_set=IntHyperParam)
+        self.bhp.dimensions = 1
+        self.chp.dimensions = 1
+        self.ihp.dimensions = 1
 
         list_mock.return_value = ['bhp', 'chp', 'ihp']
 
@@ -127,6 +130,20 @@ class TestTunable(TestCase):
         with self.assertRaises(ValueError):
             self.instance.transform(values_list_dict)
 
+    def test_transform_dict_categorical_mixed_types(self):
+        """Categorical values of different types are not converted to strings."""
+        # setup
+        tunable = Tunable({
+            'chp': CategoricalHyperParam(['auto', 1, None]),
+            'ihp': IntHyperParam(1, 4),
+        })
+
+        # run
+        result = tunable.transform([{'chp': 1, 'ihp': 1}, {'chp': None, 'ihp': 4}])
+
+        # assert
+        np.testing.assert_array_equal(result, [[0, 1, 0, 0.125], [0, 0, 1, 0.875]])
+
     def test_transform_empty_list(self):
         """Test transform method with an empty list."""
         # run / assert
@@ -242,30 +259,47 @@ class TestTunable(TestCase):
     def test_inverse_transform_valid_data(self):
         """Test that the inverse transform method is calling the hyperparameters."""
         # setup
-        self.bhp.inverse_transform.return_value = [[True]]
-        self.chp.inverse_transform.return_value = [['cat']]
-        self.ihp.inverse_transform.return_value = [[1]]
+        self.bhp.inverse_transform.return_value = np.array([[True], [False]])
+        self.chp.inverse_transform.return_value = np.array([['cat'], ['dog']], dtype=object)
+        self.ihp.inverse_transform.return_value = np.array([[1], [3]])
 
-        values = [[1, 0, 1]]
+        values = [[1, 0, 0.1], [0, 1, 0.9]]
 
         # run
         result = self.instance.inverse_transform(values)
 
         # assert
-        expected_result = pd.DataFrame(
-            {
-                'bhp': [True],
-                'chp': ['cat'],
-                'ihp': [1]
-            },
-            dtype=object
-        )
-
-        self.bhp.inverse_transform.assert_called_once_with([1])
-        self.chp.inverse_transform.assert_called_once_with([0])
-        self.ihp.inverse_transform.assert_called_once_with([1])
+        expected_result = pd.DataFrame({
+            'bhp': [True, False],
+            'chp': np.array(['cat', 'dog'], dtype=object),
+            'ihp': [1, 3]
+        })
+
+        np.testing.assert_array_equal(self.bhp.inverse_transform.call_args[0][0], [[1], [0]])
+        np.testing.assert_array_equal(self.chp.inverse_transform.call_args[0][0], [[0], [1]])
+        np.testing.assert_array_equal(self.ihp.inverse_transform.call_args[0][0], [[0.1], [0.9]])
         pd.testing.assert_frame_equal(result, expected_result)
 
+    def test_inverse_transform_column_blocks(self):
+        """Every hyperparameter inverts its whole block of columns in a single call."""
+        # setup
+        instance = Tunable({
+            'chp': CategoricalHyperParam(['cat', 'dog', 'horse']),
+            'bhp': BooleanHyperParam(),
+            'ihp': IntHyperParam(1, 4),
+        })
+        values = instance.from_ranks(np.arange(24))
+
+        # run
+        result = instance.inverse_transform(values)
+
+        # assert
+        assert result['chp'].dtype == object
+        assert result['bhp'].dtype == bool
+        assert result['ihp'].dtype.kind == 'i'
+        assert result['chp'].tolist() == ['cat'] * 8 + ['dog'] * 8 + ['horse'] * 8
+        assert result['ihp'].tolist() == [1, 2, 3, 4] * 6
+
     def test_inverse_transform_invalid_data(self):
         """Test that the a ``TypeError`` is being raised when calling with the invalid data."""
         # setup
@@ -275,6 +309,60 @@ class TestTunable(TestCase):
         with self.assertRaises(TypeError):
             self.instance.inverse_transform(values)
 
+    def test_inverse_transform_records(self):
+        """Every hyperparameter inverts its whole column block at once."""
+        # setup
+        self.chp.dimensions = 2
+        instance = Tunable({'bhp': self.bhp, 'chp': self.chp, 'ihp': self.ihp})
+        self.bhp.inverse_transform.return_value = np.array([[True], [False]])
+        self.chp.inverse_transform.return_value = np.array([['cat'], ['dog']], dtype=object)
+        self.ihp.inverse_transform.return_value = np.array([[1], [3]])
+
+        values = np.array([[1, 1, 0, 0.1], [0, 0, 1, 0.9]])
+
+        # run
+        result = instance.inverse_transform_records(values)
+
+        # assert
+        assert result == [
+            {'bhp': True, 'chp': 'cat', 'ihp': 1},
+            {'bhp': False, 'chp': 'dog', 'ihp': 3},
+        ]
+        assert type(result[0]['ihp']) is int
+        np.testing.assert_array_equal(self.bhp.inverse_transform.call_args[0][0], [[1], [0]])
+        np.testing.assert_array_equal(
+            self.chp.inverse_transform.call_args[0][0], [[1, 0], [0, 1]])
+        np.testing.assert_array_equal(self.ihp.inverse_transform.call_args[0][0], [[0.1], [0.9]])
+
+    def test_inverse_transform_records_no_validate(self):
+        # setup
+        self.bhp.inverse_transform.return_value = np.array([[True]])
+        self.chp.inverse_transform.return_value = np.array([['cat']], dtype=object)
+        self.ihp.inverse_transform.return_value = np.array([[1]])
+
+        # run
+        self.instance.inverse_transform_records(np.array([[1, 0, 0.1]]), validate=False)
+
+        # assert
+        assert self.bhp.inverse_transform.call_args[1] == {'validate': False}
+        assert self.chp.inverse_transform.call_args[1] == {'validate': False}
+        assert self.ihp.inverse_transform.call_args[1] == {'validate': False}
+
+    def test_inverse_transform_records_equals_inverse_transform(self):
+        # setup
+        tunable = Tunable({
+            'bhp': BooleanHyperParam(),
+            'chp': CategoricalHyperParam(['cat', 'dog', None]),
+            'ihp': IntHyperParam(1, 10),
+        })
+        values = tunable.sample(5)
+
+        # run
+        result = tunable.inverse_transform_records(values)
+
+        # assert
+        assert result == tunable.inverse_transform(values).to_dict(orient='records')
+
     def test_sample(self):
         """Test that the method sample generates data from all the ``hyperparams``."""
 
@@ -295,6 +383,110 @@ class TestTunable(TestCase):
         self.chp.sample.assert_called_once_with(1)
         self.ihp.sample.assert_called_once_with(1)
 
+    @patch('btb.tuning.tunable.get_sampler')
+    def test_sample_method(self, mock_get_sampler):
+        """Test that the method sample maps one uniform column to each hyperparameter."""
+        # setup
+        uniform = np.array([[0.1, 0.2, 0.3]])
+        mock_get_sampler.return_value.random.return_value = uniform
+        self.bhp.from_uniform.return_value = [['a']]
+        self.chp.from_uniform.return_value = [['b']]
+        self.ihp.from_uniform.return_value = [['c']]
+
+        # run
+        result = self.instance.sample(1, 'sobol')
+        self.instance.sample(1, 'sobol')
+
+        # assert
+        np.testing.assert_array_equal(result, np.array([['a', 'b', 'c']]))
+        mock_get_sampler.assert_called_once_with('sobol', 3)
+        np.testing.assert_array_equal(self.bhp.from_uniform.call_args_list[0][0][0], [[0.1]])
+        np.testing.assert_array_equal(self.chp.from_uniform.call_args_list[0][0][0], [[0.2]])
+        np.testing.assert_array_equal(self.ihp.from_uniform.call_args_list[0][0][0], [[0.3]])
+        self.bhp.sample.assert_not_called()
+
+    def test_to_ranks(self):
+        """Test that every configuration gets a different rank."""
+        # setup
+        instance = Tunable({
+            'chp': CategoricalHyperParam(['cat', 'dog', 'horse']),
+            'bhp': BooleanHyperParam(),
+            'ihp': IntHyperParam(1, 4),
+        })
+        values = [
+            [1, 0, 0, 0, 0.125],
+            [1, 0, 0, 0, 0.375],
+            [1, 0, 0, 1, 0.125],
+            [0, 0, 1, 1, 0.875],
+        ]
+
+        # run
+        result = instance.to_ranks(values)
+
+        # assert
+        np.testing.assert_array_equal(result, np.array([0, 1, 4, 23]))
+
+    def test_from_ranks(self):
+        # setup
+        instance = Tunable({
+            'chp': CategoricalHyperParam(['cat', 'dog', 'horse']),
+            'bhp': BooleanHyperParam(),
+            'ihp': IntHyperParam(1, 4),
+        })
+
+        # run
+        result = instance.from_ranks([0, 1, 4, 23])
+
+        # assert
+        expected_result = np.array([
+            [1, 0, 0, 0, 0.125],
+            [1, 0, 0, 0, 0.375],
+            [1, 0, 0, 1, 0.125],
+            [0, 0, 1, 1, 0.875],
+        ])
+        np.testing.assert_array_equal(result, expected_result)
+
+    def test_from_dict_categorical_encoding(self):
+        # setup
+        dict_hyperparams = {
+            'chp': {
+                'type': 'str',
+                'values': ['a', 'b', 'c'],
+                'default': 'b',
+                'encoding': 'ordinal'
+            },
+        }
+
+        # run
+        result = Tunable.from_dict(dict_hyperparams)
+
+        # assert
+        assert result.hyperparams['chp'].encoding == 'ordinal'
+        assert result.dimensions == 1
+
+    def test_from_dict_numerical_scale(self):
+        # setup
+        dict_hyperparams = {
+            'fhp': {
+                'type': 'float',
+                'range': [0.0001, 1],
+                'scale': 'log'
+            },
+            'ihp': {
+                'type': 'int',
+                'range': [1, 1000],
+                'default': 10,
+                'scale': 'log'
+            },
+        }
+
+        # run
+        result = Tunable.from_dict(dict_hyperparams)
+
+        # assert
+        assert result.hyperparams['fhp'].scale == 'log'
+        assert result.hyperparams['ihp'].scale == 'log'
+
     def test_get_defaults(self):
         # setup
         bhp = MagicMock(default=True)
@@ -363,9 +555,10 @@ class TestTunable(TestCase):
 
         # assert
         mock_bool.assert_called_once_with(default=False)
-        mock_cat.assert_called_once_with(choices=['a', 'b', 'cat'], default='cat')
-        mock_float.assert_called_once_with(min=0.1, max=1.0, default=None)
-        mock_int.assert_called_once_with(min=1, max=10, default=5)
+        mock_cat.assert_called_once_with(
+            choices=['a', 'b', 'cat'], default='cat', encoding='onehot')
+        mock_float.assert_called_once_with(min=0.1, max=1.0, default=None, scale='linear')
+        mock_int.assert_called_once_with(min=1, max=10, default=5, scale='linear')
 
         expected_tunable_hp = {
             'bhp': mock_bool.return_value,
@@ -377,3 +570,207 @@ class TestTunable(TestCase):
         assert result.hyperparams == expected_tunable_hp
         assert result.dimensions == 4
         assert result.cardinality == 1
+
+
+class TestConditionalTunable(TestCase):
+    """Unit test for the class ``Tunable`` with conditional hyperparameters."""
+
+    def setUp(self):
+        hyperparams = {
+            'penalty': CategoricalHyperParam(['l1', 'l2', 'elasticnet']),
+            'l1_ratio': FloatHyperParam(min=0, max=1, default=0.5),
+            'fit': BooleanHyperParam(default=False),
+            'tol': IntHyperParam(min=1, max=3),
+        }
+        conditions = {
+            'l1_ratio': {'penalty': ['elasticnet']},
+            'fit': {'penalty': ['l2', 'elasticnet']},
+            'tol': {'fit': True},
+        }
+        self.instance = Tunable(hyperparams, conditions)
+
+    def test___init__(self):
+        # assert
+        assert self.instance.dimensions == 6
+        assert self.instance._conditional_names == ['l1_ratio', 'fit', 'tol']
+        np.testing.assert_array_equal(self.instance._inactive_values['l1_ratio'], [0.5])
+
+    def test___init__cardinality(self):
+        """Configurations that only differ in inactive hyperparameters are counted once."""
+        # setup
+        hyperparams = {
+            'kernel': CategoricalHyperParam(['rbf', 'poly']),
+            'degree': IntHyperParam(min=2, max=4),
+            'shrinking': BooleanHyperParam(),
+        }
+        conditions = {'degree': {'kernel': ['poly']}}
+
+        # run
+        instance = Tunable(hyperparams, conditions)
+
+        # assert
+        assert instance.cardinality == (1 + 3) * 2
+
+    def test___init__cardinality_infinite(self):
+        # assert
+        assert self.instance.cardinality == np.inf
+
+    def test___init__invalid_parent(self):
+        # setup
+        hyperparams = {
+            'fhp': FloatHyperParam(min=0, max=1),
+            'ihp': IntHyperParam(min=1, max=3),
+        }
+
+        # run / assert
+        with self.assertRaises(ValueError):
+            Tunable(hyperparams, {'ihp': {'fhp': [0.5]}})
+
+    def test___init__invalid_value(self):
+        # setup
+        hyperparams = {
+            'chp': CategoricalHyperParam(['a', 'b']),
+            'ihp': IntHyperParam(min=1, max=3),
+        }
+
+        # run / assert
+        with self.assertRaises(ValueError):
+            Tunable(hyperparams, {'ihp': {'chp': ['c']}})
+
+    def test___init__cycle(self):
+        # setup
+        hyperparams = {
+            'bhp': BooleanHyperParam(),
+            'chp': CategoricalHyperParam(['a', 'b']),
+        }
+        conditions = {
+            'bhp': {'chp': ['a']},
+            'chp': {'bhp': True},
+        }
+
+        # run / assert
+        with self.assertRaises(ValueError):
+            Tunable(hyperparams, conditions)
+
+    def test_impute(self):
+        """Inactive hyperparameters, including the children of inactive ones, are imputed."""
+        # setup
+        values = np.array([
+            [1, 0, 0, 0.9, 1, 0.5],
+            [0, 1, 0, 0.9, 0, 0.5],
+            [0, 0, 1, 0.9, 1, 0.5],
+        ])
+
+        # run
+        result = self.instance.impute(values)
+
+        # assert
+        expected_result = np.array([
+            [1, 0, 0, 0.5, 0, 1 / 6],
+            [0, 1, 0, 0.5, 0, 1 / 6],
+            [0, 0, 1, 0.9, 1, 0.5],
+        ])
+        np.testing.assert_allclose(result, expected_result)
+
+    def test_impute_no_conditions(self):
+        # setup
+        instance = Tunable({'bhp': BooleanHyperParam()})
+        values = np.array([[1]])
+
+        # run
+        result = instance.impute(values)
+
+        # assert
+        assert result is values
+
+    def test_transform_equivalent(self):
+        """Configurations that only differ in inactive hyperparameters are transformed equally.
+        """
+        # setup
+        values = [
+            {'penalty': 'l1', 'l1_ratio': 0.3, 'fit': True, 'tol': 2},
+            {'penalty': 'l1'},
+            {'penalty': 'l1', 'l1_ratio': None, 'fit': None},
+        ]
+
+        # run
+        result = self.instance.transform(values)
+
+        # assert
+        np.testing.assert_array_equal(result[0], result[1])
+        np.testing.assert_array_equal(result[0], result[2])
+
+    def test_transform_dict_missing_inactive(self):
+        # run
+        result = self.instance.transform({'penalty': 'elasticnet', 'l1_ratio': 0.2})
+
+        # assert
+        np.testing.assert_allclose(result, [[0, 0, 1, 0.2, 0, 1 / 6]])
+
+    def test_inverse_transform_records(self):
+        # setup
+        values = np.array([
+            [1, 0, 0, 0.9, 1, 0.5],
+            [0, 0, 1, 0.9, 1, 0.5],
+        ])
+
+        # run
+        result = self.instance.inverse_transform_records(values)
+
+        # assert
+        expected_result = [
+            {'penalty': 'l1'},
+            {'penalty': 'elasticnet', 'l1_ratio': 0.9, 'fit': True, 'tol': 2},
+        ]
+        assert result == expected_result
+
+    def test_inverse_transform(self):
+        # setup
+        values = np.array([
+            [0, 1, 0, 0.9, 0, 0.5],
+        ])
+
+        # run
+        result = self.instance.inverse_transform(values)
+
+        # assert
+        assert result.loc[0, 'penalty'] == 'l2'
+        assert result.loc[0, 'l1_ratio'] is None
+        assert not result.loc[0, 'fit']
+        assert result.loc[0, 'tol'] is None
+
+    def test_sample(self):
+        # run
+        result = self.instance.sample(20)
+
+        # assert
+        np.testing.assert_array_equal(result, self.instance.impute(result))
+
+    def test_get_defaults(self):
+        # run
+        result = self.instance.get_defaults()
+
+        # assert
+        assert result == {'penalty': 'l1'}
+
+    def test_from_dict_condition(self):
+        # setup
+        dict_hyperparams = {
+            'kernel': {
+                'type': 'str',
+                'values': ['rbf', 'poly'],
+                'default': 'rbf'
+            },
+            'degree': {
+                'type': 'int',
+                'range': [2, 4],
+                'condition': {'kernel': ['poly']}
+            },
+        }
+
+        # run
+        result = Tunable.from_dict(dict_hyperparams)
+
+        # assert
+        assert result.conditions == {'degree': {'kernel': ['poly']}}
+        assert result.cardinality == 4
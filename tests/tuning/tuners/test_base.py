@@ -5,8 +5,11 @@ from unittest.mock import MagicMock, call, patch
 
 import numpy as np
 
+from btb.tuning.hyperparams import (
+    BooleanHyperParam, CategoricalHyperParam, FloatHyperParam, IntHyperParam)
+from btb.tuning.trials import TrialStore, UntriedIndex
 from btb.tuning.tunable import Tunable
-from btb.tuning.tuners.base import BaseMetaModelTuner, BaseTuner, StopTuning
+from btb.tuning.tuners.base import BaseMetaModelTuner, BaseTuner, StopTuning, _fit_metamodel
 
 
 class TestBaseTuner(TestCase):
@@ -25,13 +28,16 @@ class TestBaseTuner(TestCase):
         assert isinstance(instance.raw_scores, np.ndarray)
         assert isinstance(instance.scores, np.ndarray)
         assert isinstance(instance._trials_set, set)
+        assert isinstance(instance._pending_set, set)
         assert isinstance(instance.maximize, bool)
 
         assert instance.maximize
+        assert isinstance(instance._store, TrialStore)
         assert instance.trials.shape == (0, 1)
-        assert instance.raw_scores.shape == (0, 1)
+        assert instance.raw_scores.shape == (0, )
         assert instance.trials.dtype == np.float
         assert instance.raw_scores.dtype == np.float
+        assert instance.sampling_method == 'random'
 
     def test___init__maximize_false(self):
         # setup
@@ -46,6 +52,7 @@ class TestBaseTuner(TestCase):
         assert isinstance(instance.raw_scores, np.ndarray)
         assert isinstance(instance.scores, np.ndarray)
         assert isinstance(instance._trials_set, set)
+        assert isinstance(instance._pending_set, set)
         assert isinstance(instance.maximize, bool)
 
         assert not instance.maximize
@@ -110,8 +117,7 @@ class TestBaseTuner(TestCase):
         # setup
         instance = MagicMock()
         instance.tunable = MagicMock(spec_set=Tunable)
-        inverse_return = instance.tunable.inverse_transform.return_value
-        inverse_return.to_dict.return_value = [1]
+        instance.tunable.inverse_transform_records.return_value = [1]
         instance._propose = MagicMock(return_value=1)
 
         # run
@@ -120,8 +126,8 @@ class TestBaseTuner(TestCase):
         # assert
         instance._check_proposals.assert_called_once_with(1)
         instance._propose.assert_called_once_with(1, False)
-        instance.tunable.inverse_transform.called_once_with(1)
-        inverse_return.to_dict.assert_called_once_with(orient='records')
+        instance.tunable.inverse_transform_records.assert_called_once_with(
+            1, validate=False)
         assert result == 1
 
     @patch('btb.tuning.tuners.base.BaseTuner._check_proposals')
@@ -132,8 +138,7 @@ class TestBaseTuner(TestCase):
         # setup
         instance = MagicMock()
         instance.tunable = MagicMock(spec_set=Tunable)
-        inverse_return = instance.tunable.inverse_transform.return_value
-        inverse_return.to_dict.return_value = [1]
+        instance.tunable.inverse_transform_records.return_value = [1]
         instance._propose = MagicMock(return_value=1)
 
         # run
@@ -142,8 +147,8 @@ class TestBaseTuner(TestCase):
         # assert
         instance._check_proposals.assert_not_called()
         instance._propose.assert_called_once_with(1, True)
-        instance.tunable.inverse_transform.called_once_with(1)
-        inverse_return.to_dict.assert_called_once_with(orient='records')
+        instance.tunable.inverse_transform_records.assert_called_once_with(
+            1, validate=False)
         assert result == 1
 
     @patch('btb.tuning.tuners.base.BaseTuner._check_proposals')
@@ -154,8 +159,7 @@ class TestBaseTuner(TestCase):
         # setup
         instance = MagicMock()
         instance.tunable = MagicMock(spec_set=Tunable)
-        inverse_return = instance.tunable.inverse_transform.return_value
-        inverse_return.to_dict.return_value = [1, 2]
+        instance.tunable.inverse_transform_records.return_value = [1, 2]
         instance._propose = MagicMock(return_value=2)
 
         # run
@@ -163,8 +167,8 @@ class TestBaseTuner(TestCase):
 
         # assert
         instance._propose.assert_called_once_with(2, False)
-        instance.tunable.inverse_transform.called_once_with(2)
-        inverse_return.to_dict.assert_called_once_with(orient='records')
+        instance.tunable.inverse_transform_records.assert_called_once_with(
+            2, validate=False)
         assert result == [1, 2]
 
     @patch('btb.tuning.tuners.base.BaseTuner._check_proposals')
@@ -176,8 +180,7 @@ class TestBaseTuner(TestCase):
         # setup
         instance = MagicMock()
         instance.tunable = MagicMock(spec_set=Tunable)
-        inverse_return = instance.tunable.inverse_transform.return_value
-        inverse_return.to_dict.return_value = [1, 2]
+        instance.tunable.inverse_transform_records.return_value = [1, 2]
         instance._propose = MagicMock(return_value=2)
 
         # run
@@ -185,14 +188,127 @@ class TestBaseTuner(TestCase):
 
         # assert
         instance._propose.assert_called_once_with(2, True)
-        instance.tunable.inverse_transform.called_once_with(2)
-        inverse_return.to_dict.assert_called_once_with(orient='records')
+        instance.tunable.inverse_transform_records.assert_called_once_with(
+            2, validate=False)
         assert result == [1, 2]
 
+    def test___init__finite_cardinality(self):
+        # setup
+        tunable = Tunable({'chp': CategoricalHyperParam(['a', 'b']), 'ihp': IntHyperParam(1, 4)})
+
+        # run
+        instance = BaseTuner(tunable)
+
+        # assert
+        assert isinstance(instance._untried, UntriedIndex)
+        assert len(instance._untried) == 8
+
+    def test___init__infinite_cardinality(self):
+        # setup
+        tunable = Tunable({'chp': CategoricalHyperParam(['a', 'b']), 'fhp': FloatHyperParam()})
+
+        # run
+        instance = BaseTuner(tunable)
+
+        # assert
+        assert instance._untried is None
+
+    def test___init__conditional(self):
+        """Conditional tunables are not ranked, even if their cardinality is finite."""
+        # setup
+        hyperparams = {'chp': CategoricalHyperParam(['a', 'b']), 'ihp': IntHyperParam(1, 4)}
+        tunable = Tunable(hyperparams, conditions={'ihp': {'chp': ['b']}})
+
+        # run
+        instance = BaseTuner(tunable)
+
+        # assert
+        assert instance._untried is None
+
+    def test_record_conditional_duplicates(self):
+        """Configurations that only differ in inactive hyperparameters are tried once."""
+        # setup
+        hyperparams = {'chp': CategoricalHyperParam(['a', 'b']), 'ihp': IntHyperParam(1, 4)}
+        tunable = Tunable(hyperparams, conditions={'ihp': {'chp': ['b']}})
+        instance = BaseTuner(tunable)
+
+        # run
+        instance.record([{'chp': 'a', 'ihp': 1}, {'chp': 'a', 'ihp': 3}], [0.1, 0.2])
+
+        # assert
+        assert len(instance._trials_set) == 1
+
+    def test__get_keys(self):
+        # setup
+        instance = MagicMock()
+        instance._untried = None
+
+        # run
+        result = BaseTuner._get_keys(instance, np.array([[1, 0.5], [0, 0.1]]))
+
+        # assert
+        assert result == [(1, 0.5), (0, 0.1)]
+
+    def test__get_keys_ranks(self):
+        # setup
+        instance = MagicMock()
+        instance.tunable.to_ranks.return_value = np.array([3, 1])
+
+        # run
+        result = BaseTuner._get_keys(instance, 'trials')
+
+        # assert
+        instance.tunable.to_ranks.assert_called_once_with('trials')
+        assert result == [3, 1]
+
+    def test__sample_not_allow_duplicates_untried(self):
+        """The untried configurations are sampled directly from their ranks."""
+        # setup
+        tunable = Tunable({'chp': CategoricalHyperParam(['a', 'b', 'c', 'd'])})
+        instance = BaseTuner(tunable)
+        instance.record([{'chp': 'a'}, {'chp': 'c'}], [1, 2])
+        instance.mark_pending({'chp': 'b'})
+
+        # run
+        result = instance._sample(1, False)
+
+        # assert
+        np.testing.assert_array_equal(result, np.array([[0, 0, 0, 1]]))
+
+    def test__sample_not_allow_duplicates_untried_sampling_method(self):
+        """The proposals that the sampling method does not find are sampled from the ranks."""
+        # setup
+        tunable = Tunable({'chp': CategoricalHyperParam(['a', 'b', 'c', 'd'])})
+        instance = BaseTuner(tunable, sampling_method='sobol')
+        instance.record([{'chp': 'a'}, {'chp': 'b'}, {'chp': 'c'}], [1, 2, 3])
+
+        # run
+        result = instance._sample(1, False)
+
+        # assert
+        np.testing.assert_array_equal(result, np.array([[0, 0, 0, 1]]))
+
+    def test_clear_pending_untried(self):
+        # setup
+        tunable = Tunable({'chp': CategoricalHyperParam(['a', 'b'])})
+        instance = BaseTuner(tunable)
+        instance.record({'chp': 'a'}, 1)
+        instance.mark_pending([{'chp': 'a'}, {'chp': 'b'}])
+
+        # run
+        instance.clear_pending([{'chp': 'a'}, {'chp': 'b'}])
+
+        # assert
+        assert instance._trials_set == {0}
+        assert instance._pending_set == set()
+        assert len(instance._untried) == 1
+        assert 1 in instance._untried
+
     def test__sample_allow_duplicates(self):
         """Test the method ``_sample``when using duplicates."""
         # setup
         instance = MagicMock()
+        instance.sampling_method = 'sobol'
         instance.tunable = MagicMock(spec_set=Tunable)
         instance.tunable.sample.return_value = 1
 
@@ -200,14 +316,18 @@ class TestBaseTuner(TestCase):
         result = BaseTuner._sample(instance, 1, True)
 
         # assert
-        instance.tunable.sample.assert_called_once_with(1)
+        instance.tunable.sample.assert_called_once_with(1, 'sobol')
         assert result == 1
 
     def test__sample_not_allow_duplicates(self):
         """Test that the method ``_sample`` returns ``np.ndarray`` when not using duplicates."""
         # setup
         instance = MagicMock()
+        instance._untried = None
+        instance._get_keys.side_effect = lambda trials: list(map(tuple, trials))
+        instance.sampling_method = 'sobol'
         instance._trials_set = set()
+        instance._pending_set = set()
         instance.tunable = MagicMock(spec_set=Tunable)
         instance.tunable.sample.return_value = np.array([[3]])
 
@@ -215,7 +335,7 @@ class TestBaseTuner(TestCase):
         result = BaseTuner._sample(instance, 1, False)
 
         # assert
-        instance.tunable.sample.assert_called_once_with(1)
+        instance.tunable.sample.assert_called_once_with(1, 'sobol')
         np.testing.assert_array_equal(result, np.array([[3]]))
 
     def test_sample_no_duplicates_more_than_one_loop(self):
@@ -224,8 +344,12 @@ class TestBaseTuner(TestCase):
         """
         # setup
         instance = MagicMock()
+        instance._untried = None
+        instance._get_keys.side_effect = lambda trials: list(map(tuple, trials))
+        instance.sampling_method = 'sobol'
         instance.tunable = MagicMock(spec_set=Tunable)
         instance._trials_set = set({(1, ), (2, )})
+        instance._pending_set = set()
 
         side_effect = [np.array([[3]]), np.array([[1]]), np.array([[1]]), np.array([[4]])]
         instance.tunable.sample.side_effect = side_effect
@@ -234,7 +358,7 @@ class TestBaseTuner(TestCase):
         result = BaseTuner._sample(instance, 2, False)
 
         # assert
-        assert instance.tunable.sample.call_args_list == [call(2), call(2), call(2), call(2)]
+        assert instance.tunable.sample.call_args_list == [call(2, 'sobol')] * 4
         np.testing.assert_array_equal(result, np.array([[3], [4]]))
 
     def test_record_list_maximize_true(self):
@@ -242,13 +366,13 @@ class TestBaseTuner(TestCase):
 
         # setup
         instance = MagicMock()
+        instance._untried = None
+        instance._get_keys.side_effect = lambda trials: list(map(tuple, trials))
         instance.tunable = MagicMock(spec_set=Tunable)
         instance.tunable.transform.return_value = np.array([[1, 0]])
-        instance.trials = np.empty((0, 2), dtype=np.float)
+        instance._store = TrialStore(2, maximize=True)
         instance._trials_set = set()
-        instance.scores = None
-        instance.maximize = True
-        instance.raw_scores = np.empty((0, 1), dtype=np.float)
+        instance._pending_set = set()
 
         # run
         BaseTuner.record(instance, [1], [0.1])
@@ -256,23 +380,23 @@ class TestBaseTuner(TestCase):
         # assert
         instance.tunable.transform.assert_called_once_with([1])
 
-        np.testing.assert_array_equal(instance.trials, np.array([[1, 0]]))
+        np.testing.assert_array_equal(instance._store.trials, np.array([[1, 0]]))
         assert instance._trials_set == set({(1, 0)})
-        np.testing.assert_array_equal(instance.raw_scores, np.array([0.1]))
-        np.testing.assert_array_equal(instance.scores, np.array([0.1]))
+        np.testing.assert_array_equal(instance._store.raw_scores, np.array([0.1]))
+        np.testing.assert_array_equal(instance._store.scores, np.array([0.1]))
 
     def test_record_list_maximize_false(self):
         """Test that the method record updates the ``trials``  and ``scores``."""
 
         # setup
         instance = MagicMock()
+        instance._untried = None
+        instance._get_keys.side_effect = lambda trials: list(map(tuple, trials))
         instance.tunable = MagicMock(spec_set=Tunable)
         instance.tunable.transform.return_value = np.array([[1, 0]])
-        instance.trials = np.empty((0, 2), dtype=np.float)
+        instance._store = TrialStore(2, maximize=False)
         instance._trials_set = set()
-        instance.scores = None
-        instance.maximize = False
-        instance.raw_scores = np.empty((0, 1), dtype=np.float)
+        instance._pending_set = set()
 
         # run
         BaseTuner.record(instance, [1], [0.1])
@@ -280,10 +404,10 @@ class TestBaseTuner(TestCase):
         # assert
         instance.tunable.transform.assert_called_once_with([1])
 
-        np.testing.assert_array_equal(instance.trials, np.array([[1, 0]]))
+        np.testing.assert_array_equal(instance._store.trials, np.array([[1, 0]]))
         assert instance._trials_set == set({(1, 0)})
-        np.testing.assert_array_equal(instance.raw_scores, np.array([0.1]))
-        np.testing.assert_array_equal(instance.scores, np.array([-0.1]))
+        np.testing.assert_array_equal(instance._store.raw_scores, np.array([0.1]))
+        np.testing.assert_array_equal(instance._store.scores, np.array([-0.1]))
 
     def test_record_scalar_values(self):
         """Test that the method record performs an update to ``trials`` and ``scores`` when called
@@ -291,10 +415,12 @@ class TestBaseTuner(TestCase):
         """
         # setup
         instance = MagicMock()
+        instance._untried = None
+        instance._get_keys.side_effect = lambda trials: list(map(tuple, trials))
         instance.tunable = MagicMock(spec_set=Tunable)
-        instance.trials = np.empty((0, 2), dtype=np.float)
-        instance.raw_scores = np.empty((0, 1), dtype=np.float)
+        instance._store = TrialStore(2)
         instance._trials_set = set()
+        instance._pending_set = set()
         instance.tunable.transform.return_value = np.array([[1, 0]])
 
         # run
@@ -302,10 +428,10 @@ class TestBaseTuner(TestCase):
 
         # assert
         instance.tunable.transform.assert_called_once_with(1)
-        np.testing.assert_array_equal(instance.trials, np.array([[1, 0]]))
+        np.testing.assert_array_equal(instance._store.trials, np.array([[1, 0]]))
         assert instance._trials_set == set({(1, 0)})
-        np.testing.assert_array_equal(instance.raw_scores, np.array([0.1]))
-        np.testing.assert_array_equal(instance.scores, np.array([0.1]))
+        np.testing.assert_array_equal(instance._store.raw_scores, np.array([0.1]))
+        np.testing.assert_array_equal(instance._store.scores, np.array([0.1]))
 
     def test_record_raise_error(self):
         """Test that the method record raises a ``ValueError`` when ``len(trials)`` is different
@@ -313,6 +439,8 @@ class TestBaseTuner(TestCase):
         """
         # setup
         instance = MagicMock()
+        instance._untried = None
+        instance._get_keys.side_effect = lambda trials: list(map(tuple, trials))
         instance.tunable = MagicMock(spec_set=Tunable)
         instance.tunable.transform.return_value = np.array([[1, 0]])
 
@@ -320,6 +448,88 @@ class TestBaseTuner(TestCase):
         with self.assertRaises(ValueError):
             BaseTuner.record(instance, 1, [1, 2])
 
+    def test_mark_pending(self):
+        """Test that only the trials that are not recorded are marked as pending."""
+        # setup
+        instance = MagicMock()
+        instance._untried = None
+        instance._get_keys.side_effect = lambda trials: list(map(tuple, trials))
+        instance.tunable = MagicMock(spec_set=Tunable)
+        instance.tunable.transform.return_value = np.array([[1, 0], [0, 1]])
+        instance._trials_set = set({(0, 1)})
+        instance._pending_set = set()
+
+        # run
+        BaseTuner.mark_pending(instance, 'trials')
+
+        # assert
+        instance.tunable.transform.assert_called_once_with('trials')
+        assert instance._pending_set == set({(1, 0)})
+
+    def test_clear_pending(self):
+        # setup
+        instance = MagicMock()
+        instance._untried = None
+        instance._get_keys.side_effect = lambda trials: list(map(tuple, trials))
+        instance.tunable = MagicMock(spec_set=Tunable)
+        instance.tunable.transform.return_value = np.array([[1, 0]])
+        instance._pending_set = set({(1, 0), (0, 1)})
+
+        # run
+        BaseTuner.clear_pending(instance, 'trials')
+
+        # assert
+        assert instance._pending_set == set({(0, 1)})
+
+    def test__check_proposals_trials_and_pending_eq_cardinality(self):
+        """Test that the pending trials are considered as tried."""
+        # setup
+        instance = MagicMock()
+        instance.tunable = MagicMock(spec_set=Tunable)
+        instance.tunable.cardinality = 2
+        instance._trials_set = set({(0, )})
+        instance._pending_set = set({(1, )})
+
+        # run / assert
+        with self.assertRaises(StopTuning):
+            BaseTuner._check_proposals(instance, 1)
+
+    def test__sample_not_allow_duplicates_pending(self):
+        """Test that the pending trials are not sampled."""
+        # setup
+        instance = MagicMock()
+        instance._untried = None
+        instance._get_keys.side_effect = lambda trials: list(map(tuple, trials))
+        instance.tunable = MagicMock(spec_set=Tunable)
+        instance._trials_set = set({(1, )})
+        instance._pending_set = set({(2, )})
+        instance.tunable.sample.side_effect = [np.array([[1], [2]]), np.array([[2], [3]])]
+
+        # run
+        result = BaseTuner._sample(instance, 1, False)
+
+        # assert
+        np.testing.assert_array_equal(result, np.array([[3]]))
+
+    def test_record_clears_pending(self):
+        # setup
+        instance = MagicMock()
+        instance._untried = None
+        instance._get_keys.side_effect = lambda trials: list(map(tuple, trials))
+        instance.tunable = MagicMock(spec_set=Tunable)
+        instance.tunable.transform.return_value = np.array([[1, 0]])
+        instance.trials = np.empty((0, 2), dtype=np.float)
+        instance._trials_set = set()
+        instance._pending_set = set({(1, 0), (0, 1)})
+        instance.maximize = True
+        instance.raw_scores = np.empty((0, 1), dtype=np.float)
+
+        # run
+        BaseTuner.record(instance, [1], [0.1])
+
+        # assert
+        assert instance._pending_set == set({(0, 1)})
+
 
 class TestBaseMetaModelTuner(TestCase):
     """Test BaseMetaModelTuner class."""
@@ -338,6 +548,11 @@ class TestBaseMetaModelTuner(TestCase):
         # assert
         assert instance.num_candidates == 1000
         assert instance.min_trials == 5
+        assert instance.max_staleness == 1
+        assert instance._fit_executor is None
+        assert instance.local_search_starts == 0
+        assert instance.local_search_iterations == 10
+        assert instance.local_search_step == 0.1
         instance.__init_metamodel__.assert_called_once_with()
         instance.__init_acquisition__.assert_called_once_with()
 
@@ -359,11 +574,21 @@ class TestBaseMetaModelTuner(TestCase):
             maximize=False,
             num_candidates=5,
             min_trials=20,
+            fit_executor='executor',
+            max_staleness=3,
+            local_search_starts=4,
+            local_search_iterations=2,
+            local_search_step=0.5,
         )
 
         # assert
         assert instance.num_candidates == 5
         assert instance.min_trials == 20
+        assert instance.max_staleness == 3
+        assert instance._fit_executor == 'executor'
+        assert instance.local_search_starts == 4
+        assert instance.local_search_iterations == 2
+        assert instance.local_search_step == 0.5
         instance.__init_metamodel__.assert_called_once_with(a='test')
         instance.__init_acquisition__.assert_called_once_with(a='acquisition_test')
 
@@ -392,6 +617,8 @@ class TestBaseMetaModelTuner(TestCase):
         instance._sample.return_value = np.array([1])
         instance._predict.return_value = 'predicted'
         instance._acquire.return_value = 0
+        instance.local_search_starts = 0
+        instance._fit_executor = None
 
         # run
         result = BaseMetaModelTuner._propose(instance, 1, True)
@@ -412,6 +639,8 @@ class TestBaseMetaModelTuner(TestCase):
         instance._sample.return_value = np.array([1])
         instance._predict.return_value = 'predicted'
         instance._acquire.return_value = 0
+        instance.local_search_starts = 0
+        instance._fit_executor = None
 
         # run
         result = BaseMetaModelTuner._propose(instance, 1, False)
@@ -433,6 +662,8 @@ class TestBaseMetaModelTuner(TestCase):
         instance._sample.return_value = np.array([1])
         instance._predict.return_value = 'predicted'
         instance._acquire.return_value = 0
+        instance.local_search_starts = 0
+        instance._fit_executor = None
 
         # run
         result = BaseMetaModelTuner._propose(instance, 1, False)
@@ -443,6 +674,132 @@ class TestBaseMetaModelTuner(TestCase):
         instance._acquire.assert_called_once_with('predicted', 1)
         assert result == 1
 
+    def test__propose_local_search(self):
+        # setup
+        instance = MagicMock()
+        instance.tunable = MagicMock(spec_set=Tunable)
+        instance.tunable.cardinality = 3
+        instance.min_trials = 0
+        instance.num_candidates = 10
+        instance.local_search_starts = 1
+        instance._trials_set.__len__.return_value = 1
+        instance._sample.return_value = 'sample'
+        instance._predict.return_value = 'predicted'
+        instance._local_search.return_value = (np.array([2]), 'refined')
+        instance._acquire.return_value = 0
+        instance._fit_executor = None
+
+        # run
+        result = BaseMetaModelTuner._propose(instance, 1, True)
+
+        # assert
+        instance._local_search.assert_called_once_with(instance, 'sample', 'predicted', True)
+        instance._acquire.assert_called_once_with('refined', 1)
+        assert result == 2
+
+    def test__get_continuous_dimensions(self):
+        # setup
+        instance = MagicMock()
+        instance.tunable = Tunable({
+            'chp': CategoricalHyperParam(['a', 'b']),
+            'fhp': FloatHyperParam(0, 1),
+            'ihp': IntHyperParam(0, 10),
+            'bhp': BooleanHyperParam(),
+            'fhp2': FloatHyperParam(-1, 1),
+        })
+
+        # run
+        result = BaseMetaModelTuner._get_continuous_dimensions(instance)
+
+        # assert
+        np.testing.assert_array_equal(result, [2, 5])
+
+    def test__get_categorical_dimensions(self):
+        # setup
+        instance = MagicMock()
+        instance.tunable = Tunable({
+            'chp': CategoricalHyperParam(['a', 'b']),
+            'ohp': CategoricalHyperParam(['a', 'b', 'c'], encoding='ordinal'),
+            'fhp': FloatHyperParam(0, 1),
+            'ohp2': CategoricalHyperParam(['a', 'b'], encoding='ordinal'),
+        })
+
+        # run
+        result = BaseMetaModelTuner._get_categorical_dimensions(instance)
+
+        # assert
+        np.testing.assert_array_equal(result, [2, 4])
+
+    def test__local_search(self):
+        """The best candidates move towards the maximum of the model."""
+        # setup
+        metamodel = MagicMock()
+        metamodel._predict.side_effect = lambda x: -np.abs(x[:, 0] - 0.5)
+
+        instance = MagicMock()
+        instance.local_search_starts = 1
+        instance.local_search_iterations = 10
+        instance.local_search_step = 0.25
+        instance._get_continuous_dimensions.return_value = np.array([0])
+        instance._score.side_effect = lambda x: x
+        instance._get_max_candidates = BaseMetaModelTuner._get_max_candidates
+        instance.tunable.impute.side_effect = lambda values: values
+
+        candidates = np.array([[0., 1.], [0.75, 0.], [0.9, 1.]])
+        predicted = -np.abs(candidates[:, 0] - 0.5)
+
+        # run
+        candidates, predicted = BaseMetaModelTuner._local_search(
+            instance, metamodel, candidates, predicted, True)
+
+        # assert
+        np.testing.assert_array_equal(candidates, [[0., 1.], [0.5, 0.], [0.9, 1.]])
+        np.testing.assert_array_equal(predicted, [-0.5, 0., -0.4])
+        assert metamodel._predict.call_count == 10
+
+    def test__local_search_not_allow_duplicates(self):
+        """Refined candidates that were already tried are discarded."""
+        # setup
+        metamodel = MagicMock()
+        metamodel._predict.side_effect = lambda x: -np.abs(x[:, 0] - 0.5)
+
+        instance = MagicMock()
+        instance._untried = None
+        instance._get_keys.side_effect = lambda trials: list(map(tuple, trials))
+        instance.local_search_starts = 2
+        instance.local_search_iterations = 1
+        instance.local_search_step = 0.25
+        instance._get_continuous_dimensions.return_value = np.array([0])
+        instance._score.side_effect = lambda x: x
+        instance._get_max_candidates = BaseMetaModelTuner._get_max_candidates
+        instance.tunable.impute.side_effect = lambda values: values
+        instance._trials_set = {(0.5, 0.)}
+        instance._pending_set = set()
+
+        candidates = np.array([[0.75, 0.], [0.25, 1.]])
+        predicted = -np.abs(candidates[:, 0] - 0.5)
+
+        # run
+        candidates, predicted = BaseMetaModelTuner._local_search(
+            instance, metamodel, candidates, predicted, False)
+
+        # assert
+        np.testing.assert_array_equal(candidates, [[0.75, 0.], [0.5, 1.]])
+        np.testing.assert_array_equal(predicted, [-0.25, 0.])
+
+    def test__local_search_no_continuous_dimensions(self):
+        # setup
+        metamodel = MagicMock()
+        instance = MagicMock()
+        instance._get_continuous_dimensions.return_value = np.array([], dtype=int)
+
+        # run
+        result = BaseMetaModelTuner._local_search(instance, metamodel, 'candidates', 'pred', True)
+
+        # assert
+        assert result == ('candidates', 'pred')
+        metamodel._predict.assert_not_called()
+
     @patch('btb.tuning.tuners.base.super')
     def test_record(self, mock_super):
         # setup
@@ -450,6 +807,7 @@ class TestBaseMetaModelTuner(TestCase):
         instance.trials = np.array([2])
         instance.scores = 1
         instance.min_trials = 1
+        instance._fit_executor = None
 
         # run
         BaseMetaModelTuner.record(instance, 1, 1)
@@ -457,3 +815,242 @@ class TestBaseMetaModelTuner(TestCase):
         # assert
         mock_super.return_value.record.assert_called_once_with(1, 1)
         instance._fit.assert_called_once_with(np.array([2]), 1)
+        assert instance._metamodel_trials == 1
+
+    @patch('btb.tuning.tuners.base.super')
+    def test_record_fit_executor(self, mock_super):
+        # setup
+        instance = MagicMock()
+        instance.trials = np.array([2])
+        instance.min_trials = 1
+
+        # run
+        BaseMetaModelTuner.record(instance, 1, 1)
+
+        # assert
+        instance._fit.assert_not_called()
+
+    def test__propose_fit_executor(self):
+        # setup
+        metamodel = MagicMock()
+        metamodel._predict.return_value = 'predicted'
+
+        instance = MagicMock()
+        instance.tunable = MagicMock(spec_set=Tunable)
+        instance.tunable.cardinality = 3
+        instance.min_trials = 0
+        instance.num_candidates = 10
+        instance._trials_set.__len__.return_value = 1
+        instance._sample.return_value = np.array([1])
+        instance._acquire.return_value = 0
+        instance.local_search_starts = 0
+        instance._get_metamodel.return_value = metamodel
+
+        # run
+        result = BaseMetaModelTuner._propose(instance, 1, True)
+
+        # assert
+        metamodel._predict.assert_called_once_with(np.array([1]))
+        instance._predict.assert_not_called()
+        instance._acquire.assert_called_once_with('predicted', 1)
+        instance._start_fit.assert_called_once_with()
+        assert result == 1
+
+    def test__propose_fit_executor_no_metamodel(self):
+        # setup
+        instance = MagicMock()
+        instance.min_trials = 0
+        instance.num_candidates = 10
+        instance._trials_set.__len__.return_value = 1
+        instance._sample.return_value = 'sample'
+        instance._get_metamodel.return_value = None
+
+        # run
+        result = BaseMetaModelTuner._propose(instance, 1, True)
+
+        # assert
+        instance._sample.assert_called_once_with(1, True)
+        instance._predict.assert_not_called()
+        instance._start_fit.assert_called_once_with()
+        assert result == 'sample'
+
+    def test_staleness(self):
+        # setup
+        instance = MagicMock()
+        instance.trials = np.array([[1], [2], [3]])
+        instance._metamodel_trials = 1
+
+        # run
+        result = BaseMetaModelTuner.staleness.fget(instance)
+
+        # assert
+        assert result == 2
+
+    def test__refresh_metamodel_done(self):
+        # setup
+        future = MagicMock()
+        future.done.return_value = True
+        future.result.return_value = ('metamodel', 3)
+
+        instance = MagicMock()
+        instance._fit_future = future
+
+        # run
+        BaseMetaModelTuner._refresh_metamodel(instance)
+
+        # assert
+        assert instance._metamodel == 'metamodel'
+        assert instance._metamodel_trials == 3
+        assert instance._fit_future is None
+
+    def test__refresh_metamodel_running(self):
+        # setup
+        future = MagicMock()
+        future.done.return_value = False
+
+        instance = MagicMock()
+        instance._fit_future = future
+        instance._metamodel = None
+
+        # run
+        BaseMetaModelTuner._refresh_metamodel(instance)
+
+        # assert
+        future.result.assert_not_called()
+        assert instance._fit_future is future
+        assert instance._metamodel is None
+
+    def test__refresh_metamodel_wait(self):
+        # setup
+        future = MagicMock()
+        future.done.return_value = False
+        future.result.return_value = ('metamodel', 3)
+
+        instance = MagicMock()
+        instance._fit_future = future
+
+        # run
+        BaseMetaModelTuner._refresh_metamodel(instance, wait=True)
+
+        # assert
+        assert instance._metamodel == 'metamodel'
+        assert instance._fit_future is None
+
+    @patch('btb.tuning.tuners.base.copy')
+    def test__start_fit(self, mock_copy):
+        # setup
+        instance = MagicMock()
+        instance._fit_future = None
+        instance._metamodel = None
+        instance.staleness = 2
+
+        # run
+        BaseMetaModelTuner._start_fit(instance)
+
+        # assert
+        mock_copy.copy.assert_called_once_with(instance)
+        instance._fit_executor.submit.assert_called_once_with(
+            _fit_metamodel, mock_copy.copy.return_value, instance.trials, instance.scores)
+        assert instance._fit_future == instance._fit_executor.submit.return_value
+
+    @patch('btb.tuning.tuners.base.copy')
+    def test__start_fit_fitted_metamodel(self, mock_copy):
+        # setup
+        instance = MagicMock()
+        instance._fit_future = None
+        instance._metamodel = 'metamodel'
+        instance.staleness = 2
+
+        # run
+        BaseMetaModelTuner._start_fit(instance)
+
+        # assert
+        mock_copy.copy.assert_called_once_with('metamodel')
+
+    def test__start_fit_running(self):
+        # setup
+        instance = MagicMock()
+        instance._fit_future = 'future'
+        instance.staleness = 2
+
+        # run
+        BaseMetaModelTuner._start_fit(instance)
+
+        # assert
+        instance._fit_executor.submit.assert_not_called()
+        assert instance._fit_future == 'future'
+
+    def test__start_fit_not_stale(self):
+        # setup
+        instance = MagicMock()
+        instance._fit_future = None
+        instance.staleness = 0
+
+        # run
+        BaseMetaModelTuner._start_fit(instance)
+
+        # assert
+        instance._fit_executor.submit.assert_not_called()
+
+    def test__get_metamodel(self):
+        # setup
+        instance = MagicMock()
+        instance.staleness = 1
+        instance.max_staleness = 1
+
+        # run
+        result = BaseMetaModelTuner._get_metamodel(instance)
+
+        # assert
+        instance._refresh_metamodel.assert_called_once_with()
+        instance._start_fit.assert_not_called()
+        assert result == instance._metamodel
+
+    def test__get_metamodel_too_stale(self):
+        # setup
+        instance = MagicMock()
+        instance.staleness = 3
+        instance.max_staleness = 1
+
+        def refresh_metamodel(wait=False):
+            if wait:
+                instance.staleness = 0
+
+        instance._refresh_metamodel.side_effect = refresh_metamodel
+
+        # run
+        result = BaseMetaModelTuner._get_metamodel(instance)
+
+        # assert
+        instance._start_fit.assert_called_once_with()
+        instance._refresh_metamodel.assert_has_calls([call(), call(wait=True)])
+        assert result == instance._metamodel
+
+    def test___getstate__(self):
+        # setup
+        instance = MagicMock()
+        instance.__dict__ = {
+            'tunable': 'tunable',
+            '_fit_executor': 'executor',
+            '_fit_future': 'future',
+            '_metamodel': 'metamodel',
+        }
+
+        # run
+        result = BaseMetaModelTuner.__getstate__(instance)
+
+        # assert
+        assert result == {'tunable': 'tunable'}
+
+
+def test__fit_metamodel():
+    # setup
+    metamodel = MagicMock()
+    trials = np.array([[1], [2]])
+
+    # run
+    result = _fit_metamodel(metamodel, trials, 'scores')
+
+    # assert
+    metamodel._fit.assert_called_once_with(trials, 'scores')
+    assert result == (metamodel, 2)
@@ -5,8 +5,12 @@ from unittest.mock import MagicMock
 
 from sklearn.gaussian_process import GaussianProcessRegressor
 
+from btb.tuning.metamodels.gaussian_process import (
+    IncrementalGaussianProcessMetaModel, SparseGaussianProcessMetaModel)
 from btb.tuning.tunable import Tunable
-from btb.tuning.tuners.gaussian_process import GCPEiTuner, GCPTuner, GPEiTuner, GPTuner
+from btb.tuning.tuners.gaussian_process import (
+    GCPEiTuner, GCPTuner, GPEiTuner, GPTuner, IncrementalGPEiTuner, IncrementalGPTuner,
+    SparseGPEiTuner, SparseGPTuner)
 
 
 class TestGaussianProcessTuner(TestCase):
@@ -117,3 +121,139 @@ class TestGaussianCopulaProcessTuner(TestCase):
         # assert
         assert result == ("GCPTuner(tunable='tunable', maximize=True, num_candidates=1000, "
                           "min_trials=5, length_scale=0.1)")
+
+
+class TestIncrementalGPTuner(TestCase):
+    """Test IncrementalGPTuner class."""
+
+    def test___init__(self):
+        # setup
+        tunable = MagicMock(spec_set=Tunable)
+        # run
+        instance = IncrementalGPTuner(tunable, refit_every=10)
+
+        # assert
+        assert isinstance(instance, IncrementalGaussianProcessMetaModel)
+        assert instance._refit_every == 10
+        assert instance._llh_tolerance is None
+        assert instance._metamodel_kwargs == {
+            'length_scale': 0.1,
+            'refit_every': 10,
+            'llh_tolerance': None
+        }
+
+    def test___repr__(self):
+        # setup
+        tunable = MagicMock(spec_set=Tunable)
+        tunable.__str__.return_value = "'tunable'"
+        instance = IncrementalGPTuner(tunable)
+
+        # run
+        result = instance.__repr__()
+
+        # assert
+        assert result == ("IncrementalGPTuner(tunable='tunable', maximize=True, "
+                          "num_candidates=1000, min_trials=5, length_scale=0.1, "
+                          "refit_every=20, llh_tolerance=None)")
+
+
+class TestIncrementalGPEiTuner(TestCase):
+    """Test IncrementalGPEiTuner class."""
+
+    def test___init__(self):
+        # setup
+        tunable = MagicMock(spec_set=Tunable)
+        # run
+        instance = IncrementalGPEiTuner(tunable, refit_every=10)
+
+        # assert
+        assert isinstance(instance, IncrementalGaussianProcessMetaModel)
+        assert instance._refit_every == 10
+        assert instance._llh_tolerance is None
+        assert instance._metamodel_kwargs == {
+            'length_scale': 0.1,
+            'refit_every': 10,
+            'llh_tolerance': None
+        }
+
+    def test___repr__(self):
+        # setup
+        tunable = MagicMock(spec_set=Tunable)
+        tunable.__str__.return_value = "'tunable'"
+        instance = IncrementalGPEiTuner(tunable)
+
+        # run
+        result = instance.__repr__()
+
+        # assert
+        assert result == ("IncrementalGPEiTuner(tunable='tunable', maximize=True, "
+                          "num_candidates=1000, min_trials=5, length_scale=0.1, "
+                          "refit_every=20, llh_tolerance=None)")
+
+
+class TestSparseGPTuner(TestCase):
+    """Test SparseGPTuner class."""
+
+    def test___init__(self):
+        # setup
+        tunable = MagicMock(spec_set=Tunable)
+        # run
+        instance = SparseGPTuner(tunable, num_inducing=10)
+
+        # assert
+        assert isinstance(instance, SparseGaussianProcessMetaModel)
+        assert instance._num_inducing == 10
+        assert instance._noise == 0.01
+        assert instance._metamodel_kwargs == {
+            'length_scale': 0.1,
+            'num_inducing': 10,
+            'noise': 0.01
+        }
+
+    def test___repr__(self):
+        # setup
+        tunable = MagicMock(spec_set=Tunable)
+        tunable.__str__.return_value = "'tunable'"
+        instance = SparseGPTuner(tunable)
+
+        # run
+        result = instance.__repr__()
+
+        # assert
+        assert result == ("SparseGPTuner(tunable='tunable', maximize=True, "
+                          "num_candidates=1000, min_trials=5, length_scale=0.1, "
+                          "num_inducing=100, noise=0.01)")
+
+
+class TestSparseGPEiTuner(TestCase):
+    """Test SparseGPEiTuner class."""
+
+    def test___init__(self):
+        # setup
+        tunable = MagicMock(spec_set=Tunable)
+        # run
+        instance = SparseGPEiTuner(tunable, num_inducing=10)
+
+        # assert
+        assert isinstance(instance, SparseGaussianProcessMetaModel)
+        assert instance._num_inducing == 10
+        assert instance._noise == 0.01
+        assert instance._metamodel_kwargs == {
+            'length_scale': 0.1,
+            'num_inducing': 10,
+            'noise': 0.01
+        }
+
+    def test___repr__(self):
+        # setup
+        tunable = MagicMock(spec_set=Tunable)
+        tunable.__str__.return_value = "'tunable'"
+        instance = SparseGPEiTuner(tunable)
+
+        # run
+        result = instance.__repr__()
+
+        # assert
+        assert result == ("SparseGPEiTuner(tunable='tunable', maximize=True, "
+                          "num_candidates=1000, min_trials=5, length_scale=0.1, "
+                          "num_inducing=100, noise=0.01)")
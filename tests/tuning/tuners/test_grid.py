@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+import numpy as np
+
+from btb.tuning.hyperparams import (
+    BooleanHyperParam, CategoricalHyperParam, FloatHyperParam, IntHyperParam)
+from btb.tuning.tunable import Tunable
+from btb.tuning.tuners.base import StopTuning
+from btb.tuning.tuners.grid import GridTuner
+
+
+class TestGridTuner(TestCase):
+    """Test GridTuner class."""
+
+    def setUp(self):
+        self.tunable = Tunable({
+            'chp': CategoricalHyperParam(['a', 'b', 'c']),
+            'bhp': BooleanHyperParam(),
+            'ihp': IntHyperParam(min=1, max=4),
+        })
+
+    def test___init__(self):
+        # run
+        instance = GridTuner(self.tunable)
+
+        # assert
+        assert instance.order == 'random'
+        assert instance._position == 0
+        assert instance._half_bits == 3
+        assert len(instance._keys) == 4
+
+    def test___init__space_filling(self):
+        # run
+        instance = GridTuner(self.tunable, order='space_filling')
+
+        # assert
+        assert instance._step == 13
+        assert instance._offset == 0
+
+    def test___init__infinite_cardinality(self):
+        # setup
+        tunable = Tunable({'fhp': FloatHyperParam(min=0, max=1)})
+
+        # run / assert
+        with self.assertRaises(ValueError):
+            GridTuner(tunable)
+
+    def test___init__unknown_order(self):
+        # run / assert
+        with self.assertRaises(ValueError):
+            GridTuner(self.tunable, order='unknown')
+
+    def test__get_coprime(self):
+        # run
+        result = [GridTuner._get_coprime(value, 12) for value in (0, 4, 6, 11)]
+
+        # assert
+        assert result == [1, 5, 5, 11]
+
+    def test_propose_all(self):
+        """Every configuration is proposed once before the tuner stops."""
+        # setup
+        instance = GridTuner(self.tunable)
+
+        # run
+        proposals = instance.propose(10) + instance.propose(14)
+
+        # assert
+        keys = {tuple(sorted(proposal.items())) for proposal in proposals}
+        assert len(keys) == 24
+        instance.record(proposals, [0] * 24)
+        with self.assertRaises(StopTuning):
+            instance.propose(1)
+
+    def test_propose_resume(self):
+        """Recorded and pending configurations are not proposed."""
+        # setup
+        instance = GridTuner(self.tunable)
+        recorded = {'chp': 'a', 'bhp': True, 'ihp': 1}
+        pending = {'chp': 'b', 'bhp': False, 'ihp': 4}
+        instance.record(recorded, 0.5)
+        instance.mark_pending(pending)
+
+        # run
+        proposals = instance.propose(22)
+
+        # assert
+        assert recorded not in proposals
+        assert pending not in proposals
+        assert len({tuple(sorted(proposal.items())) for proposal in proposals}) == 22
+
+    def test_propose_cleared_pending(self):
+        """Pending configurations that are cleared are proposed after the enumeration ends."""
+        # setup
+        instance = GridTuner(self.tunable)
+        pending = instance.propose(24)
+        instance.mark_pending(pending)
+        instance.clear_pending(pending[5])
+
+        # run
+        result = instance.propose(1)
+
+        # assert
+        assert result == pending[5]
+
+    def test__get_rank_random(self):
+        """The random order is a permutation of all the ranks."""
+        # setup
+        tunable = Tunable({'ihp': IntHyperParam(min=0, max=29)})
+        instance = GridTuner(tunable)
+
+        # run
+        ranks = [instance._get_rank(position) for position in range(30)]
+
+        # assert
+        assert sorted(ranks) == list(range(30))
+
+    def test_propose_random_order(self):
+        """The random order is neither the identity nor a stride sweep over the ranks."""
+        # setup
+        tunable = Tunable({
+            'a': IntHyperParam(min=0, max=4),
+            'b': IntHyperParam(min=0, max=4),
+            'c': IntHyperParam(min=0, max=4),
+        })
+
+        strided = 0
+        varied = 0
+        for seed in range(20):
+            np.random.seed(seed)
+            instance = GridTuner(tunable)
+
+            # run
+            ranks = [instance._get_rank(position) for position in range(6)]
+            proposals = instance.propose(4)
+
+            # assert
+            strided += len(set(np.diff(ranks) % 125)) == 1
+            varied += all(len({proposal[name] for proposal in proposals}) > 1 for name in 'abc')
+
+        assert strided == 0
+        assert varied >= 15
+
+    def test_propose_space_filling(self):
+        # setup
+        tunable = Tunable({'ihp': IntHyperParam(min=0, max=9)})
+        instance = GridTuner(tunable, order='space_filling')
+
+        # run
+        result = instance.propose(4)
+
+        # assert
+        assert [proposal['ihp'] for proposal in result] == [0, 7, 4, 1]
+
+    def test_propose_allow_duplicates(self):
+        # setup
+        tunable = Tunable({'ihp': IntHyperParam(min=0, max=4)})
+        instance = GridTuner(tunable)
+
+        # run
+        result = instance.propose(10, allow_duplicates=True)
+
+        # assert
+        values = [proposal['ihp'] for proposal in result]
+        assert sorted(values[:5]) == [0, 1, 2, 3, 4]
+        assert values[5:] == values[:5]
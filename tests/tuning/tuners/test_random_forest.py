@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from sklearn.ensemble import ExtraTreesRegressor, RandomForestRegressor
+
+from btb.tuning.tunable import Tunable
+from btb.tuning.tuners.random_forest import ETEiTuner, ETTuner, RFEiTuner, RFTuner
+
+
+class TestRFTuner(TestCase):
+    """Test RFTuner class."""
+
+    def test___init__(self):
+        # setup
+        tunable = MagicMock(spec_set=Tunable)
+        # run
+        instance = RFTuner(tunable, trees_per_fit=10)
+
+        # assert
+        assert instance._MODEL_CLASS == RandomForestRegressor
+        assert instance._metamodel_kwargs == {'n_estimators': 100, 'trees_per_fit': 10}
+        assert instance._trees_per_fit == 10
+
+    def test___repr__(self):
+        # setup
+        tunable = MagicMock(spec_set=Tunable)
+        tunable.__str__.return_value = "'tunable'"
+        instance = RFTuner(tunable)
+
+        # run
+        result = instance.__repr__()
+
+        # assert
+        assert result == ("RFTuner(tunable='tunable', maximize=True, num_candidates=1000, "
+                          "min_trials=5, n_estimators=100, trees_per_fit=None)")
+
+
+class TestRFEiTuner(TestCase):
+    """Test RFEiTuner class."""
+
+    def test___init__(self):
+        # setup
+        tunable = MagicMock(spec_set=Tunable)
+        # run
+        instance = RFEiTuner(tunable, trees_per_fit=10)
+
+        # assert
+        assert instance._MODEL_CLASS == RandomForestRegressor
+        assert instance._metamodel_kwargs == {'n_estimators': 100, 'trees_per_fit': 10}
+        assert instance._trees_per_fit == 10
+
+    def test___repr__(self):
+        # setup
+        tunable = MagicMock(spec_set=Tunable)
+        tunable.__str__.return_value = "'tunable'"
+        instance = RFEiTuner(tunable)
+
+        # run
+        result = instance.__repr__()
+
+        # assert
+        assert result == ("RFEiTuner(tunable='tunable', maximize=True, num_candidates=1000, "
+                          "min_trials=5, n_estimators=100, trees_per_fit=None)")
+
+
+class TestETTuner(TestCase):
+    """Test ETTuner class."""
+
+    def test___init__(self):
+        # setup
+        tunable = MagicMock(spec_set=Tunable)
+        # run
+        instance = ETTuner(tunable, trees_per_fit=10)
+
+        # assert
+        assert instance._MODEL_CLASS == ExtraTreesRegressor
+        assert instance._metamodel_kwargs == {'n_estimators': 100, 'trees_per_fit': 10}
+        assert instance._trees_per_fit == 10
+
+    def test___repr__(self):
+        # setup
+        tunable = MagicMock(spec_set=Tunable)
+        tunable.__str__.return_value = "'tunable'"
+        instance = ETTuner(tunable)
+
+        # run
+        result = instance.__repr__()
+
+        # assert
+        assert result == ("ETTuner(tunable='tunable', maximize=True, num_candidates=1000, "
+                          "min_trials=5, n_estimators=100, trees_per_fit=None)")
+
+
+class TestETEiTuner(TestCase):
+    """Test ETEiTuner class."""
+
+    def test___init__(self):
+        # setup
+        tunable = MagicMock(spec_set=Tunable)
+        # run
+        instance = ETEiTuner(tunable, trees_per_fit=10)
+
+        # assert
+        assert instance._MODEL_CLASS == ExtraTreesRegressor
+        assert instance._metamodel_kwargs == {'n_estimators': 100, 'trees_per_fit': 10}
+        assert instance._trees_per_fit == 10
+
+    def test___repr__(self):
+        # setup
+        tunable = MagicMock(spec_set=Tunable)
+        tunable.__str__.return_value = "'tunable'"
+        instance = ETEiTuner(tunable)
+
+        # run
+        result = instance.__repr__()
+
+        # assert
+        assert result == ("ETEiTuner(tunable='tunable', maximize=True, num_candidates=1000, "
+                          "min_trials=5, n_estimators=100, trees_per_fit=None)")
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from btb.tuning.hyperparams import (
+    BooleanHyperParam, CategoricalHyperParam, FloatHyperParam, IntHyperParam)
+from btb.tuning.tunable import Tunable
+from btb.tuning.tuners.tpe import TPETuner
+
+
+class TestTPETuner(TestCase):
+    """Test TPETuner class."""
+
+    def setUp(self):
+        self.tunable = Tunable({
+            'chp': CategoricalHyperParam(['a', 'b', 'c']),
+            'bhp': BooleanHyperParam(),
+            'ihp': IntHyperParam(min=1, max=4),
+            'fhp': FloatHyperParam(min=0, max=1),
+        })
+
+    def test___init__(self):
+        # run
+        instance = TPETuner(self.tunable, num_bins=8)
+
+        # assert
+        kinds = [dimension[0] for dimension in instance._dimensions]
+        assert kinds == ['categorical', 'boolean', 'integer', 'binned']
+        assert [dimension[-1] for dimension in instance._dimensions] == [3, 2, 4, 8]
+        assert instance._codes.shape == (4, 0)
+
+    def test___init__prior_weight_not_positive(self):
+        # run / assert
+        with self.assertRaises(ValueError):
+            TPETuner(self.tunable, prior_weight=0)
+
+    def test___init__int_binned(self):
+        # setup
+        tunable = Tunable({'ihp': IntHyperParam(min=1, max=100)})
+
+        # run
+        instance = TPETuner(tunable, num_bins=8)
+
+        # assert
+        assert instance._dimensions[0][0] == 'binned'
+
+    def test__encode(self):
+        # setup
+        instance = TPETuner(self.tunable, num_bins=8)
+        trials = np.array([
+            [0, 1, 0, 1, 0.125, 0.],
+            [0, 0, 1, 0, 0.875, 1.],
+            [1, 0, 0, 0, 0.375, 0.3],
+        ])
+
+        # run
+        result = instance._encode(trials)
+
+        # assert
+        expected = np.array([
+            [1, 2, 0],
+            [1, 0, 0],
+            [0, 3, 1],
+            [0, 7, 2],
+        ])
+        np.testing.assert_array_equal(result, expected)
+
+    def test__decode(self):
+        # setup
+        instance = TPETuner(self.tunable, num_bins=8)
+        codes = np.array([
+            [1, 2],
+            [1, 0],
+            [0, 3],
+            [0, 7],
+        ])
+
+        # run
+        result = instance._decode(codes)
+
+        # assert
+        np.testing.assert_array_equal(result[:, :5], np.array([
+            [0, 1, 0, 1, 0.125],
+            [0, 0, 1, 0, 0.875],
+        ]))
+        assert 0 <= result[0, 5] < 0.125
+        assert 0.875 <= result[1, 5] < 1
+        np.testing.assert_array_equal(instance._encode(result), codes)
+
+    def test__encode_ordinal_categorical(self):
+        # setup
+        tunable = Tunable({'chp': CategoricalHyperParam(['a', 'b', 'c'], encoding='ordinal')})
+        instance = TPETuner(tunable)
+
+        # run
+        codes = instance._encode(np.array([[0.5], [1 / 6], [5 / 6]]))
+        decoded = instance._decode(codes)
+
+        # assert
+        np.testing.assert_array_equal(codes, [[1, 0, 2]])
+        np.testing.assert_allclose(decoded, [[0.5], [1 / 6], [5 / 6]])
+
+    def test__density(self):
+        # setup
+        instance = TPETuner(self.tunable, prior_weight=1)
+
+        # run
+        result = instance._density(np.array([3., 0.]), 3, 'categorical')
+
+        # assert
+        np.testing.assert_allclose(result, [0.875, 0.125])
+
+    def test__density_binned(self):
+        # setup
+        instance = TPETuner(self.tunable)
+        instance.prior_weight = 0    # check the smoothing alone
+
+        # run
+        result = instance._density(np.array([0., 4., 0., 0.]), 4, 'binned')
+
+        # assert
+        np.testing.assert_allclose(result, [0.25, 0.5, 0.25, 0.])
+
+    def test_record(self):
+        # setup
+        instance = TPETuner(self.tunable)
+        trials = [
+            {'chp': 'a', 'bhp': True, 'ihp': 1, 'fhp': 0.5},
+            {'chp': 'a', 'bhp': False, 'ihp': 4, 'fhp': 0.1},
+        ]
+
+        # run
+        instance.record(trials, [0.1, 0.2])
+
+        # assert
+        assert instance._codes.shape == (4, 2)
+        np.testing.assert_array_equal(instance._counts[0], [2, 0, 0])
+        np.testing.assert_array_equal(instance._counts[1], [1, 1])
+        np.testing.assert_array_equal(instance._counts[2], [1, 0, 0, 1])
+
+    def test_record_grow(self):
+        """Test that the codes are kept when the buffer grows past its capacity."""
+        # setup
+        tunable = Tunable({'ihp': IntHyperParam(min=0, max=19)})
+        instance = TPETuner(tunable)
+        instance.record([{'ihp': 0}], [0])
+
+        # run
+        instance.record([{'ihp': value} for value in range(1, 20)], list(range(1, 20)))
+
+        # assert
+        assert instance._code_buffer.shape[1] >= 20
+        np.testing.assert_array_equal(instance._codes, [list(range(20))])
+
+    def test__propose_min_trials(self):
+        # setup
+        instance = MagicMock()
+        instance.scores = np.array([0.1])
+        instance.min_trials = 2
+        instance._sample.return_value = 'sample'
+
+        # run
+        result = TPETuner._propose(instance, 1, False)
+
+        # assert
+        instance._sample.assert_called_once_with(1, False)
+        assert result == 'sample'
+
+    def test__propose_best_density_ratio(self):
+        """The best trials are concentrated in one value, which is proposed."""
+        # setup
+        tunable = Tunable({'chp': CategoricalHyperParam(['a', 'b', 'c', 'd'])})
+        instance = TPETuner(tunable, min_trials=4, gamma=0.5)
+        instance.record(
+            [{'chp': 'a'}, {'chp': 'b'}, {'chp': 'a'}, {'chp': 'b'}],
+            [1, 0, 1, 0]
+        )
+
+        # run
+        result = instance._propose(1, True)
+
+        # assert
+        np.testing.assert_array_equal(result, [[1, 0, 0, 0]])
+
+    def test__propose_not_allow_duplicates(self):
+        """Tried and pending configurations are skipped."""
+        # setup
+        tunable = Tunable({'chp': CategoricalHyperParam(['a', 'b', 'c', 'd'])})
+        instance = TPETuner(tunable, min_trials=2, gamma=0.5)
+        instance.record([{'chp': 'a'}, {'chp': 'b'}], [1, 0])
+        instance.mark_pending({'chp': 'c'})
+
+        # run
+        result = instance._propose(1, False)
+
+        # assert
+        np.testing.assert_array_equal(result, [[0, 0, 0, 1]])
+
+    def test__propose_not_allow_duplicates_fallback(self):
+        """If all the candidates were already tried, the proposals are sampled."""
+        # setup
+        tunable = Tunable({'chp': CategoricalHyperParam(['a', 'b', 'c'])})
+        instance = TPETuner(tunable, min_trials=2, gamma=0.5, num_candidates=1)
+        instance.record([{'chp': 'a'}, {'chp': 'b'}], [1, 0])
+
+        # run
+        result = instance._propose(1, False)
+
+        # assert
+        np.testing.assert_array_equal(result, [[0, 0, 1]])
+
+    def test___repr__(self):
+        # setup
+        tunable = MagicMock(spec_set=Tunable)
+        tunable.names = []
+        tunable.__str__.return_value = "'tunable'"
+        instance = TPETuner(tunable)
+
+        # run
+        result = instance.__repr__()
+
+        # assert
+        assert result == ("TPETuner(tunable='tunable', maximize=True, num_candidates=100, "
+                          "min_trials=10, gamma=0.25, num_bins=32, prior_weight=1.0)")